@@ -10,7 +10,6 @@ import re
 import sys
 from pathlib import Path
 
-from twister2.cmake_filter import expr_parser
 from twister2.cmake_filter.cmakecache import CMakeCache
 
 logger = logging.getLogger(__name__)
@@ -104,6 +103,9 @@ class CMakeFilter:
                     edt = pickle.load(f)
             else:
                 edt = None
+            # parser is generated when module is imported, so it is imported only when used
+            from twister2.cmake_filter import expr_parser
+
             result = expr_parser.parse(self.filter_exp, filter_data, edt)
 
         except (ValueError, SyntaxError) as se:
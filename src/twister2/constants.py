@@ -1,3 +1,14 @@
 from __future__ import annotations
 
+import os
+
 QEMU_FIFO_FILE_NAME: str = 'qemu-fifo'
+#: default directory of result cache
+RESULT_CACHE_DIR: str = os.path.join('~', '.cache', 'twister2', 'results')
+#: user property of test taken from result cache
+RESULT_CACHE_PROPERTY: str = 'result_cache'
+#: default Unix socket of twister server
+SERVER_SOCKET_PATH: str = os.path.join('~', '.cache', 'twister2', 'server.sock')
+SERVER_SOCKET_PATH_ENV: str = 'TWISTER2_SERVER_SOCKET'
+#: cache of toolchain version and repository information shared by sessions
+ENVIRONMENT_CACHE_FILE: str = os.path.join('~', '.cache', 'twister2', 'environment.json')
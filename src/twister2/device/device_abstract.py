@@ -3,6 +3,7 @@ from __future__ import annotations
 import abc
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Generator
 
@@ -22,6 +23,9 @@ class DeviceAbstract(abc.ABC):
         self.twister_config: TwisterConfig = twister_config
         self.handler_log_file: LogFile = NullLogFile.create()
         self.device_log_file: LogFile = NullLogFile.create()
+        self.launcher: str = ''  #: tool used to start application: `west` or `direct`
+        self.startup_time: float | None = None  #: seconds from launching to first output (or flashing)
+        self._launch_time: float = 0.0
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}()'
@@ -55,6 +59,26 @@ class DeviceAbstract(abc.ABC):
         :param timeout: time out in seconds
         """
 
+    def reset(self, timeout: float = 60.0) -> None:
+        """
+        Bring device to a known state before next test reuses it.
+
+        Called only when device is shared by several tests (``--dut-scope=build``).
+        By default application is left running.
+
+        :param timeout: time out in seconds
+        """
+
+    def _mark_launched(self) -> None:
+        """Store moment when application was launched to measure startup time."""
+        self._launch_time = time.time()
+        self.startup_time = None
+
+    def _mark_output_received(self) -> None:
+        """Measure startup time when first output from device was received."""
+        if self.startup_time is None and self._launch_time:
+            self.startup_time = time.time() - self._launch_time
+
     @property
     @abc.abstractmethod
     def iter_stdout(self) -> Generator[str, None, None]:
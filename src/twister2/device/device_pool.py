@@ -0,0 +1,86 @@
+"""
+Reuse of running devices by tests sharing a build directory.
+
+By default, each test flashes (or boots) the application on its own device.
+When several regular pytest tests use the same build, they can share one
+device: the application is flashed once, and the device is only reset
+between tests (``--dut-scope=build``). The pool keeps at most one device,
+so a board lease is never held while the next build waits for it.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from twister2.device.device_abstract import DeviceAbstract
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledDevice:
+    """Device kept running for tests sharing a build directory."""
+    build_dir: str
+    device: DeviceAbstract
+    #: functions called in order of registration when device is released
+    finalizers: dict[str, Callable[[], None]] = field(default_factory=dict, repr=False)
+    tests: int = 1  #: number of tests which used the device
+    test_failed: bool = False  #: True if any test using the device failed
+
+
+class DevicePool:
+    """Keep running device to reuse it by the next test with the same build."""
+
+    def __init__(self) -> None:
+        self._current: PooledDevice | None = None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}()'
+
+    def find(self, build_dir: str | Path) -> PooledDevice | None:
+        """Return device kept for build directory."""
+        if self._current is not None and self._current.build_dir == str(build_dir):
+            return self._current
+        return None
+
+    def acquire(self, build_dir: str | Path) -> PooledDevice | None:
+        """
+        Return device kept for build directory to reuse it.
+
+        Device kept for other build directory is released.
+
+        :param build_dir: build directory
+        :return: pooled device or None if new device has to be created
+        """
+        if (pooled_device := self.find(build_dir)) is not None:
+            pooled_device.tests += 1
+            return pooled_device
+        self.release()
+        return None
+
+    def put(self, build_dir: str | Path, device: DeviceAbstract, finalizer: Callable[[], None]) -> PooledDevice:
+        """
+        Keep device for next tests.
+
+        :param build_dir: build directory
+        :param device: running device
+        :param finalizer: function which stops the device
+        :return: pooled device
+        """
+        self.release()
+        self._current = PooledDevice(build_dir=str(build_dir), device=device, finalizers={'device': finalizer})
+        return self._current
+
+    def release(self) -> None:
+        """Stop kept device and call all its finalizers."""
+        if (pooled_device := self._current) is None:
+            return
+        self._current = None
+        logger.debug('Releasing device for %s used by %d tests', pooled_device.build_dir, pooled_device.tests)
+        for name, finalizer in pooled_device.finalizers.items():
+            try:
+                finalizer()
+            except Exception as e:
+                logger.error('Finalizer "%s" of device for %s failed: %s', name, pooled_device.build_dir, e)
@@ -0,0 +1,263 @@
+"""
+Fast path for running and flashing applications without calling `west`.
+
+`west build -t run` and `west flash` pay west's start-up and manifest
+resolution together with ninja up-to-date check before the simulator or
+flasher even starts. Since the application is already built when device
+adapters are used, the command generated by CMake for `run` target can be
+taken directly from `build.ninja`, and the runner backend used by
+`west flash` can be called directly basing on `zephyr/runners.yaml`.
+
+When needed information can not be found in the build directory, None is
+returned and caller should fall back to `west`.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import shlex
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from twister2.cmake_filter.cmakecache import CMakeCache
+
+logger = logging.getLogger(__name__)
+
+#: exit code returned by bootstrap when runner backend cannot be loaded
+RUNNER_UNAVAILABLE_EXIT_CODE: int = 3
+
+_RUN_TARGET: str = 'run'
+_SHELL_OPERATORS: tuple[str, ...] = ('&&', '||', ';', '|', '>', '<', '&', '>>', '<<')
+
+
+@dataclass
+class DirectCommand:
+    """Command which can be run without `west`."""
+    command: list[str]
+    cwd: str | None = None
+
+
+def _is_ninja_generator(build_dir: Path) -> bool:
+    cmake_cache_file = build_dir / 'CMakeCache.txt'
+    if not cmake_cache_file.is_file():
+        return False
+    cmake_cache = CMakeCache.from_file(cmake_cache_file)
+    return cmake_cache.get('CMAKE_GENERATOR') == 'Ninja'
+
+
+def _split_ninja_outputs(header: str) -> list[str]:
+    """Return outputs from ninja `build` statement."""
+    outputs_part = header[len('build '):]
+    # find first not escaped colon
+    idx = 0
+    while (idx := outputs_part.find(':', idx)) != -1:
+        if idx == 0 or outputs_part[idx - 1] != '$':
+            break
+        idx += 1
+    outputs_part = outputs_part[:idx]
+    outputs_part = outputs_part.replace('$ ', '\0').replace('$:', ':')
+    return [
+        output.replace('\0', ' ')
+        for output in outputs_part.split()
+        if output != '|'
+    ]
+
+
+def _read_run_edges(build_ninja: Path) -> dict[str, dict]:
+    """
+    Read from `build.ninja` only edges related to `run` target.
+
+    :return: dictionary with output as a key and dictionary with edge
+        information (`rule`, `inputs`, `command`) as a value
+    """
+    edges: dict[str, dict] = {}
+    current: dict | None = None
+    with build_ninja.open(encoding='UTF-8') as file:
+        for line in file:
+            if line.startswith('build '):
+                current = None
+                outputs = _split_ninja_outputs(line.rstrip('\n'))
+                names = [os.path.basename(output) for output in outputs]
+                if not any(name == _RUN_TARGET or name.startswith(f'{_RUN_TARGET}_') for name in names):
+                    continue
+                _, _, rest = line.partition(': ')
+                rule, _, inputs = rest.strip().partition(' ')
+                current = dict(
+                    rule=rule,
+                    inputs=[i for i in inputs.replace('||', ' ').replace('|', ' ').split()],
+                    command='',
+                )
+                for output in outputs:
+                    edges[output] = current
+            elif current is not None and line.startswith('  '):
+                key, _, value = line.strip().partition(' = ')
+                if key == 'COMMAND':
+                    current['command'] = value
+            elif not line.startswith(' '):
+                current = None
+    return edges
+
+
+def _collect_run_commands(edges: dict[str, dict]) -> list[str]:
+    """Return all commands which have to be called to run `run` target."""
+    commands: list[str] = []
+    visited: set[str] = set()
+    to_visit: list[str] = [_RUN_TARGET]
+    while to_visit:
+        target = to_visit.pop(0)
+        if target in visited or target not in edges:
+            continue
+        visited.add(target)
+        edge = edges[target]
+        if (command := _strip_noop_commands(edge['command'])) and command not in commands:
+            commands.append(command)
+        to_visit.extend(edge['inputs'])
+    return commands
+
+
+def _strip_noop_commands(command: str) -> str:
+    """Remove `:` and `cd <dir>` - only parts of command."""
+    command = command.strip()
+    if command in ('', ':'):
+        return ''
+    tokens = shlex.split(command)
+    if len(tokens) == 2 and tokens[0] == 'cd':
+        return ''
+    return command
+
+
+def _parse_shell_command(command: str) -> DirectCommand | None:
+    """
+    Convert shell command generated by CMake (e.g. `cd /build && /usr/bin/qemu ...`)
+    to list of arguments. Return None if command is too complex to call it
+    without shell.
+    """
+    lexer = shlex.shlex(command, posix=True, punctuation_chars=True)
+    lexer.whitespace_split = True
+    tokens = list(lexer)
+    cwd: str | None = None
+    if len(tokens) > 3 and tokens[0] == 'cd' and tokens[2] == '&&':
+        cwd = tokens[1]
+        tokens = tokens[3:]
+    if not tokens or any(token in _SHELL_OPERATORS for token in tokens):
+        return None
+    return DirectCommand(command=tokens, cwd=cwd)
+
+
+def get_run_command(build_dir: Path | str) -> DirectCommand | None:
+    """
+    Return command generated by CMake for `run` target.
+
+    :param build_dir: build directory
+    :return: command to run or None if it cannot be run without `west`
+    """
+    build_dir = Path(build_dir)
+    build_ninja = build_dir / 'build.ninja'
+    if not build_ninja.is_file() or not _is_ninja_generator(build_dir):
+        return None
+    try:
+        commands = _collect_run_commands(_read_run_edges(build_ninja))
+        if len(commands) != 1:
+            logger.debug('Cannot use direct run for %s, found %d commands for run target', build_dir, len(commands))
+            return None
+        return _parse_shell_command(commands[0])
+    except ValueError as e:
+        logger.debug('Cannot parse run target from %s: %s', build_ninja, e)
+        return None
+
+
+def read_runners_yaml(build_dir: Path | str) -> dict | None:
+    """Return content of `zephyr/runners.yaml` or None if it does not exist."""
+    runners_yaml = Path(build_dir) / 'zephyr' / 'runners.yaml'
+    if not runners_yaml.is_file():
+        return None
+    with runners_yaml.open(encoding='UTF-8') as file:
+        return yaml.safe_load(file) or None
+
+
+def get_flash_command(
+    build_dir: Path | str,
+    zephyr_base: Path | str,
+    runner: str = '',
+    runner_args: list[str] | None = None
+) -> list[str] | None:
+    """
+    Return command which calls runner backend directly to flash a device.
+
+    :param build_dir: build directory
+    :param zephyr_base: path to Zephyr directory
+    :param runner: runner name, if not provided then default flash runner is used
+    :param runner_args: extra arguments passed to runner
+    :return: flash command or None if it cannot be flashed without `west`
+    """
+    runners_yaml = read_runners_yaml(build_dir)
+    if not runners_yaml:
+        return None
+    runner = runner or runners_yaml.get('flash-runner', '')
+    if not runner or runner not in runners_yaml.get('runners', []):
+        logger.debug('Runner "%s" not available in runners.yaml for %s', runner, build_dir)
+        return None
+    if not (Path(zephyr_base) / 'scripts' / 'west_commands' / 'runners').is_dir():
+        return None
+    return [
+        sys.executable, '-m', __name__,
+        '--zephyr-base', str(zephyr_base),
+        '--build-dir', str(build_dir),
+        '--runner', runner,
+        '--',
+        *(runner_args or []),
+    ]
+
+
+def _run_runner(zephyr_base: str, build_dir: str, runner_name: str, runner_args: list[str]) -> int:
+    """Call runner backend in the same way as `west flash` does."""
+    sys.path.insert(0, os.path.join(zephyr_base, 'scripts', 'west_commands'))
+    try:
+        from runners import get_runner_cls  # type: ignore[import]
+        from runners.core import RunnerConfig  # type: ignore[import]
+    except ImportError as e:
+        logger.error('Cannot import runners from Zephyr: %s', e)
+        return RUNNER_UNAVAILABLE_EXIT_CODE
+
+    runners_yaml = read_runners_yaml(build_dir) or {}
+    yaml_config: dict = runners_yaml.get('config', {})
+    config_kwargs: dict = {}
+    for field_name in RunnerConfig._fields:
+        if field_name == 'build_dir':
+            config_kwargs[field_name] = build_dir
+        else:
+            value = yaml_config.get(field_name)
+            if value and field_name.endswith(('_file', '_dir')) and not os.path.isabs(value):
+                value = os.path.join(build_dir, 'zephyr', value)
+            config_kwargs[field_name] = value
+    runner_config = RunnerConfig(**config_kwargs)
+
+    runner_cls = get_runner_cls(runner_name)
+    parser = argparse.ArgumentParser(prog=runner_name, allow_abbrev=False)
+    runner_cls.add_parser(parser)
+    args = parser.parse_args(runners_yaml.get('args', {}).get(runner_name, []) + runner_args)
+    runner = runner_cls.create(runner_config, args)
+    runner.run('flash')
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Flash device without west.')
+    parser.add_argument('--zephyr-base', required=True)
+    parser.add_argument('--build-dir', required=True)
+    parser.add_argument('--runner', required=True)
+    parser.add_argument('runner_args', nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+    runner_args = args.runner_args
+    if runner_args and runner_args[0] == '--':
+        runner_args = runner_args[1:]
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    return _run_runner(args.zephyr_base, args.build_dir, args.runner, runner_args)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
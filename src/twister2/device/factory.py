@@ -1,30 +1,31 @@
 from __future__ import annotations
 
+import importlib
 import logging
 from typing import Type
 
 from twister2.device.device_abstract import DeviceAbstract
-from twister2.device.hardware_adapter import HardwareAdapter
-from twister2.device.qemu_adapter import QemuAdapter
-from twister2.device.simulator_adapter import (
-    CustomSimulatorAdapter,
-    NativeSimulatorAdapter,
-    UnitSimulatorAdapter,
-)
 from twister2.exceptions import TwisterRunException
 
 logger = logging.getLogger(__name__)
 
 
 class DeviceFactory:
-    _devices: dict[str, Type[DeviceAbstract]] = {}
+    #: device classes, or their import paths ("module:class") when not imported yet
+    _devices: dict[str, Type[DeviceAbstract] | str] = {}
 
     @classmethod
     def discover(cls):
         """Return available devices."""
 
     @classmethod
-    def register_device_class(cls, name: str, klass: Type[DeviceAbstract]):
+    def register_device_class(cls, name: str, klass: Type[DeviceAbstract] | str):
+        """
+        Register device class.
+
+        :param name: device type
+        :param klass: device class or its import path ("module:class"), class is imported on first use
+        """
         if name not in cls._devices:
             cls._devices[name] = klass
 
@@ -32,14 +33,22 @@ class DeviceFactory:
     def get_device(cls, name: str) -> Type[DeviceAbstract]:
         logger.debug('Get device type "%s"', name)
         try:
-            return cls._devices[name]
+            klass = cls._devices[name]
         except KeyError as e:
             logger.error('There is no device with name "%s"', name)
             raise TwisterRunException(f'There is no device with name "{name}"') from e
-
-
-DeviceFactory.register_device_class('custom', CustomSimulatorAdapter)
-DeviceFactory.register_device_class('native', NativeSimulatorAdapter)
-DeviceFactory.register_device_class('unit', UnitSimulatorAdapter)
-DeviceFactory.register_device_class('hardware', HardwareAdapter)
-DeviceFactory.register_device_class('qemu', QemuAdapter)
+        if isinstance(klass, str):
+            module_name, class_name = klass.split(':')
+            device_class: Type[DeviceAbstract] = getattr(importlib.import_module(module_name), class_name)
+            cls._devices[name] = device_class
+            return device_class
+        return klass
+
+
+# adapters are imported when used, so libraries of other devices (e.g. pyserial, psutil) are not loaded
+DeviceFactory.register_device_class('custom', 'twister2.device.simulator_adapter:CustomSimulatorAdapter')
+DeviceFactory.register_device_class('native', 'twister2.device.simulator_adapter:NativeSimulatorAdapter')
+DeviceFactory.register_device_class('unit', 'twister2.device.simulator_adapter:UnitSimulatorAdapter')
+DeviceFactory.register_device_class('hardware', 'twister2.device.hardware_adapter:HardwareAdapter')
+DeviceFactory.register_device_class('qemu', 'twister2.device.qemu_adapter:QemuAdapter')
+DeviceFactory.register_device_class('replay', 'twister2.device.replay_adapter:LogReplayAdapter')
@@ -0,0 +1,77 @@
+"""
+Keep track of images flashed onto boards.
+
+Flashing takes a lot of time, and it is not needed when the board already
+holds the identical image (e.g. on retries or when several tests use the same
+build). For each board the hash of the last flashed image together with flash
+command is stored in the output directory, next to board leases.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+from twister2.device.hardware_map import HardwareMap
+from twister2.device.hardware_pool import LEASE_DIR_NAME, get_board_key
+
+logger = logging.getLogger(__name__)
+
+IMAGE_FILES: tuple[str, ...] = ('zephyr.hex', 'zephyr.bin')
+
+
+def compute_image_hash(
+    build_dir: str | Path, command: list[str], image_files: tuple[str, ...] = IMAGE_FILES
+) -> str:
+    """
+    Return hash of image files and flash command.
+
+    :param build_dir: build directory
+    :param command: flash command
+    :param image_files: names of image files in `zephyr` directory of build
+    :return: hash or empty string if no image was found
+    """
+    hash_object = hashlib.sha256()
+    found_image = False
+    for image_file in image_files:
+        image_path = Path(build_dir) / 'zephyr' / image_file
+        if not image_path.is_file():
+            continue
+        found_image = True
+        hash_object.update(image_file.encode())
+        with image_path.open('rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                hash_object.update(chunk)
+    if not found_image:
+        return ''
+    hash_object.update('\0'.join(command).encode())
+    return hash_object.hexdigest()
+
+
+class FlashedImageRecord:
+    """Store hash of the last image flashed onto a board."""
+
+    def __init__(self, output_dir: str | Path, hardware_map: HardwareMap) -> None:
+        self.filename: Path = Path(output_dir) / LEASE_DIR_NAME / f'{get_board_key(hardware_map)}.flashed.json'
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({str(self.filename)!r})'
+
+    def get(self) -> str:
+        """Return hash of the last flashed image or empty string if unknown."""
+        try:
+            with self.filename.open(encoding='UTF-8') as file:
+                return json.load(file).get('image_hash', '')
+        except (OSError, ValueError):
+            return ''
+
+    def set(self, image_hash: str) -> None:
+        """Save hash of flashed image."""
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+        with self.filename.open('w', encoding='UTF-8') as file:
+            json.dump(dict(image_hash=image_hash), file)
+
+    def clear(self) -> None:
+        """Forget flashed image (e.g. before flashing, which can fail)."""
+        self.filename.unlink(missing_ok=True)
@@ -9,13 +9,20 @@ import pty
 import re
 import shutil
 import subprocess
+import time
 from pathlib import Path
 from typing import Generator
 
 import serial
 
 from twister2.device.device_abstract import DeviceAbstract
+from twister2.device.direct_runner import (
+    RUNNER_UNAVAILABLE_EXIT_CODE,
+    get_flash_command,
+)
+from twister2.device.flashed_image import FlashedImageRecord, compute_image_hash
 from twister2.device.hardware_map import HardwareMap
+from twister2.device.serial_reader import SerialReader
 from twister2.exceptions import TwisterFlashException
 from twister2.helper import log_command
 from twister2.log_files.log_file import DeviceLogFile, HandlerLogFile
@@ -38,6 +45,9 @@ class HardwareAdapter(DeviceAbstract):
         self.hardware_map = hardware_map
         self.connection: serial.Serial | None = None
         self.command: list[str] = []
+        self.fallback_command: list[str] = []  #: west command used when runner backend is not available
+        self.build_dir: Path | str | None = None
+        self.flashing_skipped: bool = False  #: True if board already had the image and was only reset
         self.process_kwargs: dict = {
             'stdout': subprocess.PIPE,
             'stderr': subprocess.STDOUT,
@@ -45,6 +55,8 @@ class HardwareAdapter(DeviceAbstract):
             'env': self.env,
         }
         self.serial_pty_proc: subprocess.Popen | None = None
+        self.serial_reader: SerialReader | None = None
+        self.read_timeout: float = 1  #: time in seconds after which empty line is returned if no data
 
     def connect(self, timeout: float = 1) -> None:
         """
@@ -73,9 +85,17 @@ class HardwareAdapter(DeviceAbstract):
             raise
 
         self.connection.flush()
+        self.serial_reader = SerialReader(self.connection, on_data=self._save_handler_log)
+        self.serial_reader.start()
+
+    def _save_handler_log(self, data: bytes) -> None:
+        self.handler_log_file.handle(data=data)
 
     def disconnect(self) -> None:
         """Close serial connection."""
+        if self.serial_reader:
+            self.serial_reader.stop()
+            self.serial_reader = None
         if self.connection:
             serial_name = self.connection.port
             self.connection.close()
@@ -116,102 +136,213 @@ class HardwareAdapter(DeviceAbstract):
         :param build_dir: build directory
         :return: command to flash
         """
+        self.build_dir = build_dir
+        runner = self.hardware_map.runner or self.twister_config.west_runner
+        runner_options, runner_extra_args = self._get_runner_args(runner)
+
+        self.fallback_command = []
         west = shutil.which('west')
+        if self.twister_config.direct_run and (
+            direct_command := get_flash_command(
+                build_dir, self.twister_config.zephyr_base, runner, runner_options + runner_extra_args
+            )
+        ):
+            self.command = direct_command
+            self.launcher = 'direct'
+            if west is not None:
+                self.fallback_command = self._get_west_command(
+                    west, build_dir, runner, runner_options, runner_extra_args
+                )
+            return
+
         if west is None:
             raise TwisterFlashException('west not found')
+        self.command = self._get_west_command(west, build_dir, runner, runner_options, runner_extra_args)
+        self.launcher = 'west'
 
+    @staticmethod
+    def _get_west_command(
+        west: str, build_dir: Path | str, runner: str, runner_options: list[str], runner_extra_args: list[str]
+    ) -> list[str]:
         command = [
             west,
             'flash',
             '--skip-rebuild',
             '--build-dir', str(build_dir),
         ]
+        if runner:
+            command.extend(['--runner', runner])
+        command.extend(runner_options)
+        if runner_extra_args:
+            command.append('--')
+            command.extend(runner_extra_args)
+        return command
 
-        command_extra_args = []
+    def _get_runner_args(self, runner: str) -> tuple[list[str], list[str]]:
+        """
+        Return arguments for a runner.
+
+        :param runner: runner name
+        :return: tuple with runner options (passed to `west flash` directly)
+            and extra arguments (passed to `west flash` after `--`)
+        """
+        runner_options: list[str] = []
+        runner_extra_args: list[str] = []
         if self.twister_config.west_flash:
-            command_extra_args.extend(self.twister_config.west_flash)
+            runner_extra_args.extend(self.twister_config.west_flash)
 
-        runner = self.hardware_map.runner or self.twister_config.west_runner
         if runner:
-            command.extend(['--runner', runner])
-
             board_id: str = self.hardware_map.probe_id or self.hardware_map.id
             if board_id:
                 if runner == 'pyocd':
-                    command_extra_args.append('--board-id')
-                    command_extra_args.append(board_id)
+                    runner_extra_args.append('--board-id')
+                    runner_extra_args.append(board_id)
                 elif runner == 'nrfjprog':
-                    command_extra_args.append('--dev-id')
-                    command_extra_args.append(board_id)
+                    runner_extra_args.append('--dev-id')
+                    runner_extra_args.append(board_id)
                 elif runner == 'openocd' and self.hardware_map.product == 'STM32 STLink':
-                    command_extra_args.append('--cmd-pre-init')
-                    command_extra_args.append(f'hla_serial {board_id}')
+                    runner_extra_args.append('--cmd-pre-init')
+                    runner_extra_args.append(f'hla_serial {board_id}')
                 elif runner == 'openocd' and self.hardware_map.product == 'STLINK-V3':
-                    command_extra_args.append('--cmd-pre-init')
-                    command_extra_args.append(f'hla_serial {board_id}')
+                    runner_extra_args.append('--cmd-pre-init')
+                    runner_extra_args.append(f'hla_serial {board_id}')
                 elif runner == 'openocd' and self.hardware_map.product == 'EDBG CMSIS-DAP':
-                    command_extra_args.append('--cmd-pre-init')
-                    command_extra_args.append(f'cmsis_dap_serial {board_id}')
+                    runner_extra_args.append('--cmd-pre-init')
+                    runner_extra_args.append(f'cmsis_dap_serial {board_id}')
                 elif runner == 'jlink':
-                    command.append(f'--tool-opt=-SelectEmuBySN {board_id}')
+                    runner_options.append(f'--tool-opt=-SelectEmuBySN {board_id}')
                 elif runner == 'stm32cubeprogrammer':
-                    command.append(f'--tool-opt=sn={board_id}')
-
-        if command_extra_args:
-            command.append('--')
-            command.extend(command_extra_args)
-        self.command = command
+                    runner_options.append(f'--tool-opt=sn={board_id}')
+        return runner_options, runner_extra_args
 
     def flash_and_run(self, timeout: float = 60.0) -> None:
         if not self.command:
             msg = 'Flash command is empty, please verify if it was generated properly.'
             logger.error(msg)
             raise TwisterFlashException(msg)
+        self.flashing_skipped = False
+        flashed_image_record = FlashedImageRecord(self.twister_config.output_dir, self.hardware_map)
+        image_hash = compute_image_hash(self.build_dir, self.command) if self.build_dir else ''
+        if image_hash and not self.twister_config.force_flash and flashed_image_record.get() == image_hash:
+            self._mark_launched()
+            if self._reset(timeout):
+                self._mark_output_received()
+                self.flashing_skipped = True
+                logger.info('Device %s already holds the image, flashing skipped', self.hardware_map.id)
+                return
+        flashed_image_record.clear()
+
         if self.hardware_map.id:
             logger.info('Flashing device %s', self.hardware_map.id)
-        log_command(logger, 'Flashing command', self.command, level=logging.INFO)
+        self._mark_launched()
+        returncode, stderr = self._flash(self.command, timeout)
+        if returncode == RUNNER_UNAVAILABLE_EXIT_CODE and self.fallback_command:
+            logger.warning('Runner backend not available, falling back to west')
+            self.launcher = 'west'
+            self._mark_launched()
+            returncode, stderr = self._flash(self.fallback_command, timeout)
+        if returncode == 0:
+            self._mark_output_received()
+            logger.info('Flashing finished')
+            if image_hash:
+                flashed_image_record.set(image_hash)
+        else:
+            if stderr:
+                self.device_log_file.handle(data=stderr)
+            raise TwisterFlashException(f'Could not flash device {self.hardware_map.id}')
+
+    def reset(self, timeout: float = 60.0) -> None:
+        """Reset the board, flash it again when reset is not supported by runner."""
+        if self.serial_reader:
+            self.serial_reader.clear()
+        self._mark_launched()
+        if self._reset(timeout):
+            self._mark_output_received()
+            return
+        self.flash_and_run(timeout)
+
+    def _get_reset_command(self) -> list[str]:
+        """Return command which resets the board using runner tool or empty list if not supported."""
+        runner = self.hardware_map.runner or self.twister_config.west_runner
+        board_id: str = self.hardware_map.probe_id or self.hardware_map.id
+        if runner == 'nrfjprog' and (nrfjprog := shutil.which('nrfjprog')):
+            return [nrfjprog, '--reset'] + (['--snr', board_id] if board_id else [])
+        if runner == 'pyocd' and (pyocd := shutil.which('pyocd')):
+            return [pyocd, 'reset'] + (['-u', board_id] if board_id else [])
+        return []
+
+    def _reset(self, timeout: float) -> bool:
+        """Reset the board, return True if it was successful."""
+        if not (command := self._get_reset_command()):
+            logger.debug('Reset not supported for runner of %s', self.hardware_map.id)
+            return False
+        log_command(logger, 'Reset command', command, level=logging.INFO)
+        try:
+            process = subprocess.run(command, timeout=timeout, **self.process_kwargs)
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.warning('Reset of device %s failed: %s', self.hardware_map.id, e)
+            return False
+        if process.returncode != 0:
+            logger.warning('Reset of device %s failed: %s', self.hardware_map.id, process.stdout)
+            return False
+        return True
+
+    def _flash(self, command: list[str], timeout: float) -> tuple[int | None, bytes | None]:
+        log_command(logger, 'Flashing command', command, level=logging.INFO)
         try:
             process = subprocess.Popen(
-                self.command,
+                command,
                 **self.process_kwargs
             )
         except subprocess.CalledProcessError:
             logger.error('Error while flashing device %s', self.hardware_map.id)
             raise TwisterFlashException(f'Could not flash device {self.hardware_map.id}')
+        stderr: bytes | None = None
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
         else:
-            try:
-                stdout, stderr = process.communicate(timeout=timeout)
-            except subprocess.TimeoutExpired:
-                process.kill()
-            else:
-                for line in stdout.decode('utf-8').split('\n'):
-                    if line:
-                        logger.info(line)
-            if process.returncode == 0:
-                logger.info('Flashing finished')
-            else:
-                if stderr:
-                    self.device_log_file.handle(data=stderr)
-                raise TwisterFlashException(f'Could not flash device {self.hardware_map.id}')
-
-    def save_serial_output_to_file(self, filename: str | Path) -> None:
-        """Dump serial output to file."""
+            for line in stdout.decode('utf-8').split('\n'):
+                if line:
+                    logger.info(line)
+        return process.returncode, stderr
+
+    def save_serial_output_to_file(self, filename: str | Path, timeout: float = 60.0) -> None:
+        """
+        Dump serial output to file.
+
+        :param filename: path to output file
+        :param timeout: time in seconds after which saving stops (device keeps sending output)
+        """
+        if not self.connection or not (serial_reader := self.serial_reader):
+            return
+        end_time = time.time() + timeout
         with open(filename, 'w', encoding='UTF-8') as file:
-            while self.connection:
-                line = self.connection.readline()
-                file.write(line.decode('utf-8'))
+            while (remaining := end_time - time.time()) > 0:
+                # lines are taken from reader, so silence of device is not saved as empty lines
+                line = serial_reader.get_line(timeout=min(self.read_timeout, remaining))
+                if line is None:
+                    if serial_reader.finished:
+                        break
+                    continue
+                file.write(line.data.decode('UTF-8', errors='replace').strip() + '\n')
 
     @property
     def iter_stdout(self) -> Generator[str, None, None]:
         """Return output from serial."""
-        if not self.connection:
+        if not self.connection or not (serial_reader := self.serial_reader):
             return
         logger.debug('Start listening on serial port %s', self.hardware_map.serial)
-        self.connection.flush()
-        while self.connection and self.connection.is_open:
-            stream = self.connection.readline()
-            self.handler_log_file.handle(data=stream)
-            yield stream.decode('UTF-8').strip()
+        while True:
+            line = serial_reader.get_line(timeout=self.read_timeout)
+            if line is None:
+                if serial_reader.finished:
+                    break
+                # let the parser verify its timeout when device is silent
+                yield ''
+                continue
+            yield line.data.decode('UTF-8', errors='replace').strip()
 
     def initialize_log_files(self, build_dir: str | Path) -> None:
         self.handler_log_file = HandlerLogFile.create(build_dir=build_dir)
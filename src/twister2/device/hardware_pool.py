@@ -0,0 +1,186 @@
+"""
+Lease based sharing of hardware boards between tests.
+
+Several boards of the same platform can be listed in the hardware map.
+To use all of them, each test takes an exclusive lease on one available
+board matching its platform and required fixture. Leases are kept as lock
+files in the output directory, so they are respected by all xdist workers,
+and they are automatically released when a worker process dies.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from filelock import BaseFileLock, FileLock, Timeout
+
+from twister2.device.hardware_map import HardwareMap
+from twister2.exceptions import TwisterConfigurationException, TwisterRunException
+
+logger = logging.getLogger(__name__)
+
+LEASE_DIR_NAME: str = 'hardware_leases'
+USAGE_FILE_NAME: str = 'hardware_usage.jsonl'
+
+
+def get_board_key(hardware_map: HardwareMap) -> str:
+    """Return unique name of a board which can be used as a file name."""
+    key = hardware_map.id or hardware_map.serial or hardware_map.serial_pty or hardware_map.platform
+    return re.sub(r'[^\w.-]', '_', key)
+
+
+@dataclass
+class HardwareLease:
+    """Exclusive lease of a board."""
+    hardware_map: HardwareMap
+    lock: BaseFileLock = field(repr=False)
+    start_time: float = field(default_factory=time.time)
+
+
+@dataclass
+class BoardUsage:
+    """Usage statistics for a single board."""
+    board: str
+    platform: str
+    tests: int = 0
+    busy_time: float = 0.0  #: time in seconds when board was leased
+
+
+class HardwareLeaseManager:
+    """Hand out boards from hardware map to tests."""
+
+    def __init__(self, hardware_map_list: list[HardwareMap], output_dir: str | Path, poll_interval: float = 1) -> None:
+        """
+        :param hardware_map_list: list of all boards from hardware map
+        :param output_dir: output directory shared by all workers
+        :param poll_interval: time in seconds between attempts of taking a lease
+        """
+        self.hardware_map_list = hardware_map_list
+        self.lease_dir: Path = Path(output_dir) / LEASE_DIR_NAME
+        self.usage_file: Path = Path(output_dir) / USAGE_FILE_NAME
+        self.poll_interval = poll_interval
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}()'
+
+    def get_candidates(self, platform: str, fixture: str = '') -> list[HardwareMap]:
+        """
+        Return connected boards matching platform and fixture.
+
+        :param platform: platform name
+        :param fixture: fixture required by test
+        :return: list of hardware maps
+        """
+        return [
+            hardware for hardware in self.hardware_map_list
+            if hardware.platform == platform
+            if hardware.connected is True
+            if not fixture or fixture in hardware.fixtures
+        ]
+
+    def acquire(self, platform: str, fixture: str = '', timeout: float = 600) -> HardwareLease:
+        """
+        Take exclusive lease on the first available board.
+
+        :param platform: platform name
+        :param fixture: fixture required by test
+        :param timeout: time in seconds to wait for available board
+        :return: lease
+        """
+        candidates = self.get_candidates(platform, fixture)
+        if not candidates:
+            msg = f'There is no connected hardware for platform {platform}'
+            if fixture:
+                msg += f' with fixture {fixture}'
+            logger.error(msg)
+            raise TwisterConfigurationException(msg)
+
+        self.lease_dir.mkdir(parents=True, exist_ok=True)
+        end_time = time.time() + timeout
+        while True:
+            for hardware in candidates:
+                lock = FileLock(self.lease_dir / f'{get_board_key(hardware)}.lock', timeout=0)
+                try:
+                    lock.acquire()
+                except Timeout:
+                    continue
+                logger.info('Leased board %s for platform %s', get_board_key(hardware), platform)
+                return HardwareLease(hardware_map=hardware, lock=lock)
+            if time.time() > end_time:
+                msg = f'Timed out waiting for available hardware for platform {platform}'
+                logger.error(msg)
+                raise TwisterRunException(msg)
+            time.sleep(self.poll_interval)
+
+    def release(self, lease: HardwareLease, nodeid: str = '') -> None:
+        """
+        Return board to the pool and save its usage.
+
+        :param lease: lease to release
+        :param nodeid: test which used the board
+        """
+        end_time = time.time()
+        record = dict(
+            board=get_board_key(lease.hardware_map),
+            platform=lease.hardware_map.platform,
+            nodeid=nodeid,
+            start=lease.start_time,
+            end=end_time,
+        )
+        with FileLock(str(self.usage_file) + '.lock'):
+            with self.usage_file.open('a', encoding='UTF-8') as file:
+                file.write(json.dumps(record) + '\n')
+        lease.lock.release()
+        logger.info('Released board %s', record['board'])
+
+    @staticmethod
+    def read_usage(output_dir: str | Path, since: float = 0.0) -> list[BoardUsage]:
+        """
+        Return usage statistics of boards.
+
+        :param output_dir: output directory
+        :param since: skip leases started before this time
+        :return: list of board usages
+        """
+        usage_file = Path(output_dir) / USAGE_FILE_NAME
+        if not usage_file.is_file():
+            return []
+        usages: dict[str, BoardUsage] = {}
+        with usage_file.open(encoding='UTF-8') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record['start'] < since:
+                    continue
+                usage = usages.setdefault(record['board'], BoardUsage(record['board'], record['platform']))
+                usage.tests += 1
+                usage.busy_time += record['end'] - record['start']
+        return list(usages.values())
+
+
+class HardwareUsagePlugin:
+    """Print utilization of boards at the end of session."""
+
+    def __init__(self, output_dir: str | Path) -> None:
+        self.output_dir = output_dir
+        self.session_start_time: float = time.time()
+
+    def pytest_sessionstart(self, session) -> None:
+        self.session_start_time = time.time()
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        usages = HardwareLeaseManager.read_usage(self.output_dir, since=self.session_start_time)
+        if not usages:
+            return
+        session_duration = max(time.time() - self.session_start_time, 1e-6)
+        terminalreporter.write_sep('-', 'Hardware utilization')
+        for usage in sorted(usages, key=lambda u: (u.platform, u.board)):
+            terminalreporter.write_line(
+                f'{usage.platform} {usage.board}: {usage.tests} tests, busy {usage.busy_time:.1f} s '
+                f'({100 * usage.busy_time / session_duration:.0f}%)'
+            )
@@ -0,0 +1,233 @@
+"""
+Admission control of simulators running on the host.
+
+Each xdist worker starts its own QEMU or native simulator, so with many
+workers the host can run out of memory, or simulators get so little CPU time
+that tests fail on timeouts. Before a simulator is started, the test reserves
+its expected cost (RAM and CPUs) from a budget shared by all workers, and
+waits when the budget is exhausted. Reservations are kept in a file in the
+output directory and reservations of dead processes are dropped. Time spent
+waiting for admission is saved, so the budget and costs can be tuned.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import psutil
+from filelock import FileLock
+
+from twister2.exceptions import TwisterRunException
+from twister2.platform_specification import PlatformSpecification
+
+logger = logging.getLogger(__name__)
+
+RESERVATIONS_FILE_NAME: str = 'host_resources.json'
+USAGE_FILE_NAME: str = 'host_resources_usage.jsonl'
+
+#: memory in megabytes used by simulator process regardless of RAM of simulated board
+INSTANCE_RAM_OVERHEAD: float = 64.0
+#: part of host memory used by default as budget for simulators
+DEFAULT_RAM_BUDGET_RATIO: float = 0.8
+
+
+@dataclass
+class ResourceCost:
+    """Host resources needed by one running simulator."""
+    ram: float = INSTANCE_RAM_OVERHEAD  #: in megabytes
+    cpus: float = 1.0
+
+
+def get_platform_cost(platform: PlatformSpecification, ram_factor: float = 2.0, cpus: float = 1.0) -> ResourceCost:
+    """
+    Return expected cost of running simulator of the platform.
+
+    :param platform: platform specification
+    :param ram_factor: host memory used for each kilobyte of board RAM (`ram` in board yaml)
+    :param cpus: number of CPUs used by simulator
+    :return: resource cost
+    """
+    return ResourceCost(ram=INSTANCE_RAM_OVERHEAD + platform.ram * ram_factor / 1024, cpus=cpus)
+
+
+@dataclass
+class Admission:
+    """Resources reserved for one simulator."""
+    key: str
+    platform: str
+    cost: ResourceCost
+    blocked_time: float = 0.0  #: time in seconds spent waiting for admission
+    start_time: float = field(default_factory=time.time)
+
+
+@dataclass
+class PlatformAdmissionUsage:
+    """Admission statistics for a single platform."""
+    platform: str
+    instances: int = 0
+    blocked_instances: int = 0
+    blocked_time: float = 0.0
+    max_blocked_time: float = 0.0
+
+
+class HostResourceManager:
+    """Admit simulators to run while they fit in the host budget shared by all workers."""
+
+    def __init__(
+        self, output_dir: str | Path, ram_budget: float = 0, cpu_budget: float = 0, poll_interval: float = 0.5
+    ) -> None:
+        """
+        :param output_dir: output directory shared by all workers
+        :param ram_budget: memory in megabytes for all simulators, 80% of host memory by default
+        :param cpu_budget: number of CPUs for all simulators, all CPUs of host by default
+        :param poll_interval: time in seconds between attempts of admission
+        """
+        self.ram_budget: float = ram_budget or psutil.virtual_memory().total / 2 ** 20 * DEFAULT_RAM_BUDGET_RATIO
+        self.cpu_budget: float = cpu_budget or float(os.cpu_count() or 1)
+        self.reservations_file: Path = Path(output_dir) / RESERVATIONS_FILE_NAME
+        self.usage_file: Path = Path(output_dir) / USAGE_FILE_NAME
+        self.poll_interval = poll_interval
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(ram_budget={self.ram_budget:.0f}, cpu_budget={self.cpu_budget:g})'
+
+    def acquire(self, platform: str, cost: ResourceCost, timeout: float = 600) -> Admission:
+        """
+        Wait until simulator fits in the budget and reserve its resources.
+
+        Simulator is always admitted when nothing else is running, even if it
+        is more expensive than the whole budget.
+
+        :param platform: platform name
+        :param cost: resources needed by simulator
+        :param timeout: time in seconds to wait for admission
+        :return: admission
+        """
+        self.reservations_file.parent.mkdir(parents=True, exist_ok=True)
+        key = f'{os.getpid()}-{uuid.uuid4().hex}'
+        request_time = time.time()
+        end_time = request_time + timeout
+        blocked: bool = False
+        while True:
+            if self._try_reserve(key, cost):
+                blocked_time = time.time() - request_time if blocked else 0.0
+                if blocked:
+                    logger.info('Simulator for platform %s was admitted after %.1f s', platform, blocked_time)
+                return Admission(key=key, platform=platform, cost=cost, blocked_time=blocked_time)
+            blocked = True
+            if time.time() > end_time:
+                msg = f'Timed out waiting for host resources to run simulator for platform {platform}'
+                logger.error(msg)
+                raise TwisterRunException(msg)
+            time.sleep(self.poll_interval)
+
+    def release(self, admission: Admission, nodeid: str = '') -> None:
+        """
+        Return resources to the budget and save admission statistics.
+
+        :param admission: admission to release
+        :param nodeid: test which run simulator
+        """
+        record = dict(
+            platform=admission.platform,
+            nodeid=nodeid,
+            ram=admission.cost.ram,
+            cpus=admission.cost.cpus,
+            blocked=admission.blocked_time,
+            start=admission.start_time,
+            end=time.time(),
+        )
+        with self._lock():
+            reservations = self._read_reservations()
+            reservations.pop(admission.key, None)
+            self._write_reservations(reservations)
+            with self.usage_file.open('a', encoding='UTF-8') as file:
+                file.write(json.dumps(record) + '\n')
+
+    def _try_reserve(self, key: str, cost: ResourceCost) -> bool:
+        with self._lock():
+            reservations = self._read_reservations()
+            used_ram = sum(reservation['ram'] for reservation in reservations.values())
+            used_cpus = sum(reservation['cpus'] for reservation in reservations.values())
+            if reservations and (
+                used_ram + cost.ram > self.ram_budget
+                or used_cpus + cost.cpus > self.cpu_budget
+                # memory can be also used by processes not counted in reservations (e.g. builds)
+                or psutil.virtual_memory().available / 2 ** 20 < cost.ram
+            ):
+                return False
+            reservations[key] = dict(pid=os.getpid(), ram=cost.ram, cpus=cost.cpus)
+            self._write_reservations(reservations)
+            return True
+
+    def _lock(self) -> FileLock:
+        return FileLock(str(self.reservations_file) + '.lock')
+
+    def _read_reservations(self) -> dict[str, dict]:
+        """Return reservations of running processes."""
+        try:
+            with self.reservations_file.open(encoding='UTF-8') as file:
+                reservations: dict[str, dict] = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        # worker killed without releasing its reservations must not block others
+        return {key: value for key, value in reservations.items() if psutil.pid_exists(value['pid'])}
+
+    def _write_reservations(self, reservations: dict[str, dict]) -> None:
+        with self.reservations_file.open('w', encoding='UTF-8') as file:
+            json.dump(reservations, file)
+
+    @staticmethod
+    def read_usage(output_dir: str | Path, since: float = 0.0) -> list[PlatformAdmissionUsage]:
+        """
+        Return admission statistics of platforms.
+
+        :param output_dir: output directory
+        :param since: skip simulators started before this time
+        :return: list of platform usages
+        """
+        usage_file = Path(output_dir) / USAGE_FILE_NAME
+        if not usage_file.is_file():
+            return []
+        usages: dict[str, PlatformAdmissionUsage] = {}
+        with usage_file.open(encoding='UTF-8') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record['start'] < since:
+                    continue
+                usage = usages.setdefault(record['platform'], PlatformAdmissionUsage(record['platform']))
+                usage.instances += 1
+                if record['blocked'] > 0:
+                    usage.blocked_instances += 1
+                usage.blocked_time += record['blocked']
+                usage.max_blocked_time = max(usage.max_blocked_time, record['blocked'])
+        return list(usages.values())
+
+
+class HostResourceUsagePlugin:
+    """Print time spent by simulators waiting for host resources at the end of session."""
+
+    def __init__(self, output_dir: str | Path) -> None:
+        self.output_dir = output_dir
+        self.session_start_time: float = time.time()
+
+    def pytest_sessionstart(self, session) -> None:
+        self.session_start_time = time.time()
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        usages = HostResourceManager.read_usage(self.output_dir, since=self.session_start_time)
+        if not usages:
+            return
+        terminalreporter.write_sep('-', 'Simulators waiting for host resources')
+        for usage in sorted(usages, key=lambda u: u.platform):
+            terminalreporter.write_line(
+                f'{usage.platform}: {usage.instances} runs, {usage.blocked_instances} waited, '
+                f'total {usage.blocked_time:.1f} s, max {usage.max_blocked_time:.1f} s'
+            )
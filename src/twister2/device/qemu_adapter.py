@@ -16,6 +16,7 @@ import psutil
 
 from twister2.constants import QEMU_FIFO_FILE_NAME
 from twister2.device.device_abstract import DeviceAbstract
+from twister2.device.direct_runner import get_run_command
 from twister2.device.fifo_handler import FifoHandler
 from twister2.exceptions import TwisterException, TwisterRunException
 from twister2.helper import log_command
@@ -38,8 +39,12 @@ class QemuAdapter(DeviceAbstract):
         self._emulation_was_finished: bool = False
         self.connection = FifoHandler(Path(build_dir).joinpath(QEMU_FIFO_FILE_NAME))
         self.command: list[str] = []
+        self.cwd: str | None = None  #: working directory for running command
         self.timeout: float = 60  # running timeout in seconds
         self.booting_timeout_in_ms: int = 10_000  #: wait time for booting Qemu in milliseconds
+        self.read_timeout: float = 1  #: time in seconds after which empty line is returned if no data
+        self._stdout_queue: queue.Queue = queue.Queue()
+        self._read_thread: threading.Thread | None = None
 
     def generate_command(self, build_dir: Path | str) -> None:
         """
@@ -48,11 +53,16 @@ class QemuAdapter(DeviceAbstract):
         :param build_dir: build directory
         :return: command to run
         """
-        if (west := shutil.which('west')) is None:
+        if self.twister_config.direct_run and (direct_command := get_run_command(build_dir)):
+            self.command = direct_command.command
+            self.cwd = direct_command.cwd
+            self.launcher = 'direct'
+        elif (west := shutil.which('west')) is None:
             logger.error('west not found')
             self.command = []
         else:
             self.command = [west, 'build', '-d', str(build_dir), '-t', 'run']
+            self.launcher = 'west'
 
     def connect(self, timeout: float = 1) -> None:
         logger.debug('Opening connection')
@@ -65,6 +75,7 @@ class QemuAdapter(DeviceAbstract):
             logger.error(msg)
             raise TwisterRunException(msg)
 
+        self._mark_launched()
         self._thread = threading.Thread(target=self._run_command, args=(self.timeout,), daemon=True)
         self._thread.start()
         # Give a time to start subprocess before test is executed
@@ -81,7 +92,8 @@ class QemuAdapter(DeviceAbstract):
                 self.command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                env=self.env
+                env=self.env,
+                cwd=self.cwd
             )
             stdout, stderr = self._process.communicate(timeout=timeout)
             return_code: int = self._process.returncode
@@ -114,6 +126,22 @@ class QemuAdapter(DeviceAbstract):
     def disconnect(self):
         logger.debug('Closing connection')
         self.connection.disconnect()
+        # reading thread ends by itself when fifo is closed, new one is started after reconnection
+        self._read_thread = None
+
+    def reset(self, timeout: float = 60.0) -> None:
+        """Start simulation again, so the next test starts with application in initial state."""
+        if not self._emulation_was_finished:
+            logger.info('Restarting simulation')
+            self.stop()
+        else:
+            logger.info('Simulation has finished, starting it again')
+        self.disconnect()
+        self._emulation_was_finished = False
+        self._process_ended_with_timeout = False
+        self._exc = None
+        self.connect()
+        self.flash_and_run(timeout)
 
     def stop(self) -> None:
         """Stop device."""
@@ -147,17 +175,13 @@ class QemuAdapter(DeviceAbstract):
             logger.error(msg)
             raise TwisterException(msg)
 
-    @property
-    def iter_stdout(self) -> Generator[str, None, None]:
-        if not self.connection:
+    def _start_reading(self) -> None:
+        """Start reading from fifo file in a separate thread, which is kept as long as the fifo is open."""
+        if self._read_thread is not None and self._read_thread.is_alive():
             return
-        # fifo file can be not create yet, so we need to wait for a while
-        self._wait_for_fifo()
-
-        # create unblocking reading from fifo file
-        q: queue.Queue = queue.Queue()
+        self._stdout_queue = queue.Queue()
 
-        def read_lines():
+        def read_lines(q: queue.Queue):
             while self.connection and self.connection.is_open:
                 try:
                     line = self.connection.readline().decode('UTF-8').strip()
@@ -167,25 +191,40 @@ class QemuAdapter(DeviceAbstract):
                 if len(line) != 0:
                     q.put(line)
 
-        t = threading.Thread(target=read_lines, daemon=True)
-        t.start()
+        self._read_thread = threading.Thread(target=read_lines, args=(self._stdout_queue,), daemon=True)
+        self._read_thread.start()
+
+    @property
+    def iter_stdout(self) -> Generator[str, None, None]:
+        if not self.connection:
+            return
+        # fifo file can be not create yet, so we need to wait for a while
+        self._wait_for_fifo()
+
+        # create unblocking reading from fifo file, reading thread is shared
+        # by consecutive iterators when device is reused by several tests
+        self._start_reading()
 
         end_time = time.time() + self.timeout
+        last_yield_time = time.time()
         try:
             while True:
                 try:
-                    stream = q.get(timeout=0.1)
+                    stream = self._stdout_queue.get(timeout=0.1)
+                    self._mark_output_received()
                     self.handler_log_file.handle(data=stream + '\n')
+                    last_yield_time = time.time()
                     yield stream
                 except queue.Empty:  # timeout appeared
-                    pass
+                    if time.time() - last_yield_time > self.read_timeout:
+                        # let the parser verify its timeouts when device is silent
+                        last_yield_time = time.time()
+                        yield ''
                 if time.time() > end_time:
                     break
         except KeyboardInterrupt:
             # let thread to finish smoothly
             pass
-        finally:
-            t.join(1)
 
     def initialize_log_files(self, build_dir: str | Path):
         self.handler_log_file = HandlerLogFile.create(build_dir=build_dir)
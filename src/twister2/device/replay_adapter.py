@@ -0,0 +1,58 @@
+"""
+Adapter which replays device output saved by a previous run.
+
+Output of each device is stored in `handler.log` in build directory. Feeding
+it again into log parser allows to evaluate changed harness configuration or
+parser logic without building and running tests on devices (`--replay-logs`).
+"""
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Generator
+
+from twister2.device.device_abstract import DeviceAbstract
+from twister2.exceptions import TwisterRunException
+from twister2.log_files.log_file import HandlerLogFile
+from twister2.twister_config import TwisterConfig
+
+logger = logging.getLogger(__name__)
+
+
+def get_replay_log_file(build_dir: str | Path) -> Path:
+    """Return path to file with device output saved in build directory."""
+    return Path(HandlerLogFile.get_log_filename(build_dir=build_dir, name=HandlerLogFile.name))
+
+
+class LogReplayAdapter(DeviceAbstract):
+    """Adapter reading device output from `handler.log`."""
+
+    def __init__(self, twister_config: TwisterConfig, build_dir: str | Path, **kwargs) -> None:
+        super().__init__(twister_config, **kwargs)
+        self.log_file: Path = get_replay_log_file(build_dir)
+
+    def connect(self, timeout: float = 1) -> None:
+        pass  # pragma: no cover
+
+    def disconnect(self) -> None:
+        pass  # pragma: no cover
+
+    def generate_command(self, build_dir: Path | str) -> None:
+        self.log_file = get_replay_log_file(build_dir)
+
+    def flash_and_run(self, timeout: float = 60.0) -> None:
+        if not self.log_file.is_file():
+            msg = f'Log file to replay {self.log_file} does not exist'
+            logger.error(msg)
+            raise TwisterRunException(msg)
+        logger.info('Replaying output from %s', self.log_file)
+
+    @property
+    def iter_stdout(self) -> Generator[str, None, None]:
+        """Return lines from log file."""
+        with self.log_file.open(encoding='UTF-8', errors='replace') as file:
+            for line in file:
+                yield line.strip()
+
+    def initialize_log_files(self, build_dir: str | Path) -> None:
+        """Do not create log files, `handler.log` is an input of replay."""
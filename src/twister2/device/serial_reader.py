@@ -0,0 +1,158 @@
+"""
+Bulk reader for serial connection.
+
+Reading serial port line by line with `readline()` is CPU-heavy for chatty
+tests at high baud rates and can drop data on slower hosts. `SerialReader`
+drains all waiting bytes from the port in a separate thread, splits them into
+lines and keeps them in a bounded buffer, so the parser can consume lines
+without blocking on the port. When the buffer is full, reading waits until
+the parser consumes lines (data waits in the buffer of serial driver).
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class _Connection(Protocol):
+    @property
+    def in_waiting(self) -> int:
+        ...
+
+    def read(self, size: int = 1) -> bytes:
+        ...
+
+
+@dataclass
+class SerialLine:
+    """Single line read from serial port."""
+    timestamp: float  #: time when data with this line was received
+    data: bytes
+
+
+class SerialReader:
+    """Read data from serial connection in bulk and split it into lines."""
+
+    def __init__(
+        self,
+        connection: _Connection,
+        on_data: Callable[[bytes], None] | None = None,
+        max_lines: int = 100_000,
+    ) -> None:
+        """
+        :param connection: opened serial connection
+        :param on_data: callback called with each block of complete lines (e.g. to save them in log file)
+        :param max_lines: maximum number of lines kept in buffer, reading is paused when it is full
+        """
+        self._connection = connection
+        self._on_data = on_data
+        self._max_lines = max_lines
+        self._lines: Deque[SerialLine] = deque()
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._partial: bytearray = bytearray()
+        self.dropped_lines: int = 0
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}()'
+
+    def start(self) -> None:
+        """Start reading in a separate thread."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1) -> None:
+        """Stop reading thread."""
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        if self.dropped_lines:
+            logger.warning('Dropped %d lines read from serial, they were not consumed before reading stopped',
+                           self.dropped_lines)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def finished(self) -> bool:
+        """Return True if reading has finished and all lines were consumed."""
+        return not self.is_running and not self._lines
+
+    def get_line(self, timeout: float = 1) -> SerialLine | None:
+        """
+        Return the oldest line from the buffer.
+
+        :param timeout: time to wait for a new line in seconds
+        :return: line or None if no line appeared within timeout
+        """
+        with self._condition:
+            if not self._lines and not self.finished:
+                self._condition.wait(timeout)
+            if self._lines:
+                line = self._lines.popleft()
+                self._condition.notify_all()  # wake up reading paused by full buffer
+                return line
+        return None
+
+    def clear(self) -> None:
+        """Drop all lines waiting in the buffer."""
+        with self._condition:
+            self._lines.clear()
+            self._condition.notify_all()
+
+    def _read_loop(self) -> None:
+        try:
+            while not self._stop_event.is_set():
+                if data := self._read_chunk():
+                    self._process_data(data, time.time())
+        except Exception as e:
+            if not self._stop_event.is_set():
+                logger.debug('Stopped reading from serial: %s', e)
+        finally:
+            if self._partial:
+                self._add_lines([bytes(self._partial)], time.time())
+                self._partial = bytearray()
+            with self._condition:
+                self._condition.notify_all()
+
+    def _read_chunk(self) -> bytes:
+        # read(1) blocks up to the connection timeout when nothing is waiting
+        return self._connection.read(self._connection.in_waiting or 1)
+
+    def _process_data(self, data: bytes, timestamp: float) -> None:
+        self._partial += data
+        if b'\n' not in data:
+            return
+        *lines, rest = bytes(self._partial).split(b'\n')
+        self._partial = bytearray(rest)
+        self._add_lines(lines, timestamp)
+
+    def _add_lines(self, lines: list[bytes], timestamp: float) -> None:
+        if self._on_data is not None:
+            self._on_data(b'\n'.join(lines) + b'\n')
+        with self._condition:
+            for line in lines:
+                if len(self._lines) >= self._max_lines and not self._stop_event.is_set():
+                    logger.warning('Buffer of serial reader is full, reading is paused until lines are consumed')
+                    while len(self._lines) >= self._max_lines and not self._stop_event.is_set():
+                        self._condition.notify_all()
+                        self._condition.wait(0.1)
+                if len(self._lines) >= self._max_lines:
+                    # reading was stopped and nobody consumes lines
+                    self.dropped_lines += 1
+                    continue
+                self._lines.append(SerialLine(timestamp, line))
+            self._condition.notify_all()
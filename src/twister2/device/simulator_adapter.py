@@ -8,6 +8,7 @@ import asyncio
 import asyncio.subprocess
 import logging
 import os
+import queue
 import shutil
 import signal
 import subprocess
@@ -23,6 +24,7 @@ import psutil
 
 from twister2.device import END_OF_DATA
 from twister2.device.device_abstract import DeviceAbstract
+from twister2.device.direct_runner import get_run_command
 from twister2.exceptions import TwisterRunException
 from twister2.helper import log_command
 from twister2.log_files.log_file import HandlerLogFile
@@ -62,6 +64,7 @@ class SimulatorAdapterBase(DeviceAbstract, abc.ABC):
         self._exc: Exception | None = None  #: store any exception which appeared running this thread
         self._thread: threading.Thread | None = None
         self.command: list[str] = []
+        self.read_timeout: float = 1  #: time in seconds after which empty line is returned if no data
         self.process_kwargs: dict = {
             'stdout': asyncio.subprocess.PIPE,
             'stderr': asyncio.subprocess.STDOUT,
@@ -76,6 +79,7 @@ class SimulatorAdapterBase(DeviceAbstract, abc.ABC):
             msg = 'Run simulation command is empty, please verify if it was generated properly.'
             logger.error(msg)
             raise TwisterRunException(msg)
+        self._mark_launched()
         self._thread = threading.Thread(target=self._run_simulation, args=(timeout,), daemon=True)
         self._thread.start()
         # Give a time to start subprocess before test is executed
@@ -85,6 +89,21 @@ class SimulatorAdapterBase(DeviceAbstract, abc.ABC):
             logger.error('Simulation failed due to an exception: %s', self._exc)
             raise self._exc
 
+    def reset(self, timeout: float = 60.0) -> None:
+        """Start simulation again, so the next test starts with application in initial state."""
+        if self._thread is not None and self._thread.is_alive():
+            logger.info('Restarting simulation')
+            self.stop()
+            # thread puts end of data marker to queue, so it cannot be left running with a new queue
+            self._thread.join(timeout=5)
+        else:
+            logger.info('Simulation has finished, starting it again')
+        self._stop_job = False
+        self._exc = None
+        self._process_ended_with_timeout = False
+        self.queue = Queue()  # skip end of data markers left by previous run
+        self.flash_and_run(timeout)
+
     def _run_simulation(self, timeout: float) -> None:
         log_command(logger, 'Running command', self.command, level=logging.INFO)
         try:
@@ -144,14 +163,17 @@ class SimulatorAdapterBase(DeviceAbstract, abc.ABC):
         time.sleep(0.1)  # give a time to end while loop in running simulation
         if self._process is not None and self._process.returncode is None:
             logger.debug('Stopping all running processes for PID %s', self._process.pid)
-            # kill subprocess if it is still running
-            for child in psutil.Process(self._process.pid).children(recursive=True):
-                try:
-                    os.kill(child.pid, signal.SIGTERM)
-                except ProcessLookupError:
-                    pass
-            # kill subprocess if it is still running
-            os.kill(self._process.pid, signal.SIGTERM)
+            try:
+                # kill subprocess if it is still running
+                for child in psutil.Process(self._process.pid).children(recursive=True):
+                    try:
+                        os.kill(child.pid, signal.SIGTERM)
+                    except ProcessLookupError:
+                        pass
+                # kill subprocess if it is still running
+                os.kill(self._process.pid, signal.SIGTERM)
+            except (psutil.NoSuchProcess, ProcessLookupError):
+                logger.debug('Process %s has already finished', self._process.pid)
         if self._thread is not None:
             self._thread.join(timeout=1)  # Should end immediately, but just in case we set timeout for 1 sec
         if self._exc:
@@ -161,10 +183,16 @@ class SimulatorAdapterBase(DeviceAbstract, abc.ABC):
     def iter_stdout(self) -> Generator[str, None, None]:
         """Return output from serial."""
         while True:
-            stream = self.queue.get()
+            try:
+                stream = self.queue.get(timeout=self.read_timeout)
+            except queue.Empty:
+                # let the parser verify its timeouts when device is silent
+                yield ''
+                continue
             if stream == END_OF_DATA:
                 logger.debug('No more data from running process')
                 break
+            self._mark_output_received()
             self.handler_log_file.handle(data=stream + '\n')
             yield stream
             self.queue.task_done()
@@ -208,8 +236,13 @@ class CustomSimulatorAdapter(SimulatorAdapterBase):
         :param build_dir: build directory
         :return: command to run
         """
-        if (west := shutil.which('west')) is None:
+        if self.twister_config.direct_run and (direct_command := get_run_command(build_dir)):
+            self.command = direct_command.command
+            self.process_kwargs['cwd'] = direct_command.cwd
+            self.launcher = 'direct'
+        elif (west := shutil.which('west')) is None:
             logger.error('west not found')
             self.command = []
         else:
             self.command = [west, 'build', '-d', str(build_dir), '-t', 'run']
+            self.launcher = 'west'
@@ -7,18 +7,26 @@ import re
 import shutil
 import subprocess
 from pathlib import Path
-from typing import NamedTuple
+from typing import TYPE_CHECKING, NamedTuple
 
 import pytest
-from git.repo import Repo
 
+from twister2.constants import ENVIRONMENT_CACHE_FILE
+from twister2.environment.environment_cache import (
+    EnvironmentCache,
+    get_toolchain_cache_key,
+)
+from twister2.environment.git_reader import read_commit_date, read_head_commit
 from twister2.exceptions import TwisterException
 from twister2.helper import log_command
 
+if TYPE_CHECKING:
+    from twister2.server import TwisterServerClient
+
 logger = logging.getLogger(__name__)
 
 
-def get_toolchain_version(output_dir: str, zephyr_base: str) -> str:
+def get_toolchain_version(output_dir: str, zephyr_base: str, server: TwisterServerClient | None = None) -> str:
     """
     When TwisterConfig is generated first time, then information about used
     toolchain version should be taken by CMake script and then saved into
@@ -26,6 +34,10 @@ def get_toolchain_version(output_dir: str, zephyr_base: str) -> str:
     TwisterConfig is generated once again by each worker, information about used
     toolchain version can be taken from environment_info.json file to avoid
     calling CMake script several times in row.
+
+    Toolchain version is also saved in cache of user, so CMake script is run
+    again only when Zephyr directory, environment or SDK was changed. When
+    twister server is running, toolchain version detected by it is used.
     """
     environment_info_file_name = 'environment_info.json'
     environment_info_file_path: Path = Path(output_dir) / environment_info_file_name
@@ -33,7 +45,17 @@ def get_toolchain_version(output_dir: str, zephyr_base: str) -> str:
     if environment_info_file_path.is_file():
         used_toolchain_version = _get_toolchain_version_from_env_info_file(environment_info_file_path)
     else:
-        used_toolchain_version = _get_toolchain_version_from_cmake_script(zephyr_base)
+        cache = EnvironmentCache(ENVIRONMENT_CACHE_FILE)
+        cache_key = get_toolchain_cache_key(zephyr_base, os.environ)
+        if cached_version := cache.get('toolchain', cache_key):
+            logger.info(f"Using '{cached_version}' toolchain (from cache {cache.filename}).")
+            used_toolchain_version = cached_version
+        else:
+            if server is not None:
+                used_toolchain_version = server.get_toolchain_version(zephyr_base)
+            else:
+                used_toolchain_version = _get_toolchain_version_from_cmake_script(zephyr_base)
+            cache.put('toolchain', cache_key, used_toolchain_version)
         _save_toolchain_version_to_env_info_file(environment_info_file_path, used_toolchain_version)
 
     return used_toolchain_version
@@ -56,13 +78,23 @@ def _save_toolchain_version_to_env_info_file(file_path: Path, toolchain_version:
         json.dump(environment_info, file, indent=4)
 
 
-def _get_toolchain_version_from_cmake_script(zephyr_base: str) -> str:
+def detect_toolchain_version(zephyr_base: str, env: dict[str, str] | None = None) -> str:
+    """
+    Return toolchain version detected by CMake script.
+
+    :param zephyr_base: path to Zephyr directory
+    :param env: environment variables of CMake (default: of current process)
+    """
+    return _get_toolchain_version_from_cmake_script(zephyr_base, env)
+
+
+def _get_toolchain_version_from_cmake_script(zephyr_base: str, env: dict[str, str] | None = None) -> str:
     """
     TODO: this function was copied from Twister v1 and requires some refactoring in the future
     TODO: write unit tests dedicated for this function
     """
     toolchain_script = Path(zephyr_base) / 'cmake' / 'verify-toolchain.cmake'
-    result = _run_cmake_script(toolchain_script, ['FORMAT=json'])
+    result = _run_cmake_script(toolchain_script, ['FORMAT=json'], env=env)
 
     try:
         if result.get('returncode') != 0:
@@ -78,7 +110,9 @@ def _get_toolchain_version_from_cmake_script(zephyr_base: str) -> str:
     return toolchain_version
 
 
-def _run_cmake_script(script: str | Path, cmake_extra_args: list[str] | None = None) -> dict:
+def _run_cmake_script(
+    script: str | Path, cmake_extra_args: list[str] | None = None, env: dict[str, str] | None = None
+) -> dict:
     """
     TODO: this function was copied from Twister v1 and requires some refactoring in the future
     TODO: write unit tests dedicated for this function
@@ -93,14 +127,14 @@ def _run_cmake_script(script: str | Path, cmake_extra_args: list[str] | None = N
     cmake_args = ['-D{}'.format(a.replace('"', '')) for a in cmake_extra_args]
     cmake_args.extend(['-P', script])
 
-    if (cmake := shutil.which('cmake')) is None:
+    if (cmake := shutil.which('cmake', path=(env or os.environ).get('PATH'))) is None:
         raise TwisterException('cmake not found')
 
     cmd = [cmake] + cmake_args
     log_command(logger, 'Calling cmake', cmd)
 
     # CMake sends the output of message() to stderr unless it's STATUS
-    p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env)
     process_output, _ = p.communicate()
 
     # It might happen that the environment adds ANSI escape codes like \x1b[0m,
@@ -127,7 +161,20 @@ def get_zephyr_repo_info(zephyr_base: str) -> tuple[str, str]:
         zephyr_version: str
         commit_date: str
 
+    # HEAD is read directly from git directory, date of commit is read from
+    # its object or cache, and GitPython (slow to import) is used when it fails
+    cache = EnvironmentCache(ENVIRONMENT_CACHE_FILE)
+    if sha := read_head_commit(zephyr_base):
+        commit_date = cache.get('commit_date', sha)
+        if commit_date is None and (commit_date := read_commit_date(zephyr_base, sha)):
+            cache.put('commit_date', sha, commit_date)
+        if commit_date:
+            return RepoInfo(sha[:12], commit_date)
+
+    from git.repo import Repo
+
     repo = Repo(zephyr_base)
     zephyr_version = repo.head.commit.hexsha[:12]
     commit_date = repo.head.commit.authored_datetime.isoformat(timespec='seconds')
+    cache.put('commit_date', repo.head.commit.hexsha, commit_date)
     return RepoInfo(zephyr_version, commit_date)
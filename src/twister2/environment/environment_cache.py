@@ -0,0 +1,119 @@
+"""
+Cache of information about environment shared by sessions of user.
+
+Detecting toolchain by CMake script takes seconds, and its result saved in
+output directory is lost when the directory is archived by the next session.
+Results are stored in a file in the user's cache directory, under a key
+computed from Zephyr directory, environment variables affecting detection and
+modification times of files of SDK, so any change of them detects toolchain
+again.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Mapping
+
+logger = logging.getLogger(__name__)
+
+#: environment variables affecting detection of toolchain
+TOOLCHAIN_ENV_PATTERN = re.compile(r'PATH|CROSS_COMPILE|ZEPHYR_.*|.*TOOLCHAIN.*')
+#: CMake user package registry, where Zephyr SDK registers its location
+SDK_PACKAGE_REGISTRY: str = os.path.join('~', '.cmake', 'packages', 'Zephyr-sdk')
+#: the newest entries kept in each section of cache
+MAX_ENTRIES: int = 100
+
+
+def _get_mtime(path: str | Path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def get_toolchain_env(env: Mapping[str, str]) -> dict[str, str]:
+    """Return environment variables affecting detection of toolchain."""
+    return {name: value for name, value in env.items() if TOOLCHAIN_ENV_PATTERN.fullmatch(name)}
+
+
+def get_sdk_paths(env: Mapping[str, str]) -> list[str]:
+    """Return directories where CMake script looks for toolchain."""
+    paths: list[str] = [
+        value for name, value in get_toolchain_env(env).items()
+        if name != 'PATH' and os.path.isabs(value)
+    ]
+    registry = os.path.expanduser(SDK_PACKAGE_REGISTRY)
+    paths.append(registry)
+    if os.path.isdir(registry):
+        for entry in sorted(os.listdir(registry)):
+            try:
+                with open(os.path.join(registry, entry), encoding='UTF-8') as file:
+                    paths.append(file.read().strip())
+            except OSError:
+                continue
+    return paths
+
+
+def get_toolchain_cache_key(zephyr_base: str, env: Mapping[str, str]) -> str:
+    """
+    Return key identifying result of toolchain detection.
+
+    :param zephyr_base: path to Zephyr directory
+    :param env: environment variables of CMake script
+    """
+    files = [os.path.join(zephyr_base, 'cmake', 'verify-toolchain.cmake'), *get_sdk_paths(env)]
+    data = dict(
+        zephyr_base=os.path.realpath(zephyr_base),
+        env=get_toolchain_env(env),
+        mtimes={path: _get_mtime(path) for path in files},
+    )
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+class EnvironmentCache:
+    """Values stored in JSON file, grouped in sections."""
+
+    def __init__(self, filename: str | Path) -> None:
+        """
+        :param filename: path to cache file
+        """
+        self.filename: Path = Path(filename).expanduser()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({str(self.filename)!r})'
+
+    def _read(self) -> dict:
+        try:
+            with self.filename.open(encoding='UTF-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, section: str, key: str) -> str | None:
+        """Return cached value or None when not found."""
+        entry = self._read().get(section, {}).get(key)
+        return entry['value'] if isinstance(entry, dict) else None
+
+    def put(self, section: str, key: str, value: str) -> None:
+        """Save value, the oldest entries are removed when section is full."""
+        data = self._read()
+        entries: dict = data.setdefault(section, {})
+        entries[key] = dict(value=value, time=time.time())
+        if len(entries) > MAX_ENTRIES:
+            newest = sorted(entries, key=lambda k: entries[k].get('time', 0), reverse=True)[:MAX_ENTRIES]
+            data[section] = {k: entries[k] for k in newest}
+        try:
+            self.filename.parent.mkdir(parents=True, exist_ok=True)
+            # file is replaced at once, so other sessions never read incomplete file
+            tmp_file = self.filename.with_name(f'.{self.filename.name}.{os.getpid()}')
+            with tmp_file.open('w', encoding='UTF-8') as file:
+                json.dump(data, file, indent=4)
+            os.replace(tmp_file, self.filename)
+        except OSError as e:
+            logger.warning('Cannot save environment cache %s: %s', self.filename, e)
@@ -0,0 +1,99 @@
+"""
+Read HEAD commit of git repository directly from files in git directory.
+
+It is much cheaper than importing GitPython and creating repository object,
+and it is enough to identify Zephyr version in results report. Functions
+return None when information cannot be read this way (e.g. commit stored only
+in pack file), so caller can use GitPython instead.
+"""
+from __future__ import annotations
+
+import datetime
+import re
+import zlib
+from pathlib import Path
+
+_SHA_PATTERN = re.compile(r'[0-9a-f]{40}')
+_AUTHOR_PATTERN = re.compile(rb'^author .* (\d+) ([+-])(\d\d)(\d\d)$', re.MULTILINE)
+
+
+def find_git_dirs(repo_dir: str | Path) -> tuple[Path, Path] | None:
+    """
+    Return git directory of working tree and common git directory (with refs and objects).
+
+    They differ for additional working trees (``git worktree``).
+
+    :param repo_dir: top directory of working tree
+    """
+    dot_git = Path(repo_dir) / '.git'
+    if dot_git.is_dir():
+        git_dir = dot_git
+    elif dot_git.is_file():
+        # working tree of submodule or additional working tree
+        content = dot_git.read_text(encoding='UTF-8').strip()
+        if not content.startswith('gitdir:'):
+            return None
+        git_dir = (dot_git.parent / content[len('gitdir:'):].strip()).resolve()
+    else:
+        return None
+    common_dir = git_dir
+    if (commondir_file := git_dir / 'commondir').is_file():
+        common_dir = (git_dir / commondir_file.read_text(encoding='UTF-8').strip()).resolve()
+    return git_dir, common_dir
+
+
+def read_ref(common_dir: Path, ref: str) -> str | None:
+    """Return commit of reference from loose reference file or packed-refs."""
+    ref_file = common_dir / ref
+    if ref_file.is_file():
+        sha = ref_file.read_text(encoding='UTF-8').strip()
+        return sha if _SHA_PATTERN.fullmatch(sha) else None
+    packed_refs = common_dir / 'packed-refs'
+    if not packed_refs.is_file():
+        return None
+    with packed_refs.open(encoding='UTF-8') as file:
+        for line in file:
+            # skip header and peeled tags (lines starting with ^)
+            if line.startswith(('#', '^')):
+                continue
+            sha, _, name = line.strip().partition(' ')
+            if name == ref:
+                return sha
+    return None
+
+
+def read_head_commit(repo_dir: str | Path) -> str | None:
+    """Return sha of HEAD commit, or None if it cannot be read from files."""
+    if (git_dirs := find_git_dirs(repo_dir)) is None:
+        return None
+    git_dir, common_dir = git_dirs
+    try:
+        head = (git_dir / 'HEAD').read_text(encoding='UTF-8').strip()
+        if head.startswith('ref:'):
+            return read_ref(common_dir, head[len('ref:'):].strip())
+    except OSError:
+        return None
+    return head if _SHA_PATTERN.fullmatch(head) else None
+
+
+def read_commit_date(repo_dir: str | Path, sha: str) -> str | None:
+    """
+    Return author date of commit in ISO format, or None if commit is not stored as loose object.
+
+    :param repo_dir: top directory of working tree
+    :param sha: sha of commit
+    """
+    if (git_dirs := find_git_dirs(repo_dir)) is None:
+        return None
+    object_file = git_dirs[1] / 'objects' / sha[:2] / sha[2:]
+    try:
+        data = zlib.decompress(object_file.read_bytes())
+    except (OSError, zlib.error):
+        return None
+    header, _, body = data.partition(b'\0')
+    if not header.startswith(b'commit ') or (match := _AUTHOR_PATTERN.search(body)) is None:
+        return None
+    timestamp, sign, hours, minutes = match.groups()
+    offset = datetime.timedelta(hours=int(hours), minutes=int(minutes))
+    tz = datetime.timezone(-offset if sign == b'-' else offset)
+    return datetime.datetime.fromtimestamp(int(timestamp), tz).isoformat(timespec='seconds')
@@ -0,0 +1,210 @@
+"""
+Select tests affected by files changed since given git revision.
+
+Files used to build each test are taken from ninja dependency data saved in
+its build directory by a previous run (`.ninja_deps` with sources and
+headers of all compiled files, and inputs of CMake configuration listed in
+`build.ninja`). Test is affected when any of those files, or any file from
+its source directory, was changed. Tests without dependency data (e.g. never
+built before) are always selected.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+from pathlib import Path
+
+import pytest
+from git.exc import GitError
+from git.repo import Repo
+
+from twister2.filter.filter_interface import FilterInterface
+from twister2.helper import find_archived_output_dirs, get_item_specification
+
+logger = logging.getLogger(__name__)
+
+NINJA_DEPS_FILE_NAME: str = '.ninja_deps'
+NINJA_BUILD_FILE_NAME: str = 'build.ninja'
+NINJA_DEPS_SIGNATURE: bytes = b'# ninjadeps\n'
+NINJA_DEPS_VERSION: int = 4
+IMPACT_FILE_NAME: str = 'changed_files_impact.json'
+#: reason of selecting test without dependency data
+NO_DEPENDENCY_DATA: str = 'no dependency data'
+
+
+def get_changed_files(repo_dir: str | Path, revision: str) -> set[str]:
+    """
+    Return absolute paths of files changed since revision (including not committed changes).
+
+    :param repo_dir: directory in git repository
+    :param revision: git revision (e.g. commit, branch, tag)
+    """
+    repo = Repo(repo_dir, search_parent_directories=True)
+    output: str = repo.git.diff('--name-only', revision)
+    working_tree_dir = os.path.realpath(str(repo.working_tree_dir))
+    return {os.path.normpath(os.path.join(working_tree_dir, name)) for name in output.splitlines() if name}
+
+
+def read_ninja_deps(filename: str | Path) -> set[str]:
+    """
+    Return paths of all files from ninja deps log.
+
+    Only path records are read, they contain all inputs (sources and headers)
+    and outputs of commands with dependencies discovered during build.
+
+    :param filename: path to `.ninja_deps`
+    :return: paths relative to build directory or absolute
+    """
+    with open(filename, 'rb') as file:
+        data = file.read()
+    if not data.startswith(NINJA_DEPS_SIGNATURE):
+        raise ValueError(f'{filename} is not ninja deps log')
+    offset = len(NINJA_DEPS_SIGNATURE)
+    (version,) = struct.unpack_from('<i', data, offset)
+    if version != NINJA_DEPS_VERSION:
+        raise ValueError(f'Not supported version {version} of ninja deps log {filename}')
+    offset += 4
+    paths: set[str] = set()
+    while offset + 4 <= len(data):
+        (size,) = struct.unpack_from('<I', data, offset)
+        offset += 4
+        is_deps_record = size & 0x80000000
+        size &= 0x7FFFFFFF
+        if not is_deps_record:
+            # path padded with null bytes and followed by checksum
+            paths.add(data[offset:offset + size - 4].rstrip(b'\0').decode('utf-8', errors='replace'))
+        offset += size
+    return paths
+
+
+def read_cmake_inputs(filename: str | Path) -> set[str]:
+    """
+    Return files which cause CMake configuration to run again when changed.
+
+    They are listed as implicit inputs of rule regenerating `build.ninja`.
+
+    :param filename: path to `build.ninja`
+    """
+    statement: str = ''
+    with open(filename, encoding='UTF-8', errors='replace') as file:
+        for line in file:
+            if statement:
+                statement += line.strip()
+            elif line.startswith('build build.ninja:'):
+                statement = line.strip()
+            else:
+                continue
+            if statement.endswith('$'):  # statement continues in next line
+                statement = statement[:-1] + ' '
+                continue
+            break
+    if '|' not in statement:
+        return set()
+    inputs = statement.split('|', 1)[1].split('||', 1)[0]
+    # spaces in paths are escaped with `$`
+    return {path.replace('$\0', ' ') for path in inputs.replace('$ ', '$\0').split()}
+
+
+def read_build_dependencies(build_dir: str | Path) -> set[str] | None:
+    """
+    Return absolute paths of files used to build application.
+
+    :param build_dir: build directory
+    :return: set of paths or None if build directory has no dependency data
+    """
+    deps_file = Path(build_dir) / NINJA_DEPS_FILE_NAME
+    if not deps_file.is_file():
+        return None
+    try:
+        paths = read_ninja_deps(deps_file)
+        if (build_file := Path(build_dir) / NINJA_BUILD_FILE_NAME).is_file():
+            paths.update(read_cmake_inputs(build_file))
+    except (OSError, ValueError, struct.error) as e:
+        logger.warning('Cannot read dependencies from %s: %s', build_dir, e)
+        return None
+    return {os.path.normpath(os.path.join(build_dir, path)) for path in paths}
+
+
+class ChangedFilesFilter(FilterInterface):
+    """Deselect tests not affected by files changed since given git revision."""
+
+    def __init__(self, config: pytest.Config, changed_files: set[str] | None = None):
+        """
+        :param config: pytest configuration
+        :param changed_files: absolute paths of changed files, read from git when not provided
+        """
+        super().__init__(config)
+        self.output_dir = Path(config.option.output_dir)
+        if changed_files is None:
+            changed_files = self._get_changed_files(config)
+        self.changed_files: set[str] | None = changed_files
+        #: output directories with builds from previous runs
+        self.build_roots: list[Path] = [self.output_dir, *find_archived_output_dirs(self.output_dir)]
+        self._dependencies: dict[Path, set[str] | None] = {}
+        #: why test was selected: changed files or no dependency data
+        self.reasons: dict[str, list[str]] = {}
+
+    @staticmethod
+    def _get_changed_files(config: pytest.Config) -> set[str] | None:
+        zephyr_base: str = config.getoption('zephyr_base') or config.getini('zephyr_base') \
+            or os.environ.get('ZEPHYR_BASE', '')
+        try:
+            changed_files = get_changed_files(os.path.expanduser(zephyr_base), config.option.changed_since)
+        except GitError as e:
+            logger.warning('Cannot get files changed since %s, all tests are selected: %s',
+                           config.option.changed_since, e)
+            return None
+        logger.info('Found %d files changed since %s', len(changed_files), config.option.changed_since)
+        return changed_files
+
+    def get_dependencies(self, relative_build_dir: Path) -> set[str] | None:
+        """Return files used to build application in the latest build directory with dependency data."""
+        if relative_build_dir not in self._dependencies:
+            self._dependencies[relative_build_dir] = None
+            for build_root in self.build_roots:
+                if (dependencies := read_build_dependencies(build_root / relative_build_dir)) is not None:
+                    self._dependencies[relative_build_dir] = dependencies
+                    break
+        return self._dependencies[relative_build_dir]
+
+    def filter(self, item: pytest.Item) -> bool:
+        """
+        Check if test should be deselected.
+
+        :param item: pytest test item
+        :return: True if test is not affected by changed files
+        """
+        if self.changed_files is None:
+            return False
+        # filters run before specifications are added to session, so it is taken from test item
+        if (spec := get_item_specification(item)) is None:
+            # regular pytest test without build
+            return False
+
+        source_dir = os.path.realpath(spec.source_dir) + os.sep
+        reasons = sorted(path for path in self.changed_files if path.startswith(source_dir))
+        if not reasons:
+            dependencies = self.get_dependencies(Path(spec.platform, spec.rel_to_base_path, spec.scenario))
+            if dependencies is None:
+                reasons = [NO_DEPENDENCY_DATA]
+            else:
+                reasons = sorted(self.changed_files & dependencies)
+        if reasons:
+            self.reasons[item.nodeid] = reasons
+        return not reasons
+
+    def finish(self, selected_items: list[pytest.Item]) -> None:
+        if self.changed_files is None:
+            return
+        impact: dict[str, list[str]] = {}
+        for nodeid, reasons in self.reasons.items():
+            for reason in reasons:
+                impact.setdefault(reason, []).append(nodeid)
+        for reason, nodeids in sorted(impact.items()):
+            logger.info('%s: selected %d tests', reason, len(nodeids))
+        if not hasattr(self.config, 'workerinput'):  # not xdist worker
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.output_dir / IMPACT_FILE_NAME, 'w', encoding='UTF-8') as file:
+                json.dump(dict(changed_files=sorted(self.changed_files), impact=impact), file, indent=4)
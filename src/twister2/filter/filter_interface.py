@@ -17,3 +17,6 @@ class FilterInterface(abc.ABC):
     @abc.abstractmethod
     def filter(self, item: pytest.Item) -> bool:
         """Return true if item should be deselected."""
+
+    def finish(self, selected_items: list[pytest.Item]) -> None:
+        """Called when all items were filtered (e.g. to report why items were selected)."""
@@ -39,6 +39,9 @@ class FilterPlugin:
             else:
                 selected_items.append(item)
 
+        for filter_ in self._filters:
+            filter_.finish(selected_items)
+
         if deselected_items:
             config.hook.pytest_deselected(items=deselected_items)
         items[:] = selected_items
@@ -0,0 +1,162 @@
+"""
+Split tests into shards run on separate machines.
+
+Tests are assigned to shards deterministically, so each machine collecting
+the same tests with the same options selects its own part of them. Tests
+sharing a build directory are always kept in one shard (the application is
+built only once). Shards are balanced by expected duration of tests taken
+from results report of a previous run, or by number of tests when durations
+are not available.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+
+import pytest
+
+from twister2.helper import get_build_dir
+from twister2.report.helper import get_item_metadata
+from twister2.report.results_journal import get_testsuite_key
+from twister2.report.test_plan_json import JsonTestPlan
+
+logger = logging.getLogger(__name__)
+
+WORKERINPUT_KEY: str = 'twister_shard_costs'
+
+
+def read_test_costs(filename: str | Path) -> dict[tuple[str, str], float]:
+    """
+    Return durations of tests from results report.
+
+    :param filename: path to results report (twister.json)
+    :return: dictionary with durations in seconds for tests identified by name and platform
+    """
+    with open(filename, encoding='UTF-8') as file:
+        data = json.load(file)
+    costs: dict[tuple[str, str], float] = {}
+    for testsuite in data.get('testsuites', []):
+        try:
+            costs[get_testsuite_key(testsuite)] = float(
+                testsuite.get('duration') or testsuite.get('execution_time') or 0
+            )
+        except (KeyError, ValueError):
+            continue
+    return costs
+
+
+def split_into_shards(group_costs: dict[str, float], shard_count: int) -> list[list[str]]:
+    """
+    Split groups of tests into shards with similar total cost.
+
+    The most expensive groups are assigned first, each to the shard with the
+    lowest total cost so far. Ties are resolved by group key and shard
+    index, so the result does not depend on order of collection.
+
+    :param group_costs: cost of each group of tests
+    :param shard_count: number of shards
+    :return: keys of groups assigned to each shard
+    """
+    shards: list[list[str]] = [[] for _ in range(shard_count)]
+    shard_costs: list[float] = [0.0] * shard_count
+    for key, cost in sorted(group_costs.items(), key=lambda group: (-group[1], group[0])):
+        index = min(range(shard_count), key=lambda i: (shard_costs[i], i))
+        shards[index].append(key)
+        shard_costs[index] += cost
+    return shards
+
+
+class ShardPlugin:
+    """Select tests belonging to one shard."""
+
+    def __init__(
+        self,
+        config: pytest.Config,
+        shard_index: int,
+        shard_count: int,
+        test_costs: dict[tuple[str, str], float] | None = None,
+    ):
+        """
+        :param config: pytest configuration
+        :param shard_index: index of selected shard (starting from 0)
+        :param shard_count: number of shards
+        :param test_costs: durations of tests from previous run
+        """
+        self.config = config
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.test_costs = test_costs or {}
+        self.selected_cost: float = 0.0
+        self.selected_tests: int = 0
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.shard_index}, {self.shard_count})'
+
+    @classmethod
+    def create(cls, config: pytest.Config) -> ShardPlugin:
+        test_costs: dict[tuple[str, str], float] = {}
+        if hasattr(config, 'workerinput'):
+            # xdist worker uses durations read by controller, previous results can be already removed
+            test_costs = {
+                (name, platform): cost for name, platform, cost in config.workerinput.get(WORKERINPUT_KEY, [])
+            }
+        elif costs_path := config.option.shard_costs_path:
+            try:
+                test_costs = read_test_costs(costs_path)
+            except (OSError, ValueError) as e:
+                logger.warning('Cannot read durations of tests from %s, shards are balanced by number '
+                               'of tests: %s', costs_path, e)
+        return cls(config, config.option.shard_index, config.option.shard_count, test_costs)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node) -> None:
+        """Send durations of tests to xdist worker, so all workers select the same shard as controller."""
+        node.workerinput[WORKERINPUT_KEY] = [
+            [name, platform, cost] for (name, platform), cost in self.test_costs.items()
+        ]
+
+    def get_item_cost(self, item: pytest.Item, default: float) -> float:
+        metadata = get_item_metadata(item)
+        return self.test_costs.get(get_testsuite_key(metadata.asdict()), default)
+
+    # specifications are added to session by plugins with default priority, tests are split after them
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(
+        self, session: pytest.Session, config: pytest.Config, items: list[pytest.Item]
+    ):
+        # tests not found in previous results are expected to take average time
+        default_cost = sum(self.test_costs.values()) / len(self.test_costs) if self.test_costs else 1.0
+        group_costs: dict[str, float] = {}
+        item_groups: list[str] = []
+        for item in items:
+            group = get_build_dir(item)
+            item_groups.append(group)
+            group_costs[group] = group_costs.get(group, 0.0) + self.get_item_cost(item, default_cost)
+
+        selected_groups = set(split_into_shards(group_costs, self.shard_count)[self.shard_index])
+        selected_items: list[pytest.Item] = []
+        deselected_items: list[pytest.Item] = []
+        for item, group in zip(items, item_groups):
+            (selected_items if group in selected_groups else deselected_items).append(item)
+
+        self.selected_tests = len(selected_items)
+        self.selected_cost = sum(group_costs[group] for group in selected_groups)
+        if deselected_items:
+            config.hook.pytest_deselected(items=deselected_items)
+        items[:] = selected_items
+
+        if not hasattr(config, 'workerinput'):  # not xdist worker
+            self.save_shard_plan(selected_items)
+
+    def save_shard_plan(self, items: list[pytest.Item]) -> None:
+        """Save tests of shard to be able to run them again with --load-tests."""
+        filename = os.path.join(
+            self.config.option.output_dir, f'testplan_shard_{self.shard_index}_of_{self.shard_count}.json'
+        )
+        JsonTestPlan(filename).write(dict(testsuites=[get_item_metadata(item).asdict() for item in items]))
+
+    def pytest_report_collectionfinish(self, config: pytest.Config, items: list[pytest.Item]) -> str:
+        cost = f'{self.selected_cost:.0f} s' if self.test_costs else f'{self.selected_cost:.0f} tests'
+        return f'shard {self.shard_index} of {self.shard_count}: {self.selected_tests} tests, expected cost {cost}'
@@ -3,6 +3,7 @@ Pytest fixture for building hex files.
 """
 from __future__ import annotations
 
+import functools
 import logging
 from pathlib import Path
 from typing import Generator
@@ -13,12 +14,14 @@ from twister2.builder.build_helper import CMakeExtraArgsConfig, CMakeExtraArgsGe
 from twister2.builder.build_manager import BuildManager
 from twister2.builder.builder_abstract import BuildConfig, BuilderAbstract
 from twister2.builder.factory import BuilderFactory
+from twister2.device.device_pool import DevicePool, PooledDevice
 from twister2.exceptions import (
     TwisterBuildFiltrationException,
     TwisterBuildSkipException,
     TwisterMemoryOverflowException,
 )
 from twister2.fixtures.common import SetupTestManager
+from twister2.platform_specification import PlatformSpecification
 from twister2.yaml_test_function import YamlTestCase
 
 logger = logging.getLogger(__name__)
@@ -26,7 +29,7 @@ logger = logging.getLogger(__name__)
 
 @pytest.fixture(name='build_manager', scope='function')
 def fixture_build_manager(
-        request: pytest.FixtureRequest, setup_manager: SetupTestManager
+        request: pytest.FixtureRequest, setup_manager: SetupTestManager, dut_pool: DevicePool
 ) -> Generator[BuildManager, None, None]:
     """Build manager"""
     platform = setup_manager.platform
@@ -69,10 +72,29 @@ def fixture_build_manager(
 
     yield build_manager
 
-    if request.config.option.prep_artifacts_for_testing:
+    test_failed: bool = getattr(request.node, '_test_failed', False)
+    if (pooled_device := dut_pool.find(spec.build_dir)) is not None:
+        # artifacts are still used by running device, clean them when it is released
+        pooled_device.test_failed |= test_failed
+        pooled_device.finalizers.setdefault('artifacts', functools.partial(
+            _finalize_deferred_artifacts, request.config, build_manager, platform, pooled_device
+        ))
+    else:
+        _finalize_artifacts(request.config, build_manager, platform, test_failed)
+
+
+def _finalize_deferred_artifacts(
+    config: pytest.Config, build_manager: BuildManager, platform: PlatformSpecification, pooled_device: PooledDevice
+) -> None:
+    _finalize_artifacts(config, build_manager, platform, pooled_device.test_failed)
+
+
+def _finalize_artifacts(
+    config: pytest.Config, build_manager: BuildManager, platform: PlatformSpecification, test_failed: bool
+) -> None:
+    if config.option.prep_artifacts_for_testing:
         build_manager.prepare_device_testing_artifacts(list(platform.testing.binaries))
-    elif (cleanup_version := request.config.option.runtime_artifact_cleanup) is not None:
-        test_failed = getattr(request.node, '_test_failed', False)
+    elif (cleanup_version := config.option.runtime_artifact_cleanup) is not None:
         if cleanup_version == 'all' or (cleanup_version == 'pass' and not test_failed):
             build_manager.cleanup_artifacts(cleanup_version=cleanup_version)
 
@@ -84,6 +106,14 @@ def fixture_builder(
         setup_manager: SetupTestManager
 ) -> Generator[BuilderAbstract, None, None]:
     """Build hex files for test suite."""
+    if setup_manager.replay_logs:
+        # application was built by the previous run, only its output is evaluated
+        if not setup_manager.is_executable:
+            logger.info(f'{setup_manager.is_executable.message}: {request.node.nodeid}')
+            pytest.skip(setup_manager.is_executable.reason)
+        yield build_manager.builder
+        return
+
     try:
         build_manager.build()
     except TwisterMemoryOverflowException as overflow_exception:
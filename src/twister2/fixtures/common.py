@@ -5,9 +5,11 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from pathlib import Path
 
 import pytest
 
+from twister2.device.replay_adapter import get_replay_log_file
 from twister2.exceptions import TwisterConfigurationException
 from twister2.platform_specification import PlatformSpecification
 from twister2.twister_config import TwisterConfig
@@ -42,9 +44,15 @@ class SetupTestManager:
         self.build_only: bool = self.twister_config.build_only or self.specification.build_only
         self.device_testing: bool = self.twister_config.device_testing
         self.runnable: bool = self.specification.runnable
-        self.is_executable: State = self.should_be_executed(
-            self.build_only, self.device_testing, self.runnable, self.platform.type, self.platform.simulation
-        )
+        self.replay_logs: bool = self.twister_config.replay_logs
+        if self.replay_logs:
+            # output directory is set by build manager, but it is needed here to find build directory
+            self.specification.output_dir = Path(self.twister_config.output_dir).resolve()
+            self.is_executable: State = self.should_be_replayed(self.build_only, self.specification.build_dir)
+        else:
+            self.is_executable = self.should_be_executed(
+                self.build_only, self.device_testing, self.runnable, self.platform.type, self.platform.simulation
+            )
 
     @staticmethod
     def should_be_executed(build_only: bool, device_testing: bool, runnable: bool, platform_type: str,
@@ -71,7 +79,26 @@ class SetupTestManager:
             )
         return State(True)
 
+    @staticmethod
+    def should_be_replayed(build_only: bool, build_dir: str | Path) -> State:
+        """Verify if output of device saved by previous run can be replayed"""
+        if build_only:
+            return State(
+                False,
+                'Skipping test due to build-only being selected',
+                'Not replayed due to build-only being selected'
+            )
+        if not get_replay_log_file(build_dir).is_file():
+            return State(
+                False,
+                'Skipping test because there is no device output to replay',
+                'Not replayed because there is no device output in build directory'
+            )
+        return State(True)
+
     def get_device_type(self) -> str:
+        if self.replay_logs:
+            return 'replay'
         if self.platform.type == 'mcu':
             if not self.device_testing and self.platform.simulation != 'na':
                 # if device_testing was not chosen but simulation is accessible then try to run on simulator
@@ -1,19 +1,41 @@
 import logging
-from typing import Generator, Type
+import shutil
+from typing import TYPE_CHECKING, Generator, Type
 
 import pytest
 
 from twister2.builder.builder_abstract import BuilderAbstract
+from twister2.constants import RESULT_CACHE_PROPERTY
 from twister2.device.device_abstract import DeviceAbstract
+from twister2.device.device_pool import DevicePool
 from twister2.device.factory import DeviceFactory
+from twister2.device.hardware_map import HardwareMap
+from twister2.device.hardware_pool import HardwareLease, HardwareLeaseManager
+from twister2.device.replay_adapter import get_replay_log_file
 from twister2.fixtures.common import SetupTestManager
+from twister2.result_cache import ResultCache, compute_cache_key
+from twister2.yaml_test_function import YamlTestCase
+
+if TYPE_CHECKING:
+    from twister2.device.host_resources import Admission
 
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(scope='session')
+def dut_pool() -> Generator[DevicePool, None, None]:
+    """Return pool of devices reused by tests sharing a build (``--dut-scope=build``)."""
+    pool = DevicePool()
+    yield pool
+    pool.release()
+
+
 @pytest.fixture(scope='function')
 def dut(
-        builder: BuilderAbstract, setup_manager: SetupTestManager
+        request: pytest.FixtureRequest,
+        builder: BuilderAbstract,
+        setup_manager: SetupTestManager,
+        dut_pool: DevicePool,
 ) -> Generator[DeviceAbstract, None, None]:
     """Return device instance."""
     spec = setup_manager.specification
@@ -21,13 +43,71 @@ def dut(
     build_dir = setup_manager.specification.build_dir
     platform = setup_manager.platform
 
+    # yaml tests parse whole output from booting, so they always need a fresh device
+    reuse_device: bool = bool(
+        twister_config.dut_scope == 'build'
+        and setup_manager.is_executable
+        and not isinstance(request.function, YamlTestCase)
+    )
+    if reuse_device:
+        if (pooled_device := dut_pool.acquire(build_dir)) is not None:
+            logger.info('Reusing device for %s', build_dir)
+            pooled_device.device.reset(timeout=spec.timeout)
+            yield pooled_device.device
+            return
+    else:
+        # device kept by previous test must not hold board, host resources or log files needed by this one
+        dut_pool.release()
+
     if not (device_type := setup_manager.get_device_type()):
         msg = f'Handling of device type {platform.type} not implemented yet.'
         logger.error(msg)
         pytest.fail(msg)
 
+    result_cache: ResultCache | None = None
+    cache_key: str = ''
+    if twister_config.result_cache_dir and setup_manager.is_executable \
+            and isinstance(request.function, YamlTestCase) and device_type != 'replay':
+        result_cache = ResultCache(twister_config.result_cache_dir, twister_config.result_cache_expiry)
+        cache_key = compute_cache_key(twister_config, spec, device_type)
+        if cache_key and (cache_entry := result_cache.get(cache_key)) is not None:
+            # evaluate output saved by the same test which passed with identical image instead of running it
+            logger.info('Using result of %s from cache %s', cache_entry.nodeid, cache_entry.path)
+            shutil.copyfile(cache_entry.log_file, get_replay_log_file(build_dir))
+            request.node.user_properties.append((RESULT_CACHE_PROPERTY, 'hit'))
+            device_type = 'replay'
+            result_cache = None
+
     device_class: Type[DeviceAbstract] = DeviceFactory.get_device(device_type)
-    hardware_map = twister_config.get_hardware_map(platform=spec.platform)
+    fixture: str = spec.harness_config.get('fixture', '')
+    hardware_lease: HardwareLease | None = None
+    hardware_map: HardwareMap | None
+    if device_type == 'hardware' and setup_manager.is_executable:
+        # take exclusive lease on a board, it is shared with other xdist workers
+        lease_manager = HardwareLeaseManager(twister_config.hardware_map_list, twister_config.output_dir)
+        hardware_lease = lease_manager.acquire(platform=spec.platform, fixture=fixture)
+        hardware_map = hardware_lease.hardware_map
+    else:
+        hardware_map = twister_config.get_hardware_map(platform=spec.platform, fixture=fixture)
+
+    host_admission: Admission | None = None
+    if twister_config.resource_admission and device_type not in ('hardware', 'replay') \
+            and setup_manager.is_executable:
+        # wait until simulator fits in host resources shared with other xdist workers
+        from twister2.device.host_resources import (
+            HostResourceManager,
+            get_platform_cost,
+        )
+
+        host_resource_manager = HostResourceManager(
+            twister_config.output_dir, twister_config.host_ram_budget, twister_config.host_cpu_budget
+        )
+        host_admission = host_resource_manager.acquire(
+            platform=spec.platform,
+            cost=get_platform_cost(platform, twister_config.sim_ram_factor, twister_config.sim_cpus),
+        )
+        if host_admission.blocked_time:
+            request.node.user_properties.append(('admission_blocked_time', f'{host_admission.blocked_time:.3f}'))
 
     device = device_class(
         twister_config=twister_config,
@@ -35,18 +115,51 @@ def dut(
         build_dir=build_dir
     )
 
+    def teardown() -> None:
+        try:
+            if setup_manager.is_executable:
+                device.disconnect()
+                device.stop()
+        finally:
+            if hardware_lease is not None:
+                lease_manager.release(hardware_lease, nodeid=request.node.nodeid)
+            if host_admission is not None:
+                host_resource_manager.release(host_admission, nodeid=request.node.nodeid)
+
+    pooled: bool = False
+    test_finished: bool = False
+    log_offset: int = 0
     try:
         # check if test should be executed, if not than do not flash/run code on device
         if setup_manager.is_executable:
+            if result_cache is not None and (log_file := get_replay_log_file(build_dir)).is_file():
+                # only output of this test is saved in cache
+                log_offset = log_file.stat().st_size
             device.connect()
             device.generate_command(build_dir)
             device.initialize_log_files(build_dir)
             device.flash_and_run(timeout=spec.timeout)
             device.connect()
+        if reuse_device:
+            dut_pool.put(build_dir, device, finalizer=teardown)
+            pooled = True
         yield device
+        test_finished = True
     except KeyboardInterrupt:
         pass
     finally:  # to make sure we close all running processes after user broke execution
-        if setup_manager.is_executable:
-            device.disconnect()
-            device.stop()
+        try:
+            if not pooled:
+                teardown()
+            if result_cache is not None and test_finished and not getattr(request.node, '_test_failed', False):
+                result_cache.put(cache_key, request.node.nodeid, get_replay_log_file(build_dir), log_offset)
+        finally:
+            if setup_manager.is_executable:
+                _report_startup_time(request, device)
+
+
+def _report_startup_time(request: pytest.FixtureRequest, device: DeviceAbstract) -> None:
+    """Store in user properties how application was launched and how long it took."""
+    if device.launcher and device.startup_time is not None:
+        request.node.user_properties.append(('launcher', device.launcher))
+        request.node.user_properties.append(('startup_time', f'{device.startup_time:.3f}'))
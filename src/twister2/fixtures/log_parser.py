@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import logging
+from typing import Generator
 
 import pytest
 from pytest_subtests import SubTests
 
 from twister2.device.device_abstract import DeviceAbstract
+from twister2.device.device_pool import DevicePool
 from twister2.fixtures.common import SetupTestManager
 from twister2.log_parser.factory import LogParserFactory
 from twister2.log_parser.log_parser_abstract import LogParserAbstract
@@ -15,21 +17,36 @@ logger = logging.getLogger(__name__)
 
 @pytest.fixture(scope='function')
 def log_parser(
-        dut: DeviceAbstract, subtests: SubTests, setup_manager: SetupTestManager
-) -> LogParserAbstract | None:
+        dut: DeviceAbstract, subtests: SubTests, setup_manager: SetupTestManager, dut_pool: DevicePool
+) -> Generator[LogParserAbstract | None, None, None]:
     """Return log parser."""
     spec = setup_manager.specification
+    twister_config = setup_manager.twister_config
+    timeout_multiplier = setup_manager.platform.testing.timeout_multiplier
 
     parser_name = spec.harness or 'ztest'  # make ztest default parser
     harness_config = spec.harness_config
     ignore_faults = spec.ignore_faults
 
     # check if test should be executed, if not than do not create log parser as it won't be used
-    if setup_manager.is_executable:
-        parser_class = LogParserFactory.get_parser(parser_name)
-        return parser_class(stream=dut.iter_stdout,
-                            harness_config=harness_config,
-                            ignore_faults=ignore_faults,
-                            subtests_fixture=subtests)
-    else:
-        return None
+    if not setup_manager.is_executable:
+        yield None
+        return
+
+    # in batch mode results of testcases are reported with test report (see TwisterExtPlugin)
+    subtests_fixture = subtests if twister_config.subtest_reporting == 'case' else None
+
+    parser_class = LogParserFactory.get_parser(parser_name)
+    parser = parser_class(stream=dut.iter_stdout,
+                          harness_config=harness_config,
+                          ignore_faults=ignore_faults,
+                          subtests_fixture=subtests_fixture,
+                          inactivity_timeout=twister_config.inactivity_timeout * timeout_multiplier,
+                          testcase_timeout=twister_config.testcase_timeout * timeout_multiplier)
+    yield parser
+
+    if parser.device_hung and (pooled_device := dut_pool.find(spec.build_dir)) is not None:
+        # do not reuse hung device by next tests
+        logger.info('Device for %s hung, it will not be reused', spec.build_dir)
+        if pooled_device.device is dut:
+            dut_pool.release()
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+import glob
 import logging
 import os.path
 import platform
+import re
 import shlex
 from pathlib import Path
-
-import yaml.parser
+from typing import TYPE_CHECKING
 
 from twister2.exceptions import TwisterException
 
+if TYPE_CHECKING:
+    import pytest
+
+    from twister2.yaml_test_specification import YamlTestSpecification
+
 _WINDOWS = (platform.system() == 'Windows')
 
 logger = logging.getLogger(__name__)
 
+_ARCHIVE_SUFFIX_PATTERN = re.compile(r'_(?P<date>\d{12})(?:_(?P<index>\d+))?')
+
 
 def string_to_set(value: str | set) -> set[str]:
     if isinstance(value, str):
@@ -37,6 +45,9 @@ def safe_load_yaml(filename: Path) -> dict:
     :return: data read from yaml file
     """
     __tracebackhide__ = True
+    # helper is imported by pytest plugin also when twister is not active, so PyYAML is imported when used
+    import yaml.parser
+
     with filename.open(encoding='UTF-8') as file:
         try:
             data = yaml.safe_load(file)
@@ -71,3 +82,51 @@ def normalize_filename(filename: str) -> str:
     filename = os.path.expanduser(os.path.expandvars(filename))
     filename = os.path.normpath(os.path.abspath(filename))
     return filename
+
+
+def find_archived_output_dirs(output_dir: str | Path, extension: str = '') -> list[Path]:
+    """
+    Return output directories archived by previous runs, the latest first.
+
+    Archived directory is named `<output_dir>_<date>` or `<output_dir>_<date>_<index>`
+    when several output directories were modified at the same second.
+
+    :param output_dir: output directory
+    :param extension: return also files with this extension (e.g. compressed archives)
+    """
+    output_dir = Path(output_dir)
+    archives: dict[Path, tuple[str, int]] = {}
+    for path in output_dir.parent.glob(f'{glob.escape(output_dir.name)}_*'):
+        name = path.name
+        if extension and name.endswith(extension) and path.is_file():
+            name = name[:-len(extension)]
+        elif not path.is_dir():
+            continue
+        if match := _ARCHIVE_SUFFIX_PATTERN.fullmatch(name[len(output_dir.name):]):
+            archives[path] = (match.group('date'), int(match.group('index') or 0))
+    return sorted(archives, key=lambda path: archives[path], reverse=True)
+
+
+def get_item_specification(item: pytest.Item) -> YamlTestSpecification | None:
+    """
+    Return test specification of item or None if test is not built.
+
+    Specification is also taken from the item itself (YAML test function or
+    parameter of regular test), because it is added to `session.specifications`
+    by plugins in `pytest_collection_modifyitems` and hooks running before
+    them would not find it there.
+    """
+    if spec := getattr(item.session, 'specifications', {}).get(item.nodeid):
+        return spec
+    if spec := getattr(getattr(item, 'function', None), 'spec', None):
+        return spec
+    if callspec := getattr(item, 'callspec', None):
+        return callspec.params.get('specification')
+    return None
+
+
+def get_build_dir(item: pytest.Item) -> str:
+    """Return build directory of test or its node id if test is not built."""
+    if spec := get_item_specification(item):
+        return str(spec.build_dir)
+    return item.nodeid
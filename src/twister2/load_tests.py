@@ -8,7 +8,7 @@ import json
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Generator
+from typing import IO, Any, Generator
 
 import pytest
 
@@ -19,6 +19,102 @@ from twister2.yaml_test_function import YamlFunction, yaml_test_function_factory
 
 logger = logging.getLogger(__name__)
 
+TEST_FILE_NAMES: tuple[str, ...] = ('testcase.yaml', 'sample.yaml')
+
+
+class _JsonStream:
+    """Decode JSON document part by part, reading file in chunks."""
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, file: IO[str], chunk_size: int) -> None:
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer: str = ''
+        self.pos: int = 0
+        self.eof: bool = False
+
+    def _read_more(self) -> bool:
+        if self.eof:
+            return False
+        if not (chunk := self.file.read(self.chunk_size)):
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def next_char(self) -> str:
+        """Return next not white character and move after it."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                self.pos += 1
+                return self.buffer[self.pos - 1]
+            if not self._read_more():
+                raise ValueError('Unexpected end of JSON document')
+
+    def peek_char(self) -> str:
+        """Return next not white character without moving after it."""
+        char = self.next_char()
+        self.pos -= 1
+        return char
+
+    def expect(self, expected: str) -> None:
+        if (char := self.next_char()) != expected:
+            raise ValueError(f'Expected "{expected}" in JSON document, found "{char}"')
+
+    def decode(self) -> Any:
+        """Return next JSON value."""
+        self.peek_char()  # skip white characters
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._read_more():
+                    continue
+                raise
+            # value at the end of buffer (e.g. number) can be continued in next chunk
+            if end == len(self.buffer) and self._read_more():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(filename: str | Path, key: str, chunk_size: int = 1024 * 1024) -> Generator[Any, None, None]:
+    """
+    Return items of array stored under key of JSON object saved in file.
+
+    File is read in chunks and each item is decoded separately, so the whole
+    document is never kept in memory.
+
+    :param filename: path to JSON file
+    :param key: key of array in top-level object
+    :param chunk_size: number of characters read at once
+    """
+    with open(filename, encoding='UTF-8') as file:
+        stream = _JsonStream(file, chunk_size)
+        stream.expect('{')
+        if stream.peek_char() == '}':
+            return
+        while True:
+            name = stream.decode()
+            stream.expect(':')
+            if name != key:
+                stream.decode()  # skip value
+            else:
+                stream.expect('[')
+                if stream.peek_char() == ']':
+                    stream.next_char()
+                else:
+                    while True:
+                        yield stream.decode()
+                        if stream.next_char() == ']':
+                            break
+            if stream.next_char() == '}':
+                return
+
 
 @dataclass
 class LoadedTestData:
@@ -32,19 +128,16 @@ class LoadedTestData:
 
     @classmethod
     def load_from_testplan(cls, filename: str | Path) -> Generator[LoadedTestData, None, None]:
-        with open(filename) as file:
-            test_data = json.load(file)
-        for ts in test_data['testsuites']:
+        test_files: dict[str, Path | None] = {}  #: yaml test file found in test directory
+        for ts in iter_json_array(filename, 'testsuites'):
             if 'nodeid' in ts and '.py::' in ts['nodeid']:
                 logger.debug('Not supported for regular python tests: %s' % ts['nodeid'])
                 continue
             testdir, testname = ts['name'].rsplit('/', 1)
-            testfile = Path(testdir) / 'testcase.yaml'
-            if not testfile.exists():
-                testfile = Path(testdir) / 'sample.yaml'
-                if not testfile.exists():
-                    logger.info(f'Not found yaml test file in {testdir}')
-                    continue
+            if testdir not in test_files:
+                test_files[testdir] = _find_test_file(Path(testdir))
+            if (testfile := test_files[testdir]) is None:
+                continue
             yield LoadedTestData(
                 testfile=testfile,
                 testname=testname,
@@ -55,18 +148,38 @@ class LoadedTestData:
             )
 
 
+def _find_test_file(testdir: Path) -> Path | None:
+    """Return yaml test file from test directory."""
+    for name in TEST_FILE_NAMES:
+        if (testfile := testdir / name).exists():
+            return testfile
+    logger.info(f'Not found yaml test file in {testdir}')
+    return None
+
+
 class LoadedTest(pytest.File):
     """Class for collecting tests from a testplan file."""
 
 
 def collect_tests_from_testplan(twister_config: TwisterConfig, session) -> Generator[YamlFunction, None, None]:
     """Return a list of yaml tests."""
+    # tests from the same yaml file share processor, so the file is parsed only once
+    processors: dict[Path, YamlSpecificationProcessor] = {}
+    nodes: dict[Path, LoadedTest] = {}
 
     for loaded in LoadedTestData.load_from_testplan(twister_config.load_tests_path):
         if twister_config.only_failed and loaded.status not in ['error', 'failed']:
             continue
 
-        processor = YamlSpecificationProcessor(twister_config, loaded.testfile)
+        if (processor := processors.get(loaded.testfile)) is None:
+            # absolute path is needed to place build directory relative to zephyr base,
+            # in the same directory as when tests were collected from yaml files
+            processor = processors[loaded.testfile] = YamlSpecificationProcessor(
+                twister_config, loaded.testfile.resolve()
+            )
+            nodes[loaded.testfile] = LoadedTest.from_parent(
+                parent=session, path=loaded.testfile, nodeid=str(loaded.testfile)
+            )
         platform_spec: PlatformSpecification = twister_config.get_platform(loaded.platform)
         test_spec_dict = processor.prepare_spec_dict(platform_spec, loaded.testname)
         test_spec = processor.create_spec_from_dict(test_spec_dict, platform_spec)
@@ -76,8 +189,7 @@ def collect_tests_from_testplan(twister_config: TwisterConfig, session) -> Gener
         if loaded.status in ['error', 'failed']:
             test_spec.retries = loaded.retries + 1
 
-        node = LoadedTest.from_parent(parent=session, path=loaded.testfile, nodeid=str(loaded.testfile))
-        test_function: YamlFunction = yaml_test_function_factory(spec=test_spec, parent=node)
+        test_function: YamlFunction = yaml_test_function_factory(spec=test_spec, parent=nodes[loaded.testfile])
         yield test_function
 
 
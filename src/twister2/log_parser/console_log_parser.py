@@ -18,12 +18,30 @@ ZEPHYR_FATAL_ERROR: str = 'ZEPHYR FATAL ERROR'
 ONE_LINE: str = 'one_line'
 MULTI_LINE: str = 'multi_line'
 
+#: number of lines matched by combined pattern only due to already found patterns after which it is rebuilt
+FALSE_HITS_BEFORE_REBUILD: int = 64
+BACK_REFERENCE_RE_PATTERN: re.Pattern = re.compile(r'\\[1-9]|\(\?P=')
+
+
+def strip_wildcards(regex: str) -> str:
+    """
+    Remove leading and trailing `.*` from regex.
+
+    They do not change if `search` finds a match in a line, but they make
+    the alternation of many patterns very slow.
+    """
+    if regex.startswith('.*') and not regex.startswith(('.*?', '.*+')):
+        regex = regex[2:]
+    if regex.endswith('.*') and not regex.endswith('\\.*'):
+        regex = regex[:-2]
+    return regex
+
 
 class ConsoleLogParser(LogParserAbstract):
     """Console log parser."""
 
     def __init__(self, stream: Iterator[str], *, harness_config: dict, **kwargs):
-        super().__init__(stream)
+        super().__init__(stream, **kwargs)
         self.harness_config = harness_config
         self.matched_lines: list[str] = []
         self.type: str = harness_config.get('type', '')
@@ -33,6 +51,14 @@ class ConsoleLogParser(LogParserAbstract):
         self.parse_method = self._get_parse_method()
         for regex in self.regex:
             self.patterns.append(re.compile(regex))
+        self._next_pattern_idx: int = 0  #: index of the next expected pattern for ordered lines
+        #: patterns not found yet for not ordered lines, the key is an index of pattern
+        self._remaining_patterns: dict[int, re.Pattern] = dict(enumerate(self.patterns))
+        #: alternation of remaining patterns, which checks a line with a single regex call
+        self._combined_pattern: re.Pattern | None = None
+        self._combined_patterns_count: int = 0
+        self._combine_patterns: bool = True
+        self._false_hits: int = 0
 
         if not self.patterns:
             raise TwisterHarnessParserException('At least one regex must be provided')
@@ -50,18 +76,28 @@ class ConsoleLogParser(LogParserAbstract):
 
     def parse(self, timeout: float = 60) -> None:
         logger.debug('%s: Parsing output', self.__class__.__name__)
-        end_time = time.time() + timeout
+        self.last_output_time = time.time()
+        end_time = self.last_output_time + timeout
         while self.stream:
-            if time.time() > end_time:
+            now = time.time()
+            if now > end_time:
                 self.state = self.STATE.FAILED
                 self.messages.append(f'Did not find expected messages in {timeout} seconds')
                 break
+            if self._device_is_inactive(now):
+                break
 
             try:
                 line = next(self.stream)
             except StopIteration:
                 break
 
+            if not line:
+                # device is silent
+                continue
+
+            if self.inactivity_timeout:
+                self.last_output_time = time.time()
             logger.info(line.rstrip())
             if self.parse_method(line):
                 logger.info('Console parser found expected lines')
@@ -79,10 +115,10 @@ class ConsoleLogParser(LogParserAbstract):
         return False
 
     def _parse_ordered_multi_lines(self, line: str) -> bool:
-        if self.patterns:
-            if self.patterns[0].search(line):
+        if self._next_pattern_idx < len(self.patterns):
+            if self.patterns[self._next_pattern_idx].search(line):
                 self.matched_lines.append(line)
-                self.patterns.pop(0)
+                self._next_pattern_idx += 1
 
         if len(self.matched_lines) == len(self.regex):
             self.state = self.STATE.PASSED
@@ -90,13 +126,50 @@ class ConsoleLogParser(LogParserAbstract):
         return False
 
     def _parse_not_ordered_multi_lines(self, line: str) -> bool:
-        for idx, pattern in enumerate(self.patterns):
-            if pattern.search(line):
-                self.matched_lines.append(line)
-                self.patterns.pop(idx)
-                break
+        if self._combine_patterns and self._combined_pattern_is_stale():
+            self._build_combined_pattern()
+
+        # only lines found by combined pattern are checked with each remaining pattern
+        if self._combined_pattern is None or self._combined_pattern.search(line):
+            for idx, pattern in self._remaining_patterns.items():
+                if pattern.search(line):
+                    self.matched_lines.append(line)
+                    del self._remaining_patterns[idx]
+                    break
+            else:
+                self._false_hits += 1
 
         if len(self.matched_lines) == len(self.regex):
             self.state = self.STATE.PASSED
             return True
         return False
+
+    def _combined_pattern_is_stale(self) -> bool:
+        """
+        Return True if combined pattern should be rebuilt.
+
+        Compiling the alternation of all remaining patterns is much more expensive
+        than searching a line, so it is not rebuilt after each found pattern, but
+        when half of patterns were found or when found patterns caused many false hits.
+        """
+        return (
+            self._combined_pattern is None
+            or len(self._remaining_patterns) <= self._combined_patterns_count // 2
+            or self._false_hits >= FALSE_HITS_BEFORE_REBUILD
+        )
+
+    def _build_combined_pattern(self) -> None:
+        patterns = list(self._remaining_patterns.values())
+        try:
+            if any(BACK_REFERENCE_RE_PATTERN.search(p.pattern) for p in patterns):
+                # group numbers are shifted in combined pattern
+                raise re.error('back references are not supported')
+            self._combined_pattern = re.compile('|'.join(f'(?:{strip_wildcards(p.pattern)})' for p in patterns))
+        except re.error as e:
+            # e.g. patterns with duplicated group names or global flags cannot be combined
+            logger.debug('Cannot combine harness patterns, they will be checked one by one: %s', e)
+            self._combined_pattern = None
+            self._combine_patterns = False
+            return
+        self._combined_patterns_count = len(self._remaining_patterns)
+        self._false_hits = 0
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import abc
 import enum
+import logging
+import time
 from typing import Iterator
 
+logger = logging.getLogger(__name__)
+
 
 class LogParserState(str, enum.Enum):
     UNKNOWN = 'UNKNOWN'
@@ -14,14 +18,33 @@ class LogParserState(str, enum.Enum):
 class LogParserAbstract(abc.ABC):
     STATE = LogParserState
 
-    def __init__(self, stream: Iterator[str], **kwargs):
+    def __init__(self, stream: Iterator[str], *, inactivity_timeout: float = 0, **kwargs):
+        """
+        :param stream: output from device
+        :param inactivity_timeout: time in seconds without any output from device
+            after which parsing is stopped (0 disables it)
+        """
         self.stream = stream
         self.state: LogParserState = self.STATE.UNKNOWN  #: overall state for execution test suite
         self.messages: list[str] = []  #: keeps errors from execution
+        self.inactivity_timeout: float = inactivity_timeout
+        self.last_output_time: float = time.time()  #: time when the last not empty line was received
+        self.device_hung: bool = False  #: True if parsing was stopped because device stopped responding
 
     def __repr__(self):
         return f'{self.__class__.__name__}()'
 
+    def _device_is_inactive(self, now: float) -> bool:
+        """Return True if device did not produce any output for longer than inactivity timeout."""
+        if not self.inactivity_timeout or now - self.last_output_time <= self.inactivity_timeout:
+            return False
+        msg = f'No output from device for {self.inactivity_timeout} seconds'
+        logger.error(msg)
+        self.state = self.STATE.FAILED
+        self.device_hung = True
+        self.messages.append(msg)
+        return True
+
     @abc.abstractmethod
     def parse(self, timeout: float = 60) -> None:
         """Parse output from device and set appropriate parser status"""
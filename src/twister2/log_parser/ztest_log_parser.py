@@ -8,7 +8,7 @@ import logging
 import re
 import time
 from dataclasses import dataclass
-from typing import Iterator
+from typing import Callable, Iterator
 
 import pytest
 from pytest_subtests import SubTests
@@ -19,11 +19,18 @@ from twister2.log_parser.log_parser_abstract import LogParserAbstract
 PROJECT_EXECUTION_SUCCESSFUL: str = 'PROJECT EXECUTION SUCCESSFUL'
 PROJECT_EXECUTION_FAILED: str = 'PROJECT EXECUTION FAILED'
 ZEPHYR_FATAL_ERROR: str = 'ZEPHYR FATAL ERROR'
+PROJECT_EXECUTION_KEYWORD: str = 'PROJECT EXECUTION'
 
+TESTSUITE_KEYWORD: str = 'Running TESTSUITE'
+TESTCASE_START_KEYWORD: str = 'START - '
+RESULT_KEYWORD: str = ' seconds'
+
+# patterns are searched only in lines containing the keyword, so they do not need leading `^.*`
 result_re_pattern: re.Pattern = re.compile(
-    r'^.*(?P<result>PASS|FAIL|SKIP|BLOCK) - (test_)?(?P<testname>.*) in (?P<duration>[\d\.]+) seconds$'
+    r'(?P<result>PASS|FAIL|SKIP|BLOCK) - (test_)?(?P<testname>.*) in (?P<duration>[\d\.]+) seconds$'
 )
-testsuite_name_re_pattern: re.Pattern = re.compile(r'^.*Running TESTSUITE\s(?P<testsuite>.*)$')
+testsuite_name_re_pattern: re.Pattern = re.compile(r'Running TESTSUITE\s(?P<testsuite>.*)$')
+testcase_start_re_pattern: re.Pattern = re.compile(r'START - (test_)?(?P<testname>\S+)')
 
 logger = logging.getLogger(__name__)
 
@@ -37,21 +44,52 @@ class ZtestLogParser(LogParserAbstract):
         *,
         ignore_faults: bool = False,
         subtests_fixture: SubTests | None = None,
+        testcase_timeout: float = 0,
         **kwargs
     ):
+        """
+        :param stream: output from device
+        :param ignore_faults: do not fail on Zephyr fatal error
+        :param subtests_fixture: fixture used to report results of testcases
+        :param testcase_timeout: time in seconds for single testcase after
+            which it is reported as hung (0 disables it)
+        """
         super().__init__(stream, **kwargs)
         self.subtests_fixture: SubTests = subtests_fixture
         self.ignore_faults: bool = ignore_faults
+        self.testcase_timeout: float = testcase_timeout
         self.detected_suite_names: list[str] = []
         self.subtest_results: list[SubTestResult] = []
+        self.current_testcase: str = ''  #: name of started testcase without result yet
+        self._testcase_start_time: float = 0.0
 
     def parse(self, timeout: float = 60) -> None:
         """Parse logs and create list of subtests with statuses."""
-        end_time = time.time() + timeout
+        # Most of lines contain none of keywords, so checking them with `in`
+        # is much cheaper than matching all patterns against each line.
+        # Handler of each keyword found in line is called, it returns True
+        # when parsing is finished.
+        handlers: list[tuple[str, Callable[[str], bool]]] = [
+            (PROJECT_EXECUTION_FAILED, self._handle_execution_failed),
+            (PROJECT_EXECUTION_SUCCESSFUL, self._handle_execution_successful),
+            (TESTSUITE_KEYWORD, self._handle_testsuite),
+            (TESTCASE_START_KEYWORD, self._handle_testcase_start),
+            (RESULT_KEYWORD, self._handle_result),
+        ]
+        if not self.ignore_faults:
+            handlers.insert(2, (ZEPHYR_FATAL_ERROR, self._handle_fatal_error))
+        debug_enabled: bool = logger.isEnabledFor(logging.DEBUG)
+
+        self.last_output_time = time.time()
+        end_time = self.last_output_time + timeout
         while self.stream:
-            if time.time() > end_time:
+            now = time.time()
+            if now > end_time:
                 self.messages.append('Timeout')
                 return
+            if self._device_is_inactive(now) or self._testcase_is_hung(now):
+                self._report_hung_testcase(now)
+                return
 
             try:
                 line = next(self.stream)
@@ -59,35 +97,86 @@ class ZtestLogParser(LogParserAbstract):
                 return
 
             if not line:
+                # device is silent
                 continue
 
-            logger.debug(line.rstrip())
-            if PROJECT_EXECUTION_FAILED in line:
-                logger.error('PROJECT EXECUTION FAILED')
-                self.state = self.STATE.FAILED
-                self.messages.append('Project execution failed')
-                return  # exit: tests finished
-
-            if PROJECT_EXECUTION_SUCCESSFUL in line:
-                self.state = self.STATE.FAILED if self.state == self.STATE.FAILED else self.STATE.PASSED
-                logger.info('PROJECT EXECUTION SUCCESSFUL')
-                return  # exit: tests finished
-
-            if ZEPHYR_FATAL_ERROR in line and not self.ignore_faults:
-                logger.error('ZEPHYR FATAL ERROR')
-                self.state = self.STATE.FAILED
-                raise TwisterFatalError('Zephyr fatal error')
-
-            if match := testsuite_name_re_pattern.match(line):
-                test_suite_name = match.group(1)
-                logger.info('Found test suite: %s', test_suite_name)
-                self.detected_suite_names.append(test_suite_name)
-
-            if result_match := result_re_pattern.match(line):
-                subtest = SubTestResult(**result_match.groupdict())  # type: ignore
-                self.subtest_results.append(subtest)
-                logger.info('Ztest: %s - %s in %s', subtest.testname, subtest.result, subtest.duration)
-                self._register_pytest_subtests(subtest)
+            if self.inactivity_timeout:
+                self.last_output_time = time.time()
+            if debug_enabled:
+                logger.debug(line.rstrip())
+            if not (
+                RESULT_KEYWORD in line or TESTCASE_START_KEYWORD in line or TESTSUITE_KEYWORD in line
+                or PROJECT_EXECUTION_KEYWORD in line or ZEPHYR_FATAL_ERROR in line
+            ):
+                continue
+            for keyword, handler in handlers:
+                if keyword in line and handler(line):
+                    return
+
+    def _handle_execution_failed(self, line: str) -> bool:
+        logger.error('PROJECT EXECUTION FAILED')
+        self.state = self.STATE.FAILED
+        self.messages.append('Project execution failed')
+        return True  # exit: tests finished
+
+    def _handle_execution_successful(self, line: str) -> bool:
+        self.state = self.STATE.FAILED if self.state == self.STATE.FAILED else self.STATE.PASSED
+        logger.info('PROJECT EXECUTION SUCCESSFUL')
+        return True  # exit: tests finished
+
+    def _handle_fatal_error(self, line: str) -> bool:
+        logger.error('ZEPHYR FATAL ERROR')
+        self.state = self.STATE.FAILED
+        raise TwisterFatalError('Zephyr fatal error')
+
+    def _handle_testsuite(self, line: str) -> bool:
+        if match := testsuite_name_re_pattern.search(line):
+            test_suite_name = match.group(1)
+            logger.info('Found test suite: %s', test_suite_name)
+            self.detected_suite_names.append(test_suite_name)
+        return False
+
+    def _handle_testcase_start(self, line: str) -> bool:
+        if match := testcase_start_re_pattern.search(line):
+            self.current_testcase = match.group('testname')
+            self._testcase_start_time = time.time()
+        return False
+
+    def _testcase_is_hung(self, now: float) -> bool:
+        """Return True if started testcase did not finish within testcase timeout."""
+        if not (self.testcase_timeout and self.current_testcase):
+            return False
+        if now - self._testcase_start_time <= self.testcase_timeout:
+            return False
+        msg = f'Testcase {self.current_testcase} did not finish in {self.testcase_timeout} seconds'
+        logger.error(msg)
+        self.state = self.STATE.FAILED
+        self.device_hung = True
+        self.messages.append(msg)
+        return True
+
+    def _report_hung_testcase(self, now: float) -> None:
+        """Report testcase which was running when device hung as failed subtest."""
+        if not self.current_testcase:
+            return
+        subtest = SubTestResult(
+            testname=self.current_testcase,
+            result=SubTestStatus.FAIL,
+            duration=round(now - self._testcase_start_time, 3),
+            message=f'Subtest {self.current_testcase} hung: {self.messages[-1]}',
+        )
+        self.current_testcase = ''
+        self.subtest_results.append(subtest)
+        self._register_pytest_subtests(subtest)
+
+    def _handle_result(self, line: str) -> bool:
+        if result_match := result_re_pattern.search(line):
+            self.current_testcase = ''
+            subtest = SubTestResult(**result_match.groupdict())  # type: ignore
+            self.subtest_results.append(subtest)
+            logger.info('Ztest: %s - %s in %s', subtest.testname, subtest.result, subtest.duration)
+            self._register_pytest_subtests(subtest)
+        return False
 
     def _register_pytest_subtests(self, subtest: SubTestResult):
         """
@@ -102,7 +191,7 @@ class ZtestLogParser(LogParserAbstract):
                 pytest.skip('Skipped on runtime')
             if subtest.result == SubTestStatus.BLOCK:
                 pytest.skip('Blocked')
-            assert subtest.result == SubTestStatus.PASS, f'Subtest {subtest.testname} failed'
+            assert subtest.result == SubTestStatus.PASS, subtest.message or f'Subtest {subtest.testname} failed'
 
 
 class SubTestStatus(str, enum.Enum):
@@ -121,6 +210,7 @@ class SubTestResult:
     testname: str
     result: SubTestStatus
     duration: float
+    message: str = ''  #: reason of failure if it was not reported by test itself
 
     def __post_init__(self):
         if isinstance(self.duration, str):
@@ -130,8 +220,11 @@ class SubTestResult:
 
     def asdict(self) -> dict:
         """Return JSON serialized dictionary."""
-        return dict(
+        data = dict(
             testname=self.testname,
             result=str(self.result),
             duration=self.duration
         )
+        if self.message:
+            data['message'] = self.message
+        return data
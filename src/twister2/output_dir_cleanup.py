@@ -0,0 +1,207 @@
+"""
+Remove and archive output directories of previous runs in background.
+
+Output directory may contain hundreds of thousands of files, so deleting it
+takes long time. It is renamed to hidden trash directory in the same parent
+directory, which is immediate and atomic, and trash is deleted by a detached
+process while tests are collected and run. Archiving is a rename as well.
+Older archives can be compressed to tarballs and only the newest archives are
+kept; the latest archive is always kept as directory, because it is read by
+some features (e.g. ordering tests by duration) during the session.
+
+The background process is started as ``python -m twister2.output_dir_cleanup``.
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import glob
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tarfile
+import time
+from pathlib import Path
+
+from twister2.helper import find_archived_output_dirs
+
+logger = logging.getLogger(__name__)
+
+TRASH_DIR_MARKER: str = '.trash_'
+ARCHIVE_EXTENSION: str = '.tar.gz'
+
+#: background processes started by session, reference is kept until the end of session
+_processes: list[subprocess.Popen] = []
+
+
+def find_trash_dirs(output_dir: str | Path) -> list[Path]:
+    """Return trash directories left by output directory and its archives (e.g. when deletion was interrupted)."""
+    output_dir = Path(output_dir)
+    pattern = re.compile(rf'\.{re.escape(output_dir.name)}(_\d{{12}}(_\d+)?)?{re.escape(TRASH_DIR_MARKER)}\d+')
+    return sorted(
+        path for path in output_dir.parent.glob(f'.{glob.escape(output_dir.name)}*{TRASH_DIR_MARKER}*')
+        if pattern.fullmatch(path.name)
+    )
+
+
+def move_to_trash(directory: str | Path) -> Path | None:
+    """
+    Rename directory to hidden trash directory.
+
+    :param directory: directory to remove
+    :return: path to trash directory or None if directory cannot be renamed
+    """
+    directory = Path(directory)
+    trash_dir = directory.with_name(f'.{directory.name}{TRASH_DIR_MARKER}{time.time_ns()}')
+    try:
+        os.rename(directory, trash_dir)
+    except OSError as e:
+        logger.warning('Cannot move %s to trash: %s', directory, e)
+        return None
+    return trash_dir
+
+
+def archive_output_dir(output_dir: str | Path) -> Path:
+    """
+    Rename output directory to `<output_dir>_<date of modification>`.
+
+    :param output_dir: output directory
+    :return: path to archived directory
+    """
+    output_dir = Path(output_dir)
+    file_date = datetime.datetime.fromtimestamp(os.path.getmtime(output_dir)).strftime('%y%m%d%H%M%S')
+    archived_dir = Path(f'{output_dir}_{file_date}')
+    index = 0
+    while archived_dir.exists() or Path(f'{archived_dir}{ARCHIVE_EXTENSION}').exists():
+        index += 1
+        archived_dir = Path(f'{output_dir}_{file_date}_{index}')
+    try:
+        os.rename(output_dir, archived_dir)
+    except OSError:
+        # e.g. output directory is mount point
+        shutil.move(str(output_dir), archived_dir)
+    return archived_dir
+
+
+def find_archives(output_dir: str | Path) -> list[Path]:
+    """Return archived directories and compressed archives of output directory, the latest first."""
+    return find_archived_output_dirs(output_dir, extension=ARCHIVE_EXTENSION)
+
+
+def compress_directory(directory: str | Path) -> Path:
+    """
+    Compress directory to tarball next to it and remove the directory.
+
+    :param directory: directory to compress
+    :return: path to tarball
+    """
+    directory = Path(directory)
+    tarball = Path(f'{directory}{ARCHIVE_EXTENSION}')
+    # tarball gets its final name when it is complete
+    tmp_tarball = directory.with_name(f'.{tarball.name}.{os.getpid()}')
+    with tarfile.open(tmp_tarball, 'w:gz') as tar:
+        tar.add(directory, arcname=directory.name)
+    os.replace(tmp_tarball, tarball)
+    remove(directory)
+    return tarball
+
+
+def remove(path: str | Path) -> None:
+    """Remove file or directory tree."""
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path, ignore_errors=True)
+    elif os.path.lexists(path):
+        os.unlink(path)
+
+
+def start_background_cleanup(delete: list[Path], compress: list[Path]) -> subprocess.Popen | None:
+    """
+    Start detached process removing and compressing given paths.
+
+    Process is not stopped together with session, so interrupted session does
+    not leave directory deleted only partially.
+
+    :param delete: files and directories to remove
+    :param compress: directories to compress
+    :return: started process or None if there is nothing to do
+    """
+    if not delete and not compress:
+        return None
+    args = [sys.executable, '-m', __name__]
+    args.extend(f'--delete={path}' for path in delete)
+    args.extend(f'--compress={path}' for path in compress)
+    process = subprocess.Popen(
+        args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    _processes.append(process)
+    logger.debug('Started cleanup of previous artifacts in background (pid %d)', process.pid)
+    return process
+
+
+def clean_output_dir(output_dir: str | Path, choice: str, keep_archives: int = 0,
+                     compress_archives: bool = False) -> Path | None:
+    """
+    Delete or archive output directory of previous run.
+
+    :param output_dir: output directory
+    :param choice: `delete` or `archive`
+    :param keep_archives: number of the newest archives to keep, 0 keeps all
+    :param compress_archives: compress archives except the latest one
+    :return: path to archived directory
+    """
+    delete: list[Path] = find_trash_dirs(output_dir)
+    compress: list[Path] = []
+    archived_dir: Path | None = None
+    if choice == 'delete':
+        if (trash_dir := move_to_trash(output_dir)) is None:
+            shutil.rmtree(output_dir, ignore_errors=True)
+        else:
+            delete.append(trash_dir)
+    elif choice == 'archive':
+        archived_dir = archive_output_dir(output_dir)
+        archives = find_archives(output_dir)
+        if keep_archives > 0:
+            for path in archives[keep_archives:]:
+                # archives are moved away at once, so they are not found by session any more
+                if path.is_dir() and (trash_dir := move_to_trash(path)) is not None:
+                    delete.append(trash_dir)
+                else:
+                    delete.append(path)
+            archives = archives[:keep_archives]
+        if compress_archives:
+            compress.extend(
+                path for path in archives[1:]
+                if path.is_dir() and not Path(f'{path}{ARCHIVE_EXTENSION}').exists()  # already compressed
+            )
+    start_background_cleanup(delete, compress)
+    return archived_dir
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Remove and compress output directories of twister')
+    parser.add_argument('--delete', action='append', default=[], help='path to remove')
+    parser.add_argument('--compress', action='append', default=[], help='directory to compress')
+    args = parser.parse_args(argv)
+    # compressed archives take less space, so they are created first
+    for path in args.compress:
+        try:
+            compress_directory(path)
+        except (OSError, tarfile.TarError) as e:
+            logger.error('Cannot compress %s: %s', path, e)
+    for path in args.delete:
+        try:
+            remove(path)
+        except OSError as e:
+            logger.error('Cannot remove %s: %s', path, e)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -170,6 +170,22 @@ def validate_platforms_list(platforms: list[PlatformSpecification]) -> None:
         pytest.exit(f'There are duplicated platforms: {", ".join(duplicated)}')
 
 
+def get_board_roots(zephyr_base: str, board_root: str | None = None) -> list[str]:
+    """
+    Return directories with platform definitions.
+
+    :param zephyr_base: path to Zephyr directory
+    :param board_root: path to additional Boards directory
+    """
+    board_root_list = [
+        f'{zephyr_base}/boards',
+        f'{zephyr_base}/scripts/pylib/twister/boards',
+    ]
+    if board_root:
+        board_root_list.extend(board_root)
+    return board_root_list
+
+
 def search_platforms(
     zephyr_base: str,
     board_root: str | None = None,
@@ -183,13 +199,7 @@ def search_platforms(
     :param default_only: return only default platforms
     :return: list of platform specifications
     """
-    board_root_list = [
-        f'{zephyr_base}/boards',
-        f'{zephyr_base}/scripts/pylib/twister/boards',
-    ]
-    if board_root:
-        board_root_list.extend(board_root)
-
+    board_root_list = get_board_roots(zephyr_base, board_root)
     logger.debug('BOARD_ROOT_LIST: %s', board_root_list)
 
     platforms: list[PlatformSpecification] = []
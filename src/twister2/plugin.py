@@ -1,32 +1,33 @@
 from __future__ import annotations
 
-import datetime
 import logging
 import os
-import shutil
 from pathlib import Path
 
 import pytest
 
-from twister2.filter.filter_plugin import FilterPlugin
-from twister2.filter.tag_filter import TagFilter
-from twister2.generate_tests_plugin import GenerateTestPlugin
-from twister2.load_tests import LoadTestPlugin
-from twister2.log import configure_logging
-from twister2.platform_specification import search_platforms
-from twister2.twister_config import TwisterConfig
-from twister2.yaml_file import YamlPytestPlugin
+from twister2.constants import (
+    RESULT_CACHE_DIR,
+    SERVER_SOCKET_PATH,
+    SERVER_SOCKET_PATH_ENV,
+)
+from twister2.helper import get_build_dir
 
 logger = logging.getLogger(__name__)
 
+# plugin is loaded by every pytest session, so only plugins adding options are
+# loaded with it, and other modules are imported when twister is active
 pytest_plugins = (
+    'twister2.report.test_plan_plugin',
+    'twister2.report.test_results_plugin',
+    'twister2.report.yaml_test_reporting_plugin',
+)
+#: plugins with fixtures, registered when twister is active
+TWISTER_FIXTURE_PLUGINS: tuple[str, ...] = (
     'twister2.fixtures.builder',
     'twister2.fixtures.dut',
     'twister2.fixtures.fixtures',
     'twister2.fixtures.log_parser',
-    'twister2.report.test_plan_plugin',
-    'twister2.report.test_results_plugin',
-    'twister2.report.yaml_test_reporting_plugin',
 )
 
 
@@ -132,6 +133,32 @@ def pytest_addoption(parser: pytest.Parser):
         action='store',
         help='use the specified west runner. E.g. --west-runner=pyocd'
     )
+    twister_group.addoption(
+        '--force-flash',
+        dest='force_flash',
+        action='store_true',
+        help='Always flash devices. By default flashing is skipped and the device '
+             'is only reset when it already holds the identical image.'
+    )
+    twister_group.addoption(
+        '--direct-run',
+        dest='direct_run',
+        action='store_true',
+        help='Run simulators and flash devices without calling west. Command '
+             'for `run` target is taken from build.ninja and runner backend is '
+             'called directly basing on zephyr/runners.yaml. West is used as '
+             'a fallback.'
+    )
+    twister_group.addoption(
+        '--dut-scope',
+        dest='dut_scope',
+        choices=['function', 'build'],
+        default='function',
+        help='Scope of device used by regular pytest tests. With "build" the '
+             'application is flashed or booted once and the device is reused '
+             '(after reset) by all tests sharing the same build directory. '
+             'Default: %(default)s.'
+    )
     twister_group.addoption(
         '-G', '--integration',
         action='store_true',
@@ -184,6 +211,22 @@ def pytest_addoption(parser: pytest.Parser):
              '"archive" - keep previous artifacts '
              '(default=%(default)s)'
     )
+    twister_group.addoption(
+        '--keep-archives',
+        dest='keep_archives',
+        metavar='N',
+        type=int,
+        default=0,
+        help='Keep only N the newest archived output directories, older ones are '
+             'deleted in background (default: keep all)'
+    )
+    twister_group.addoption(
+        '--compress-archives',
+        dest='compress_archives',
+        action='store_true',
+        help='Compress archived output directories (except the latest one) to '
+             'tarballs in background'
+    )
     twister_group.addoption(
         '--builder',
         dest='builder',
@@ -256,12 +299,207 @@ def pytest_addoption(parser: pytest.Parser):
         action='store_true',
         help='Run only those tests that failed the previous twister run invocation.'
     )
+    twister_group.addoption(
+        '--inactivity-timeout',
+        dest='inactivity_timeout',
+        type=float,
+        default=0,
+        metavar='SECONDS',
+        help='Stop test when device did not produce any output for given time '
+             '(scaled by platform timeout multiplier). Default: 0 (disabled).'
+    )
+    twister_group.addoption(
+        '--testcase-timeout',
+        dest='testcase_timeout',
+        type=float,
+        default=0,
+        metavar='SECONDS',
+        help='Report Ztest testcase as hung and stop test when testcase did not '
+             'finish in given time (scaled by platform timeout multiplier). '
+             'Default: 0 (disabled).'
+    )
+    twister_group.addoption(
+        '--subtest-reporting',
+        dest='subtest_reporting',
+        choices=['case', 'batch'],
+        default='case',
+        help='How results of Ztest testcases are reported. With "case" each '
+             'testcase is reported as pytest subtest as soon as it is parsed. '
+             'With "batch" results are collected and saved in the report of test '
+             'at once, which is much faster for suites with many testcases (they '
+             'are not shown as subtests in console). Default: %(default)s.'
+    )
+    twister_group.addoption(
+        '--resource-admission',
+        dest='resource_admission',
+        action='store_true',
+        help='Start simulators (QEMU, native and custom) only when their expected '
+             'memory and CPU usage fits in the host budget shared by all xdist '
+             'workers, otherwise wait for other simulators to finish.'
+    )
+    twister_group.addoption(
+        '--host-ram-budget',
+        dest='host_ram_budget',
+        type=float,
+        default=0,
+        metavar='MB',
+        help='Memory in megabytes available for all simulators when used with '
+             '--resource-admission. Default: 80%% of host memory.'
+    )
+    twister_group.addoption(
+        '--host-cpu-budget',
+        dest='host_cpu_budget',
+        type=float,
+        default=0,
+        metavar='CPUS',
+        help='Number of CPUs available for all simulators when used with '
+             '--resource-admission. Default: number of host CPUs.'
+    )
+    twister_group.addoption(
+        '--sim-ram-factor',
+        dest='sim_ram_factor',
+        type=float,
+        default=2.0,
+        metavar='FACTOR',
+        help='Host memory used by simulator for each kilobyte of board RAM (`ram` '
+             'in board yaml), added to fixed overhead of simulator process. '
+             'Default: %(default)s.'
+    )
+    twister_group.addoption(
+        '--sim-cpus',
+        dest='sim_cpus',
+        type=float,
+        default=1.0,
+        metavar='CPUS',
+        help='Number of CPUs used by one simulator. Default: %(default)s.'
+    )
+    twister_group.addoption(
+        '--retry-failed',
+        dest='retry_failed',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Run failed tests again, up to N times, at the end of session. '
+             'Applications are not built again. Tests passing when run again are '
+             'reported as flaky in results report. Default: %(default)s.'
+    )
+    twister_group.addoption(
+        '--result-cache',
+        dest='result_cache',
+        action='store_true',
+        help='Do not run tests again when their application image, platform, harness '
+             'and options affecting execution did not change since they passed. Output '
+             'of device saved in cache is evaluated instead.'
+    )
+    parser.addini(
+        'result_cache',
+        'Use cache of results of passed tests (see --result-cache)',
+        type='bool'
+    )
+    twister_group.addoption(
+        '--no-result-cache',
+        dest='no_result_cache',
+        action='store_true',
+        help='Run all tests even if result cache is enabled in configuration file.'
+    )
+    twister_group.addoption(
+        '--result-cache-dir',
+        dest='result_cache_dir',
+        metavar='PATH',
+        default=RESULT_CACHE_DIR,
+        help='Directory of result cache. Default: %(default)s.'
+    )
+    twister_group.addoption(
+        '--result-cache-expiry',
+        dest='result_cache_expiry',
+        type=float,
+        default=7,
+        metavar='DAYS',
+        help='Cached results older than given number of days are not used '
+             '(0 means they never expire). Default: %(default)s.'
+    )
+    twister_group.addoption(
+        '--replay-logs',
+        dest='replay_logs',
+        action='store_true',
+        help='Do not build and run tests, but evaluate device output saved in '
+             'handler.log by the previous run. Tests are loaded from file provided '
+             'with --load-tests (twister.json from output directory by default). '
+             'Use with -n to parse logs in parallel.'
+    )
+    twister_group.addoption(
+        '--changed-since',
+        dest='changed_since',
+        metavar='REVISION',
+        default=None,
+        help='Run only tests affected by files changed in Zephyr repository since '
+             'given git revision. Files used by each test are taken from ninja '
+             'dependency data in build directories of the previous run (output '
+             'directory or the latest archived one); tests without it are always '
+             'run. Files which caused tests to run are saved in '
+             'changed_files_impact.json in output directory.'
+    )
+    twister_group.addoption(
+        '--shard-count',
+        dest='shard_count',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Split tests into N shards (e.g. to run them on N machines) and run only '
+             'one of them, selected with --shard-index. Tests sharing a build '
+             'directory are always in the same shard. Tests of the shard are saved in '
+             'output directory to be run again with --load-tests.'
+    )
+    twister_group.addoption(
+        '--shard-index',
+        dest='shard_index',
+        type=int,
+        default=0,
+        metavar='INDEX',
+        help='Index of shard to run, from 0 to N-1. Default: %(default)s.'
+    )
+    twister_group.addoption(
+        '--shard-costs',
+        dest='shard_costs_path',
+        metavar='PATH',
+        default=None,
+        help='Results report (twister.json) of a previous run used to balance shards '
+             'by duration of tests. Without it shards have similar number of tests.'
+    )
+    twister_group.addoption(
+        '--order-by-duration',
+        dest='order_by_duration',
+        nargs='?',
+        const='auto',
+        default=None,
+        metavar='PATH',
+        help='Run the longest tests first, using durations of tests from results report '
+             '(twister.json) of a previous run. Without PATH the report is taken from '
+             'output directory or the latest archived output directory. Durations of '
+             'tests not found in the report are estimated by platform type.'
+    )
     twister_group.addoption(
         '--only-from-yaml',
         dest='only_from_yaml',
         action='store_true',
         help='Run only tests generated from yaml files. Do not collect pytest scenarios'
     )
+    twister_group.addoption(
+        '--server-socket',
+        dest='server_socket',
+        metavar='PATH',
+        default=None,
+        help='Unix socket of twister server (started with `twister_tools --serve`) '
+             'keeping platforms, toolchain version and parsed yaml files in memory '
+             f'(default: from environment variable {SERVER_SOCKET_PATH_ENV} or {SERVER_SOCKET_PATH}). '
+             'Server is used when the socket exists.'
+    )
+    twister_group.addoption(
+        '--no-server',
+        dest='no_server',
+        action='store_true',
+        help='Do not use twister server even if it is running.'
+    )
 
 
 def pytest_configure(config: pytest.Config):
@@ -291,15 +529,39 @@ def pytest_configure(config: pytest.Config):
 
     xdist_worker = hasattr(config, 'workerinput')  # xdist worker
 
-    if not xdist_worker:
+    shard_plugin = None
+    if config.option.shard_count:
+        from twister2.filter.shard_plugin import ShardPlugin
+
+        # durations are read before previous output directory is cleaned
+        shard_plugin = ShardPlugin.create(config)
+    order_plugin = None
+    if config.option.order_by_duration:
+        from twister2.test_order_plugin import DurationOrderPlugin
+
+        order_plugin = DurationOrderPlugin.create(config)
+
+    if not xdist_worker and not config.option.replay_logs:
+        # replayed logs are kept in build directories of the previous run
         run_artifactory_cleanup(config)
 
     # create output directory if not exists
     os.makedirs(config.option.output_dir, exist_ok=True)
 
+    # modules needed by all sessions using twister (other ones are imported when their feature is used)
+    from twister2.filter.filter_plugin import FilterPlugin
+    from twister2.generate_tests_plugin import GenerateTestPlugin
+    from twister2.load_tests import LoadTestPlugin
+    from twister2.log import configure_logging
+    from twister2.platform_specification import search_platforms
+    from twister2.twister_config import TwisterConfig
+    from twister2.yaml_file import YamlPytestPlugin
+
     configure_logging(config)
 
     # register plugins
+    for plugin_name in TWISTER_FIXTURE_PLUGINS:
+        config.pluginmanager.import_plugin(plugin_name)
     config.pluginmanager.register(plugin=TwisterExtPlugin(), name='twister ext plugin')
     config.pluginmanager.register(plugin=LoadTestPlugin(), name='load test plugin')
     config.pluginmanager.register(plugin=YamlPytestPlugin(), name='yaml file plugin')
@@ -307,18 +569,73 @@ def pytest_configure(config: pytest.Config):
 
     filter_plugin = FilterPlugin(config)
     if config.getoption('tags'):
+        from twister2.filter.tag_filter import TagFilter
+
         filter_plugin.add_filter(TagFilter(config))
+    if config.option.changed_since:
+        from twister2.filter.changed_files_filter import ChangedFilesFilter
+
+        filter_plugin.add_filter(ChangedFilesFilter(config))
     config.pluginmanager.register(plugin=filter_plugin, name='filter_tests')
+    if shard_plugin is not None:
+        config.pluginmanager.register(plugin=shard_plugin, name='shard_tests')
+    if order_plugin is not None:
+        config.pluginmanager.register(plugin=order_plugin, name='order_tests_by_duration')
+    if config.option.retry_failed:
+        from twister2.retry_failed_plugin import RetryFailedPlugin
+
+        config.pluginmanager.register(plugin=RetryFailedPlugin(config.option.retry_failed), name='retry_failed')
+
+    if not xdist_worker and config.pluginmanager.hasplugin('xdist') and config.getvalue('dist') == 'load':
+        # xdist is optional, so scheduler is imported only when it is used
+        from twister2.xdist_scheduler import BuildGroupSchedulingPlugin
+        config.pluginmanager.register(plugin=BuildGroupSchedulingPlugin(), name='build_group_scheduling')
+
+    if config.option.device_testing and not xdist_worker:
+        from twister2.device.hardware_pool import HardwareUsagePlugin
+
+        config.pluginmanager.register(
+            plugin=HardwareUsagePlugin(config.option.output_dir), name='hardware_usage'
+        )
+    # cache can be enabled also in configuration file
+    config.option.result_cache = is_result_cache_enabled(config)
+    if config.option.result_cache and not xdist_worker:
+        from twister2.result_cache import ResultCache, ResultCachePlugin
+
+        config.pluginmanager.register(
+            plugin=ResultCachePlugin(ResultCache(config.option.result_cache_dir, config.option.result_cache_expiry)),
+            name='result_cache'
+        )
+    if config.option.resource_admission and not xdist_worker:
+        from twister2.device.host_resources import HostResourceUsagePlugin
+
+        config.pluginmanager.register(
+            plugin=HostResourceUsagePlugin(config.option.output_dir), name='host_resource_usage'
+        )
 
     # configure twister
     logger.debug('ZEPHYR_BASE: %s', zephyr_base)
 
     board_root = config.option.board_root or config.getini('board_root')
 
-    config._platforms = search_platforms(zephyr_base, board_root)  # type: ignore
+    twister_server = None
+    if not config.option.no_server:
+        from twister2.server import TwisterServerClient, get_socket_path
+
+        twister_server = TwisterServerClient.connect(get_socket_path(config.option.server_socket))
+    config._twister_server = twister_server  # type: ignore
+    if twister_server is not None:
+        config._platforms = twister_server.search_platforms(zephyr_base, board_root)  # type: ignore
+    else:
+        config._platforms = search_platforms(zephyr_base, board_root)  # type: ignore
     config.twister_config = TwisterConfig.create(config)  # type: ignore
 
 
+def pytest_unconfigure(config: pytest.Config):
+    if (twister_server := getattr(config, '_twister_server', None)) is not None:
+        twister_server.close()
+
+
 def register_custom_markers(config: pytest.Config) -> None:
     # register custom markers for twister
     markers = [
@@ -369,6 +686,19 @@ def validate_options(config: pytest.Config) -> None:
         pytest.exit(
             'To apply `--build-only` option, `--clear` option cannot be set as `no`.'
         )
+    if config.option.retry_failed < 0:
+        pytest.exit('Option `--retry-failed` must not be negative.')
+    if config.option.keep_archives < 0:
+        pytest.exit('Option `--keep-archives` must not be negative.')
+    if config.option.retry_failed and config.option.runtime_artifact_cleanup == 'all':
+        pytest.exit(
+            'Option `--retry-failed` cannot be used with `--runtime-artifact-cleanup=all`, '
+            'artifacts of failed tests are needed to run them again.'
+        )
+    if config.option.shard_count < 0 or not 0 <= config.option.shard_index < max(config.option.shard_count, 1):
+        pytest.exit(
+            'Option `--shard-index` must be from 0 to `--shard-count` - 1.'
+        )
     if config.option.quarantine_verify and not config.option.quarantine_list_path:
         pytest.exit(
             'No quarantine list given to be verified. '
@@ -381,6 +711,13 @@ def validate_options(config: pytest.Config) -> None:
         )
 
 
+def is_result_cache_enabled(config: pytest.Config) -> bool:
+    """Return True if results of passed tests should be taken from cache."""
+    if config.option.no_result_cache or config.option.replay_logs:
+        return False
+    return bool(config.option.result_cache or config.getini('result_cache'))
+
+
 def run_artifactory_cleanup(config: pytest.Config) -> None:
     """Clean, archive or delete an output dir. If load test file
     is in impacted directory, backup them or update path"""
@@ -395,23 +732,25 @@ def run_artifactory_cleanup(config: pytest.Config) -> None:
     output_dir = config.option.output_dir
     if choice == 'no':
         print('Keeping previous artifacts untouched')
-    elif choice == 'delete':
-        load_tests_content = store_load_tests_file_content(config)
+        return
+
+    from twister2.output_dir_cleanup import clean_output_dir
+
+    load_tests_content = store_load_tests_file_content(config) if choice == 'delete' else None
+    if choice == 'delete':
         print(f'Deleting previous artifacts from {output_dir}')
-        shutil.rmtree(output_dir, ignore_errors=True)
-        restore_load_tests_file(config, load_tests_content)
-    elif choice == 'archive':
-        timestamp = os.path.getmtime(output_dir)
-        file_date = datetime.datetime.fromtimestamp(timestamp).strftime('%y%m%d%H%M%S')
-        new_output_dir = f'{output_dir}_{file_date}'
-        print(f'Renaming output directory to {new_output_dir}')
-        shutil.move(str(output_dir), new_output_dir)
-        update_load_tests_path_if_archieved(config, new_output_dir)
+    archived_dir = clean_output_dir(
+        output_dir, choice, config.option.keep_archives, config.option.compress_archives
+    )
+    if archived_dir is not None:
+        print(f'Renaming output directory to {archived_dir}')
+        update_load_tests_path_if_archieved(config, str(archived_dir))
+    restore_load_tests_file(config, load_tests_content)
 
 
 def update_load_tests_path(config: pytest.Config) -> None:
     """Update load tests path if using `only-failed` option. Normalize and validate"""
-    if config.option.only_failed:
+    if config.option.only_failed or config.option.replay_logs:
         if not config.option.load_tests_path:
             config.option.load_tests_path = str(os.path.join(config.option.output_dir, 'twister.json'))
     if config.option.load_tests_path:
@@ -460,6 +799,22 @@ def _normalize_path(path: str | Path) -> str:
 
 class TwisterExtPlugin():
 
+    def __init__(self) -> None:
+        self.startup_times: dict[str, list[float]] = {}  #: startup times grouped by launcher
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(
+        self, session: pytest.Session, config: pytest.Config, items: list[pytest.Item]
+    ) -> None:
+        """Run tests sharing a build one after another, so they can reuse the same device."""
+        if config.twister_config.dut_scope != 'build':  # type: ignore[attr-defined]
+            return
+        # stable sort keeps order of the first test using each build
+        build_dir_order: dict[str, int] = {}
+        for item in items:
+            build_dir_order.setdefault(get_build_dir(item), len(build_dir_order))
+        items.sort(key=lambda item: build_dir_order[get_build_dir(item)])
+
     def pytest_runtest_setup(self, item: pytest.Item) -> None:
         # extend JUnitXML report for user properties
         if marker := item.get_closest_marker('type'):
@@ -478,10 +833,44 @@ class TwisterExtPlugin():
         """
         outcome = yield
         report = outcome.get_result()
+        if report.when == 'call' and item.config.twister_config.subtest_reporting == 'batch':
+            # results are sent to controller (by xdist) together with report
+            if (log_parser := getattr(item, 'funcargs', {}).get('log_parser')) is not None:
+                report.ztest_subtests = [subtest.asdict() for subtest in getattr(log_parser, 'subtest_results', [])]
+                failed_subtests = [subtest for subtest in report.ztest_subtests if subtest['result'] == 'FAIL']
+                if failed_subtests and report.passed:
+                    # console, exit code and report must agree with status of testcases
+                    report.outcome = 'failed'
+                    report.longrepr = '\n'.join(
+                        [f'Failed ztest testcases: {", ".join(subtest["testname"] for subtest in failed_subtests)}']
+                        + [subtest['message'] for subtest in failed_subtests if subtest.get('message')]
+                    )
         if report.failed:
             setattr(item, '_test_failed', True)
         return report
 
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        if report.when != 'teardown':
+            return
+        properties: dict[str, str] = {name: str(value) for name, value in report.user_properties}
+        if 'launcher' in properties and 'startup_time' in properties:
+            self.startup_times.setdefault(properties['launcher'], []).append(float(properties['startup_time']))
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if not self.startup_times:
+            return
+        mean_times: dict[str, float] = {
+            launcher: sum(times) / len(times) for launcher, times in self.startup_times.items()
+        }
+        terminalreporter.write_sep('-', 'Startup time of applications')
+        for launcher, mean_time in sorted(mean_times.items()):
+            terminalreporter.write_line(
+                f'{launcher}: {len(self.startup_times[launcher])} tests, mean startup time {mean_time:.3f} s'
+            )
+        if 'west' in mean_times and 'direct' in mean_times:
+            saving = mean_times['west'] - mean_times['direct']
+            terminalreporter.write_line(f'Mean startup time saved per test by direct run: {saving:.3f} s')
+
 
 def pytest_collection_modifyitems(
     session: pytest.Session, config: pytest.Config, items: list[pytest.Item]
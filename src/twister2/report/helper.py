@@ -3,11 +3,74 @@ Module contains helper function used in report package.
 """
 from __future__ import annotations
 
+import dataclasses
+import functools
 import os
 from pathlib import Path
 
 import pytest
 
+from twister2.helper import get_item_specification
+
+
+@dataclasses.dataclass
+class ItemMetadata:
+    """Test metadata used in reports."""
+    name: str
+    arch: str
+    platform: str
+    run_id: str
+    runnable: bool
+    retries: int
+    test_name: str
+    nodeid: str
+    type: str
+    build_only: bool
+
+    def asdict(self) -> dict:
+        """Return JSON serialized dictionary."""
+        return dataclasses.asdict(self)
+
+
+ITEM_METADATA_KEY = pytest.StashKey[ItemMetadata]()
+
+
+def get_item_metadata(item: pytest.Item) -> ItemMetadata:
+    """
+    Return test metadata used in reports.
+
+    Metadata is computed once and stored in the item, so test plan and
+    results report do not have to compute it again. It is stored only when
+    specifications of tests were already added to session, because markers
+    of regular tests are added from specifications at the same time.
+    """
+    if (metadata := item.stash.get(ITEM_METADATA_KEY, None)) is None:
+        platform_name = get_item_platform(item)
+        arch = ''
+        if platform_name:
+            arch = item.config.twister_config.get_platform(platform_name).arch  # type: ignore[attr-defined]
+        metadata = ItemMetadata(
+            name=get_suite_name(item),
+            arch=arch,
+            platform=platform_name,
+            run_id=get_run_id(item),
+            runnable=get_item_runnable_status(item),
+            retries=get_retries(item),
+            test_name=get_test_name(item),
+            nodeid=item.nodeid,
+            type=get_item_type(item),
+            build_only=get_item_build_only_status(item),
+        )
+        if hasattr(item.session, 'specifications'):
+            item.stash[ITEM_METADATA_KEY] = metadata
+    return metadata
+
+
+@functools.lru_cache(maxsize=None)
+def _get_canonical_path(path: str) -> str:
+    """Return canonical path, many tests share the same directories."""
+    return os.path.realpath(path)
+
 
 def get_suite_name(item: pytest.Item) -> str:
     """Return suite name."""
@@ -24,7 +87,7 @@ def get_suite_name(item: pytest.Item) -> str:
         # and logs, generated Makefiles, etc. compared to when users invoke these
         # components directly.
         # Note "normalization" is different from canonicalization, see os.path.
-        canonical_zephyr_base = os.path.realpath(item.config.twister_config.zephyr_base)
+        canonical_zephyr_base = _get_canonical_path(item.config.twister_config.zephyr_base)
         suite_root = os.path.abspath(item.path.parent)
         suite_path = os.path.dirname(item.path)
         workdir = os.path.relpath(suite_path, suite_root)
@@ -35,7 +98,7 @@ def get_suite_name(item: pytest.Item) -> str:
 def get_suite_name_v1_style(testsuite_root, workdir, name, canonical_zephyr_base) -> str:
     """Return exact same name as in V1. Copy 1:1 of V1 TestSuite.get_unique()"""
 
-    canonical_testsuite_root = os.path.realpath(testsuite_root)
+    canonical_testsuite_root = _get_canonical_path(testsuite_root)
     if Path(canonical_zephyr_base) in Path(canonical_testsuite_root).parents:
         # This is in ZEPHYR_BASE, so include path in name for uniqueness
         relative_ts_root = os.path.relpath(canonical_testsuite_root, start=canonical_zephyr_base)
@@ -88,33 +151,29 @@ def get_item_arch(item: pytest.Item) -> str:
 
 def get_run_id(item: pytest.Item) -> str:
     """Return run id."""
-    if hasattr(item.session, 'specifications'):
-        if spec := item.session.specifications.get(item.nodeid):
-            return spec.run_id
+    if spec := get_item_specification(item):
+        return spec.run_id
     return ''
 
 
 def get_retries(item: pytest.Item) -> int:
     """Return `retries` from specification."""
-    if hasattr(item.session, 'specifications'):
-        if spec := item.session.specifications.get(item.nodeid):
-            return spec.retries
+    if spec := get_item_specification(item):
+        return spec.retries
     return 0
 
 
 def get_item_platform_allow(item: pytest.Item) -> str:
     """Return allowed platforms."""
-    if hasattr(item.session, 'specifications'):
-        if spec := item.session.specifications.get(item.nodeid):
-            return ' '.join(spec.platform_allow)
+    if spec := get_item_specification(item):
+        return ' '.join(spec.platform_allow)
     return ''
 
 
 def get_item_runnable_status(item: pytest.Item) -> bool:
     """Return runnable status."""
-    if hasattr(item.session, 'specifications'):
-        if spec := item.session.specifications.get(item.nodeid):
-            return spec.runnable
+    if spec := get_item_specification(item):
+        return spec.runnable
     return True
 
 
@@ -0,0 +1,172 @@
+"""
+Journal of test results written while tests are running.
+
+Result of each test is appended to a JSON-lines file as soon as the test
+finishes, so results are not lost when the session is killed, and they do not
+have to be kept in memory until the end of session. Report in twister.json
+format is built from the journal at the end of session, or with
+``twister_tools --journal-to-json`` when the session did not finish.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Iterator, TextIO
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX: str = '.jsonl'
+
+#: statuses from the least to the most important
+STATUS_ORDER: tuple[str, ...] = ('skipped', 'passed', 'xpassed', 'xfailed', 'rerun', 'failed', 'error')
+
+FAILURE_FLAKY: str = 'flaky'
+FAILURE_HARD: str = 'hard'
+
+
+def get_journal_path(results_path: str | Path) -> Path:
+    """Return path of journal for results report (e.g. twister.jsonl for twister.json)."""
+    return Path(results_path).with_suffix(JOURNAL_SUFFIX)
+
+
+def get_testsuite_key(testsuite: dict) -> tuple[str, str]:
+    """Return key identifying test in reports (name of test is the same on all platforms)."""
+    return testsuite['name'], testsuite.get('platform', '')
+
+
+def merge_status(current: str | None, new: str | None) -> str | None:
+    """Return the more important of two statuses."""
+    if current is None or new is None:
+        return current or new
+    return STATUS_ORDER[max(STATUS_ORDER.index(current), STATUS_ORDER.index(new))]
+
+
+class ResultsJournal:
+    """Append results of finished tests to JSON-lines file."""
+
+    def __init__(self, filename: str | Path) -> None:
+        self.filename: Path = Path(filename)
+        self._file: TextIO | None = None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({str(self.filename)!r})'
+
+    def open(self, configuration: dict, environment: dict) -> None:
+        """
+        Start new journal.
+
+        :param configuration: twister configuration
+        :param environment: environment information without session duration
+        """
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.filename.open('w', encoding='UTF-8')
+        self._write(
+            dict(record='session_start', time=time.time(), configuration=configuration, environment=environment)
+        )
+
+    def add_test(self, testsuite: dict) -> None:
+        """Save result of finished test."""
+        self._write(dict(record='test', time=time.time(), testsuite=testsuite))
+
+    def close(self) -> None:
+        """Mark session as finished and close journal."""
+        if self._file is None:
+            return
+        self._write(dict(record='session_finish', time=time.time()))
+        self._file.close()
+        self._file = None
+
+    def _write(self, record: dict) -> None:
+        if self._file is None:
+            return
+        self._file.write(json.dumps(record) + '\n')
+        # flush every record, so it is not lost when process is killed
+        self._file.flush()
+
+
+def read_journal(filename: str | Path) -> Iterator[dict]:
+    """
+    Return records saved in journal.
+
+    Incomplete line, written when process was killed, is skipped.
+
+    :param filename: path to journal
+    """
+    with open(filename, encoding='UTF-8') as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                logger.warning('Skipped corrupted line %d of %s', line_number, filename)
+
+
+def classify_failure(status: str) -> str:
+    """Return `flaky` when test run again after failure passed, `hard` otherwise."""
+    return FAILURE_FLAKY if status in ('passed', 'xpassed') else FAILURE_HARD
+
+
+def build_report(filename: str | Path) -> dict:
+    """
+    Return report data in twister.json format built from journal.
+
+    When test was run several times, the last result is used with the most
+    important status of all runs. When test was run again after failure
+    (reported with `rerun` status), status of the last attempt is used and
+    the failure is classified as flaky or hard.
+
+    :param filename: path to journal
+    :return: report data
+    """
+    configuration: dict = {}
+    environment: dict = {}
+    start_time: float = 0.0
+    end_time: float = 0.0
+    testsuites: dict[str, dict] = {}
+    for record in read_journal(filename):
+        if record['record'] == 'session_start':
+            configuration = record['configuration']
+            environment = record['environment']
+            start_time = end_time = record['time']
+        elif record['record'] == 'test':
+            end_time = record['time']
+            testsuite = record['testsuite']
+            if (previous := testsuites.get(testsuite['nodeid'])) is not None:
+                if previous['status'] == 'rerun':
+                    # failed test was run again in the same session, the last attempt decides
+                    testsuite['attempts'] = previous.get('attempts', 1) + 1
+                    testsuite['failure_type'] = classify_failure(testsuite['status'])
+                else:
+                    testsuite['status'] = merge_status(previous['status'], testsuite['status'])
+            testsuites[testsuite['nodeid']] = testsuite
+        elif record['record'] == 'session_finish':
+            end_time = record['time']
+
+    environment['duration'] = f'{end_time - start_time:.2f}'
+    return dict(
+        environment=environment,
+        configuration=configuration,
+        summary=get_summary(testsuites.values()),
+        testsuites=list(testsuites.values()),
+    )
+
+
+def get_summary(testsuites) -> dict:
+    """Return counts of tests and subtests for each status."""
+    counter: Counter = Counter(passed=0, failed=0, skipped=0, xfailed=0, xpassed=0, error=0)
+    subtests_counter: Counter = Counter()
+    for testsuite in testsuites:
+        counter[testsuite['status']] += 1
+        subtests_counter.update(testcase['status'] for testcase in testsuite['testcases'])
+
+    summary = dict(counter)
+    summary['total'] = sum(counter.values())
+    summary['subtests_total'] = sum(subtests_counter.values())
+    summary['subtests_passed'] = subtests_counter['passed']
+    summary['subtests_failed'] = subtests_counter['failed']
+    summary['subtests_skipped'] = subtests_counter['skipped']
+    return summary
@@ -11,17 +11,7 @@ import pytest
 from _pytest.terminal import TerminalReporter
 
 from twister2.report.base_report_writer import BaseReportWriter
-from twister2.report.helper import (
-    get_item_arch,
-    get_item_build_only_status,
-    get_item_platform,
-    get_item_runnable_status,
-    get_item_type,
-    get_retries,
-    get_run_id,
-    get_suite_name,
-    get_test_name,
-)
+from twister2.report.helper import get_item_metadata
 from twister2.report.test_plan_csv import CsvTestPlan
 from twister2.report.test_plan_json import JsonTestPlan
 
@@ -45,29 +35,19 @@ class TestPlanPlugin:
 
     def _item_as_dict(self, item: pytest.Item) -> dict:
         """Return test metadata as dictionary."""
-        return dict(
-            name=get_suite_name(item),
-            arch=get_item_arch(item),
-            platform=get_item_platform(item),
-            run_id=get_run_id(item),
-            runnable=get_item_runnable_status(item),
-            retries=get_retries(item),
-            test_name=get_test_name(item),
-            nodeid=item.nodeid,
-            type=get_item_type(item),
-            build_only=get_item_build_only_status(item)
-        )
+        return get_item_metadata(item).asdict()
 
     def generate(self, items: List[pytest.Item]) -> dict:
         """Build test plan"""
         testsuites = [self._item_as_dict(item) for item in items]
         return dict(testsuites=testsuites)
 
-    @pytest.hookimpl(trylast=True)
+    @pytest.hookimpl(hookwrapper=True)
     def pytest_collection_modifyitems(
         self, session: pytest.Session, config: pytest.Config, items: list[pytest.Item]
     ):
-        # generate test plan and save
+        # test plan contains tests left by all plugins (e.g. selected for shard)
+        yield
         data = self.generate(items)
         self._save_report(data)
         if save_tests_path := config.getoption('save_tests_path'):
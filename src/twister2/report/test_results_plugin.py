@@ -3,30 +3,25 @@ Plugin to generate custom report for twister.
 """
 from __future__ import annotations
 
-import json
 import logging
 import os
 import platform
-import time
-from collections import Counter
 from datetime import datetime, timezone
 from typing import Sequence
 
 import pytest
 from pytest_subtests import SubTestReport
 
+from twister2.constants import RESULT_CACHE_PROPERTY
 from twister2.environment.environment import get_toolchain_version, get_zephyr_repo_info
 from twister2.report.base_report_writer import BaseReportWriter
-from twister2.report.helper import (
-    get_item_arch,
-    get_item_build_only_status,
-    get_item_platform,
-    get_item_runnable_status,
-    get_item_type,
-    get_retries,
-    get_run_id,
-    get_suite_name,
-    get_test_name,
+from twister2.report.helper import get_item_metadata
+from twister2.report.results_journal import (
+    ResultsJournal,
+    build_report,
+    get_journal_path,
+    get_testsuite_key,
+    merge_status,
 )
 from twister2.report.test_results_json import JsonResultsReport
 
@@ -46,6 +41,15 @@ class Status:
     RERUN = 'rerun'
 
 
+#: statuses of Ztest testcases reported in batch mode
+ZTEST_STATUSES: dict[str, str] = dict(
+    PASS=Status.PASSED,
+    FAIL=Status.FAILED,
+    SKIP=Status.SKIPPED,
+    BLOCK=Status.SKIPPED,
+)
+
+
 class TestResult:
     """Class stores test result for single test."""
 
@@ -54,23 +58,19 @@ class TestResult:
         self.nodeid = nodeid
         self.name: str = self.test_id
         self.status: str | None = None
-        self.item: str = nodeid
-        self.report = None
-        self.config = None
         self.duration: float = 0.0  #: whole time spent on running test
         self.call_duration: float = 0.0  #: time spent only on execution (without setup and teardown)
         self.message: str = ''
         self.subtests: list = []
+        self.cached: bool = False  #: output of device was taken from result cache
 
     def __repr__(self):
         return f'{self.__class__.__name__}({self.status!r})'
 
-    def extract_results(self, outcome: str, report: pytest.TestReport, config: pytest.Config):
+    def extract_results(self, outcome: str, report: pytest.TestReport):
         if getattr(report, 'when', 'call') != 'call':
             self.test_id = '::'.join([report.nodeid, report.when])  # type: ignore[list-item]
         self._update_status(outcome)
-        self.report = report
-        self.config = config
         self.message = report.longreprtext
 
     def add_subtest(self, subtest: dict) -> None:
@@ -78,34 +78,27 @@ class TestResult:
         self.subtests.append(subtest)
 
     def _update_status(self, new_status: str):
-        order = (
-            Status.SKIPPED,
-            Status.PASSED,
-            Status.XPASSED,
-            Status.XFAILED,
-            Status.RERUN,
-            Status.FAILED,
-            Status.ERROR,
-        )
-        if self.status is None:
-            self.status = new_status
-        else:
-            status = order[max(order.index(self.status), order.index(new_status))]
-            self.status = status
+        self.status = merge_status(self.status, new_status)
 
 
 class TestResultsPlugin:
-    """Class collects results and crates result report."""
+    """
+    Class collects results and crates result report.
+
+    Results of finished tests are saved in journal, only results of running
+    tests are kept in memory.
+    """
 
-    def __init__(self, config: pytest.Config, writers: Sequence[BaseReportWriter]):
+    def __init__(self, config: pytest.Config, writers: Sequence[BaseReportWriter], journal: ResultsJournal):
         """
         :param config: pytest configuration
         :param writers: list of report writers
+        :param journal: journal where results of finished tests are saved
         """
         self.config = config
         self.writers = writers
-        self.counter: Counter = Counter(passed=0, failed=0, skipped=0, xfailed=0, xpassed=0, error=0)
-        self.test_results: dict[str, TestResult] = {}
+        self.journal = journal
+        self.test_results: dict[str, TestResult] = {}  #: results of running tests
         self.items: dict[str, pytest.Item] = {}
 
     def pytest_report_collectionfinish(self, config: pytest.Config, items: list[pytest.Item]):
@@ -129,10 +122,21 @@ class TestResultsPlugin:
             if getattr(report, 'when', '') == 'call':
                 result.call_duration = getattr(report, 'duration', 0.0)
 
+        if ztest_subtests := getattr(report, 'ztest_subtests', None):
+            self._add_ztest_subtests(result, ztest_subtests)
+
         outcome = self._get_outcome(report)
-        if not outcome:
-            return
+        if outcome:
+            self._add_outcome(result, outcome, report)
+
+        if report.when == 'teardown' and not self._is_sub_test(report):
+            # the last report of test
+            result.cached = dict(report.user_properties).get(RESULT_CACHE_PROPERTY) == 'hit'
+            del self.test_results[report.nodeid]
+            if item := self.items.get(report.nodeid):
+                self.journal.add_test(self._get_testsuite(item, result))
 
+    def _add_outcome(self, result: TestResult, outcome: str, report: pytest.TestReport) -> None:
         if self._is_sub_test(report):
             ztest_testcase_duration = self._get_ztest_testcase_duration(report)
             result.add_subtest(
@@ -143,7 +147,21 @@ class TestResultsPlugin:
                 )
             )
         else:
-            result.extract_results(outcome, report, self.config)
+            result.extract_results(outcome, report)
+
+    @staticmethod
+    def _add_ztest_subtests(result: TestResult, ztest_subtests: list[dict]) -> None:
+        """Add results of Ztest testcases reported together with test report."""
+        for subtest in ztest_subtests:
+            testcase = dict(
+                identifier=subtest['testname'],
+                execution_time=f'{subtest["duration"]:.{TIME_DECIMAL_PLACES_SUBTEST}f}',
+                status=ZTEST_STATUSES[subtest['result']],
+            )
+            if message := subtest.get('message'):
+                # e.g. reason of failure of testcase which was running when device hung
+                testcase['message'] = message
+            result.add_subtest(testcase)
 
     @staticmethod
     def _is_sub_test(report: pytest.TestReport) -> bool:
@@ -162,11 +180,14 @@ class TestResultsPlugin:
         return duration
 
     def pytest_sessionstart(self, session: pytest.Session):
-        self.session_start_time = time.time()
+        self.journal.open(
+            configuration=self.config.twister_config.asdict(),  # type: ignore[attr-defined]
+            environment=self._get_environment(),
+        )
 
     def pytest_sessionfinish(self, session: pytest.Session):
-        self.session_finish_time = time.time()
-        data = self._generate_report(session)
+        self.journal.close()
+        data = build_report(self.journal.filename)
         if self.config.option.only_failed:
             data = self._merge_with_load_tests_data(data, self.config.option.load_tests_path)
         self._save_report(data)
@@ -176,6 +197,9 @@ class TestResultsPlugin:
             writer.print_summary(terminalreporter)
 
     def _get_outcome(self, report: pytest.TestReport) -> str | None:  # type: ignore[return]
+        if report.outcome == Status.RERUN:
+            # failed test which is run again later
+            return Status.RERUN
         if report.failed:
             if report.when != 'call':
                 return Status.ERROR
@@ -194,80 +218,44 @@ class TestResultsPlugin:
             else:
                 return Status.PASSED
 
-    def _generate_report(self, session: pytest.Session) -> dict:
-        """Return test report data as dictionary."""
-        tests_list: list = []
-        subtests_total = 0
-        subtests_pass_count = 0
-        subtests_fail_count = 0
-        subtests_skip_count = 0
-
-        for result in self.test_results.values():
-            result: TestResult  # type: ignore
-            item = self.items.get(result.nodeid)
-
-            if not item:
-                continue
-
-            self.counter[result.status] += 1
-            subtests_total += len(result.subtests)
-            subtests_pass_count += sum(1 for st in result.subtests if st['status'] == Status.PASSED)
-            subtests_fail_count += sum(1 for st in result.subtests if st['status'] == Status.FAILED)
-            subtests_skip_count += sum(1 for st in result.subtests if st['status'] == Status.SKIPPED)
-
-            testsuites = dict(
-                name=get_suite_name(item),
-                arch=get_item_arch(item),
-                platform=get_item_platform(item),
-                run_id=get_run_id(item),
-                runnable=get_item_runnable_status(item),
-                retries=get_retries(item),
-                status=result.status,
-                message=result.message,
-                execution_time=f'{result.call_duration:.{TIME_DECIMAL_PLACES}f}',
-                duration=f'{result.duration:.{TIME_DECIMAL_PLACES}f}',
-                test_name=get_test_name(item),
-                nodeid=item.nodeid,
-                type=get_item_type(item),
-                build_only=get_item_build_only_status(item),
-                testcases=result.subtests,
-            )
-            tests_list.append(testsuites)
-
-        summary = dict(self.counter)
-        summary['total'] = sum(self.counter.values())
-        summary['subtests_total'] = subtests_total
-        summary['subtests_passed'] = subtests_pass_count
-        summary['subtests_failed'] = subtests_fail_count
-        summary['subtests_skipped'] = subtests_skip_count
-
-        return dict(
-            environment=self._get_environment(),
-            configuration=self.config.twister_config.asdict(),  # type: ignore
-            summary=summary,
-            testsuites=tests_list,
+    @staticmethod
+    def _get_testsuite(item: pytest.Item, result: TestResult) -> dict:
+        """Return report data of single test."""
+        testsuite = get_item_metadata(item).asdict()
+        testsuite.update(
+            status=result.status,
+            message=result.message,
+            execution_time=f'{result.call_duration:.{TIME_DECIMAL_PLACES}f}',
+            duration=f'{result.duration:.{TIME_DECIMAL_PLACES}f}',
+            testcases=result.subtests,
         )
+        if result.cached:
+            testsuite['cached'] = True
+        return testsuite
 
-    def _merge_with_load_tests_data(self, data: dict, load_tests_path: str) -> dict:
-        with open(load_tests_path, 'r') as fp:
-            load_data = json.load(fp)
-        test_list: list = []
-        for ts in load_data['testsuites']:
-            if (matched_ts := self._find_testsuite(data['testsuites'], ts['name'])):
-                test_list.append(matched_ts)
-            else:
-                test_list.append(ts)
-        data['testsuites'] = test_list
-        return data
+    @staticmethod
+    def _merge_with_load_tests_data(data: dict, load_tests_path: str) -> dict:
+        """
+        Replace results from loaded report with results of tests run again.
 
-    def _find_testsuite(self, testsuites: list[dict], name: str) -> dict | None:
-        for ts in testsuites:
-            if ts['name'] == name:
-                return ts
-        return None
+        :param data: report data of current session
+        :param load_tests_path: path to report of the previous session
+        :return: report data with results of all tests from loaded report
+        """
+        from twister2.load_tests import iter_json_array
+
+        # test name is not unique, the same test can be run on several platforms
+        current_testsuites: dict[tuple[str, str], dict] = {
+            get_testsuite_key(ts): ts for ts in data['testsuites']
+        }
+        # loaded report can be large, its tests are decoded one by one
+        data['testsuites'] = [
+            current_testsuites.get(get_testsuite_key(ts), ts) for ts in iter_json_array(load_tests_path, 'testsuites')
+        ]
+        return data
 
     def _get_environment(self) -> dict:
-        duration = self.session_finish_time - self.session_start_time
+        """Return information about environment (session duration is added when report is built)."""
         repo_info = get_zephyr_repo_info(self.config.twister_config.zephyr_base)
         toolchain = get_toolchain_version(self.config.twister_config.output_dir, self.config.twister_config.zephyr_base)
 
@@ -278,7 +266,6 @@ class TestResultsPlugin:
             toolchain=toolchain,
             run_date=datetime.now(timezone.utc).isoformat(timespec='seconds'),
             pc_name=platform.node() or 'N/A',
-            duration=f'{duration:.{TIME_DECIMAL_PLACES}f}',
         )
         return environment
 
@@ -316,6 +303,8 @@ def pytest_configure(config: pytest.Config):
 
     if test_results_writers and not config.option.collectonly and not config.option.save_tests_path:
         config.pluginmanager.register(
-            plugin=TestResultsPlugin(config, writers=test_results_writers),
+            plugin=TestResultsPlugin(
+                config, writers=test_results_writers, journal=ResultsJournal(get_journal_path(test_result_json_path))
+            ),
             name='test_results'
         )
@@ -0,0 +1,175 @@
+"""
+Cache of results of tests run on devices.
+
+Many builds produce an image identical to the one from a previous run. When
+the image, platform, harness and options affecting execution are the same, and
+the test passed before, running it again on a device gives no new
+information. Output of the device saved by the passed test is stored in the
+cache directory under a key computed from all of these, and when the key is
+found, the saved output is evaluated by log parser instead of running the
+application (the same way as with ``--replay-logs``), so the test is reported
+with all its testcases without flashing.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from twister2.constants import RESULT_CACHE_DIR, RESULT_CACHE_PROPERTY
+from twister2.device.flashed_image import compute_image_hash
+from twister2.device.replay_adapter import get_replay_log_file
+from twister2.twister_config import TwisterConfig
+from twister2.yaml_test_specification import YamlTestSpecification
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR: str = RESULT_CACHE_DIR
+#: images identifying application run on simulators and devices
+CACHED_IMAGE_FILES: tuple[str, ...] = ('zephyr.elf', 'zephyr.exe', 'zephyr.hex', 'zephyr.bin')
+ENTRY_FILE_NAME: str = 'entry.json'
+CACHE_PROPERTY: str = RESULT_CACHE_PROPERTY
+
+
+def compute_cache_key(
+    twister_config: TwisterConfig, spec: YamlTestSpecification, device_type: str
+) -> str:
+    """
+    Return key identifying run of test, or empty string if application image was not found.
+
+    :param twister_config: twister configuration
+    :param spec: test specification
+    :param device_type: type of device running the test (e.g. qemu, hardware)
+    """
+    image_hash = compute_image_hash(spec.build_dir, command=[], image_files=CACHED_IMAGE_FILES)
+    if not image_hash:
+        return ''
+    run_config = dict(
+        image=image_hash,
+        platform=spec.platform,
+        device_type=device_type,
+        harness=spec.harness,
+        harness_config=spec.harness_config,
+        ignore_faults=spec.ignore_faults,
+        timeout=spec.timeout,
+        inactivity_timeout=twister_config.inactivity_timeout,
+        testcase_timeout=twister_config.testcase_timeout,
+        west_flash=twister_config.west_flash,
+        west_runner=twister_config.west_runner,
+    )
+    return hashlib.sha256(json.dumps(run_config, sort_keys=True, default=str).encode()).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """Output of device saved by passed test."""
+    path: Path
+    nodeid: str
+    created: float
+
+    @property
+    def log_file(self) -> Path:
+        return get_replay_log_file(self.path)
+
+
+class ResultCache:
+    """Store output of passed tests in cache directory shared by sessions."""
+
+    def __init__(self, cache_dir: str | Path, expiry: float = 7) -> None:
+        """
+        :param cache_dir: cache directory
+        :param expiry: time in days after which cached results are not used
+        """
+        self.cache_dir: Path = Path(cache_dir).expanduser()
+        self.expiry = expiry
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({str(self.cache_dir)!r})'
+
+    def _is_expired(self, created: float) -> bool:
+        return self.expiry > 0 and time.time() - created > self.expiry * 24 * 3600
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return cached entry or None when not found or expired."""
+        entry_dir = self.cache_dir / key
+        try:
+            with (entry_dir / ENTRY_FILE_NAME).open(encoding='UTF-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        entry = CacheEntry(path=entry_dir, nodeid=data['nodeid'], created=data['created'])
+        if self._is_expired(entry.created) or not entry.log_file.is_file():
+            return None
+        return entry
+
+    def put(self, key: str, nodeid: str, log_file: str | Path, offset: int = 0) -> None:
+        """
+        Save output of passed test.
+
+        :param key: key identifying run of test
+        :param nodeid: test node id
+        :param log_file: file with device output
+        :param offset: position in log file where output of test starts
+        """
+        entry_dir = self.cache_dir / key
+        # entry is prepared in temporary directory, so other processes never see incomplete entry
+        tmp_dir = self.cache_dir / f'.{key}.{os.getpid()}'
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+        with open(log_file, 'rb') as source, get_replay_log_file(tmp_dir).open('wb') as target:
+            source.seek(offset)
+            shutil.copyfileobj(source, target)
+        with (tmp_dir / ENTRY_FILE_NAME).open('w', encoding='UTF-8') as file:
+            json.dump(dict(nodeid=nodeid, created=time.time()), file)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        try:
+            tmp_dir.rename(entry_dir)
+        except OSError:
+            # the same test saved by another process in the meantime
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def remove_expired(self) -> int:
+        """Remove expired entries and return number of removed entries."""
+        if not self.cache_dir.is_dir() or self.expiry <= 0:
+            return 0
+        removed: int = 0
+        for entry_file in self.cache_dir.glob(f'*/{ENTRY_FILE_NAME}'):
+            try:
+                with entry_file.open(encoding='UTF-8') as file:
+                    created = json.load(file)['created']
+            except (OSError, ValueError, KeyError):
+                created = 0
+            if self._is_expired(created):
+                shutil.rmtree(entry_file.parent, ignore_errors=True)
+                removed += 1
+        return removed
+
+
+class ResultCachePlugin:
+    """Remove expired results from cache and print how many tests were taken from cache."""
+
+    def __init__(self, result_cache: ResultCache) -> None:
+        self.result_cache = result_cache
+        self.cached_tests: int = 0
+
+    def pytest_sessionstart(self, session: pytest.Session) -> None:
+        if removed := self.result_cache.remove_expired():
+            logger.info('Removed %d expired results from cache %s', removed, self.result_cache.cache_dir)
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        if report.when == 'teardown' and dict(report.user_properties).get(CACHE_PROPERTY) == 'hit':
+            self.cached_tests += 1
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if self.cached_tests:
+            terminalreporter.write_sep('-', 'Result cache')
+            terminalreporter.write_line(
+                f'{self.cached_tests} tests passed from cache {self.result_cache.cache_dir} without running'
+            )
@@ -0,0 +1,78 @@
+"""
+Run failed tests again at the end of session.
+
+Failed test is reported with `rerun` outcome and queued to be run again after
+all other tests, in the same process (xdist worker) which run it first. The
+application is not built again, because build status of its build directory
+is already done. Test which passes when run again is classified as flaky in
+results report, test which fails in all attempts as hard failure.
+"""
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from twister2.exceptions import TwisterBuildException
+from twister2.report.helper import get_item_metadata
+
+logger = logging.getLogger(__name__)
+
+RERUN_OUTCOME: str = 'rerun'
+
+
+class RetryFailedPlugin:
+    """Queue failed tests to run them again at the end of session."""
+
+    def __init__(self, retries: int) -> None:
+        """
+        :param retries: how many times failed test is run again
+        """
+        self.retries = retries
+        self.attempts: dict[str, int] = {}  #: number of finished reruns of each test
+        self.queued_items: list[pytest.Item] = []
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.retries})'
+
+    def should_retry(self, item: pytest.Item, call: pytest.CallInfo) -> bool:
+        if self.attempts.get(item.nodeid, 0) >= self.retries:
+            return False
+        # build failure is not fixed by running test again
+        if call.excinfo is not None and call.excinfo.errisinstance(TwisterBuildException):
+            return False
+        metadata = get_item_metadata(item)
+        return metadata.runnable and not metadata.build_only
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call: pytest.CallInfo):
+        outcome = yield
+        report: pytest.TestReport = outcome.get_result()
+        if not report.failed or hasattr(report, 'wasxfail') or not self.should_retry(item, call):
+            return
+        report.outcome = RERUN_OUTCOME  # type: ignore[assignment]
+        # keep artifacts of failed test, they are needed to run it again
+        setattr(item, '_test_failed', True)
+        if item not in self.queued_items:
+            self.queued_items.append(item)
+
+    def pytest_report_teststatus(self, report: pytest.TestReport):
+        if report.outcome == RERUN_OUTCOME:
+            return RERUN_OUTCOME, 'R', ('RERUN', {'yellow': True})
+        return None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtestloop(self, session: pytest.Session):
+        outcome = yield
+        if outcome.excinfo is not None:  # e.g. session interrupted
+            return
+        # tests are run here also on xdist workers, their reports are sent to controller as usual
+        while self.queued_items and not (session.shouldfail or session.shouldstop):
+            items, self.queued_items = self.queued_items, []
+            logger.info('Running again %d failed tests', len(items))
+            for index, item in enumerate(items):
+                self.attempts[item.nodeid] = self.attempts.get(item.nodeid, 0) + 1
+                nextitem = items[index + 1] if index + 1 < len(items) else None
+                item.ihook.pytest_runtest_protocol(item=item, nextitem=nextitem)
+                if session.shouldfail or session.shouldstop:
+                    break
@@ -2,7 +2,10 @@ import argparse
 import os
 
 from twister2.platform_specification import search_platforms
+from twister2.report.results_journal import build_report
+from twister2.report.test_results_json import JsonResultsReport
 from twister2.scripts.hardware_map import print_hardware_map, scan, write_to_file
+from twister2.server import TwisterServerClient, get_socket_path, serve
 
 
 def main() -> int:
@@ -37,6 +40,38 @@ def main() -> int:
         action='store_true',
         help='list only default platforms',
     )
+    parser.add_argument(
+        '--journal-to-json',
+        dest='journal_path',
+        metavar='path',
+        help='generate results report (twister.json) from journal saved by '
+             'interrupted session (twister.jsonl)',
+    )
+    parser.add_argument(
+        '--results-json',
+        dest='results_json_path',
+        metavar='path',
+        help='path to results report generated from journal (default: next to journal)',
+    )
+    parser.add_argument(
+        '--serve',
+        dest='serve',
+        action='store_true',
+        help='run twister server keeping platforms, toolchain version and parsed '
+             'yaml files in memory for pytest sessions',
+    )
+    parser.add_argument(
+        '--stop-server',
+        dest='stop_server',
+        action='store_true',
+        help='stop twister server',
+    )
+    parser.add_argument(
+        '--server-socket',
+        dest='server_socket',
+        metavar='path',
+        help='Unix socket of twister server',
+    )
     args = parser.parse_args()
 
     if args.hardware_map_path:
@@ -54,6 +89,23 @@ def main() -> int:
             print(platform.identifier)
         print(f'\nTotal: {len(platforms)}')
         return 0
+    if args.journal_path:
+        results_json_path = args.results_json_path or os.path.splitext(args.journal_path)[0] + '.json'
+        JsonResultsReport(results_json_path).write(build_report(args.journal_path))
+        print(f'Results report saved as {results_json_path}')
+        return 0
+
+    if args.serve:
+        serve(get_socket_path(args.server_socket))
+        return 0
+    if args.stop_server:
+        if (client := TwisterServerClient.connect(get_socket_path(args.server_socket))) is None:
+            print('Twister server is not running')
+            return 1
+        client.call('stop')
+        client.close()
+        print('Twister server stopped')
+        return 0
 
     parser.print_help()
     return 0
@@ -0,0 +1,319 @@
+"""
+Server keeping data needed to collect tests in memory between sessions.
+
+Every session reads definitions of all platforms, runs CMake script to detect
+toolchain and parses YAML files of all tests. Server started with
+``twister_tools --serve`` keeps them in memory, and the plugin asks it for them
+over Unix socket when the socket exists. Cached data is invalidated when any
+file it was read from, or directory listed to find such files, is modified.
+Tests are still generated and filtered by the plugin, because selection
+depends on all options of the session.
+
+Messages are pickled, so the socket is accessible only by its owner.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import signal
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable
+
+import pytest
+
+from twister2.constants import SERVER_SOCKET_PATH, SERVER_SOCKET_PATH_ENV
+from twister2.environment.environment import detect_toolchain_version
+from twister2.environment.environment_cache import get_toolchain_env
+from twister2.exceptions import TwisterException
+from twister2.helper import safe_load_yaml
+from twister2.platform_specification import (
+    PlatformSpecification,
+    get_board_roots,
+    search_platforms,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH: str = SERVER_SOCKET_PATH
+SOCKET_PATH_ENV: str = SERVER_SOCKET_PATH_ENV
+_HEADER = struct.Struct('!I')
+
+
+def get_socket_path(socket_path: str | None = None) -> Path:
+    """Return path to socket of server: given, from environment variable or default one."""
+    return Path(socket_path or os.environ.get(SOCKET_PATH_ENV) or DEFAULT_SOCKET_PATH).expanduser()
+
+
+def send_message(sock: socket.socket, message: Any) -> None:
+    data = pickle.dumps(message)
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def receive_message(sock: socket.socket) -> Any:
+    (size,) = _HEADER.unpack(_receive_exactly(sock, _HEADER.size))
+    return pickle.loads(_receive_exactly(sock, size))
+
+
+def _receive_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks: list[bytes] = []
+    while size:
+        if not (chunk := sock.recv(min(size, 1 << 20))):
+            raise ConnectionError('Connection closed')
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def _get_mtime(path: str | Path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def get_platform_files(zephyr_base: str, board_root: str | None = None) -> list[Path]:
+    """Return files and directories read by searching platforms."""
+    paths: list[Path] = []
+    for board_root_dir in map(Path, get_board_roots(zephyr_base, board_root)):
+        paths.append(board_root_dir)
+        paths.extend(path for path in board_root_dir.glob('*') if path.is_dir())
+        # directories of boards are listed also to find revisions of platforms
+        paths.extend(path for path in board_root_dir.glob('*/*') if path.is_dir())
+        paths.extend(board_root_dir.glob('*/*/*.yaml'))
+    return paths
+
+
+class FileSnapshot:
+    """Modification times of files and directories."""
+
+    def __init__(self, paths: Iterable[str | Path]) -> None:
+        self.mtimes: dict[str, int] = {str(path): _get_mtime(path) for path in paths}
+
+    def is_modified(self) -> bool:
+        return any(_get_mtime(path) != mtime for path, mtime in self.mtimes.items())
+
+
+class ResidentCache:
+    """Data read from files, kept until any of the files is modified."""
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, tuple[Any, FileSnapshot]] = {}
+        self._lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, load: Callable[[], Any], watched: Callable[[], Iterable[str | Path]]) -> Any:
+        """
+        Return cached value or load it again when watched files were modified.
+
+        :param key: key of value
+        :param load: function loading value
+        :param watched: function returning files and directories value is read from
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and not entry[1].is_modified():
+            with self._lock:
+                self.hits += 1
+            return entry[0]
+        # snapshot is taken before loading, so modification during loading invalidates value
+        snapshot = FileSnapshot(watched())
+        value = load()
+        with self._lock:
+            self._entries[key] = (value, snapshot)
+            self.misses += 1
+        return value
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    server: TwisterServer
+
+    def handle(self) -> None:
+        # connection is kept open by client for the whole session
+        while True:
+            try:
+                method, kwargs = receive_message(self.request)
+            except (OSError, EOFError):
+                return
+            try:
+                if method not in TwisterServer.METHODS:
+                    raise TwisterException(f'Unknown method of twister server: {method}')
+                response = (True, getattr(self.server, method)(**kwargs))
+            except (Exception, pytest.exit.Exception) as e:
+                logger.warning('Request %s failed: %s', method, e)
+                response = (False, e)
+            try:
+                send_message(self.request, response)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                send_message(self.request, (False, TwisterException(str(e))))
+            if self.server.stopping:
+                # shutdown waits for loop serving requests, so it cannot be called in this thread
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class TwisterServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serve platforms, toolchain version and parsed YAML files to sessions."""
+
+    daemon_threads = True
+    #: methods which can be called by client
+    METHODS: tuple[str, ...] = ('search_platforms', 'get_toolchain_version', 'load_yaml', 'status', 'stop')
+
+    def __init__(self, socket_path: str | Path) -> None:
+        """
+        :param socket_path: path to Unix socket
+        """
+        self.socket_path = Path(socket_path)
+        self.cache = ResidentCache()
+        self.started: float = time.time()
+        self.stopping: bool = False
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            if (client := TwisterServerClient.connect(self.socket_path)) is not None:
+                client.close()
+                raise TwisterException(f'Twister server is already running: {self.socket_path}')
+            self.socket_path.unlink()  # left by server which was killed
+        umask = os.umask(0o077)  # socket is created accessible only by owner
+        try:
+            super().__init__(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(umask)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+    def search_platforms(self, zephyr_base: str, board_root: str | None = None) -> list[PlatformSpecification]:
+        return self.cache.get(
+            ('platforms', zephyr_base, tuple(board_root or ())),
+            load=lambda: search_platforms(zephyr_base, board_root),
+            watched=lambda: get_platform_files(zephyr_base, board_root),
+        )
+
+    def get_toolchain_version(self, zephyr_base: str, env: dict[str, str]) -> str:
+        """
+        :param zephyr_base: path to Zephyr directory
+        :param env: environment variables of client, toolchain is detected in the same environment
+        """
+        toolchain_env = tuple(sorted(get_toolchain_env(env).items()))
+        return self.cache.get(
+            ('toolchain', zephyr_base, toolchain_env),
+            load=lambda: detect_toolchain_version(zephyr_base, env),
+            watched=lambda: [Path(zephyr_base) / 'cmake' / 'verify-toolchain.cmake'],
+        )
+
+    def load_yaml(self, filename: str) -> dict:
+        return self.cache.get(
+            ('yaml', filename),
+            load=lambda: safe_load_yaml(Path(filename)),
+            watched=lambda: [filename],
+        )
+
+    def status(self) -> dict:
+        return dict(
+            pid=os.getpid(),
+            uptime=time.time() - self.started,
+            entries=len(self.cache),
+            hits=self.cache.hits,
+            misses=self.cache.misses,
+        )
+
+    def stop(self) -> None:
+        """Stop server after response is sent."""
+        self.stopping = True
+
+
+def serve(socket_path: str | Path) -> None:
+    """Run twister server until it is stopped by client or signal."""
+    server = TwisterServer(socket_path)
+    signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+    logger.info('Twister server (pid %d) is listening on %s', os.getpid(), socket_path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info('Twister server stopped')
+
+
+class TwisterServerClient:
+    """
+    Connection of session to twister server.
+
+    When server stops responding, data is read by the session itself.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._socket: socket.socket | None = sock
+
+    @classmethod
+    def connect(cls, socket_path: str | Path) -> TwisterServerClient | None:
+        """Return client connected to server, or None if server is not running."""
+        if not os.path.exists(socket_path):
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(str(socket_path))
+        except OSError as e:
+            logger.warning('Cannot connect to twister server %s: %s', socket_path, e)
+            sock.close()
+            return None
+        logger.info('Connected to twister server %s', socket_path)
+        return cls(sock)
+
+    @property
+    def connected(self) -> bool:
+        return self._socket is not None
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def call(self, method: str, **kwargs: Any) -> Any:
+        """Call method of server and return its result, exception raised by server is raised again."""
+        if self._socket is None:
+            raise ConnectionError('Not connected to twister server')
+        send_message(self._socket, (method, kwargs))
+        succeeded, result = receive_message(self._socket)
+        if not succeeded:
+            raise result
+        return result
+
+    def _call_or_load(self, method: str, load: Callable[[], Any], **kwargs: Any) -> Any:
+        if self._socket is not None:
+            try:
+                return self.call(method, **kwargs)
+            except (OSError, EOFError, pickle.UnpicklingError) as e:
+                logger.warning('Twister server stopped responding, data is read without it: %s', e)
+                self.close()
+        return load()
+
+    def search_platforms(self, zephyr_base: str, board_root: str | None = None) -> list[PlatformSpecification]:
+        return self._call_or_load(
+            'search_platforms', lambda: search_platforms(zephyr_base, board_root),
+            zephyr_base=zephyr_base, board_root=board_root
+        )
+
+    def get_toolchain_version(self, zephyr_base: str) -> str:
+        return self._call_or_load(
+            'get_toolchain_version', lambda: detect_toolchain_version(zephyr_base),
+            zephyr_base=zephyr_base, env=dict(os.environ)
+        )
+
+    def load_yaml(self, filename: Path) -> dict:
+        return self._call_or_load(
+            'load_yaml', lambda: safe_load_yaml(filename), filename=str(filename.resolve())
+        )
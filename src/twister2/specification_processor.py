@@ -38,7 +38,10 @@ class SpecificationProcessor(abc.ABC):
         self.twister_config = twister_config
         assert spec_filepath.exists(), f'Spec file does not exist: {spec_filepath}'
         self.spec_file_path = spec_filepath
-        self.tests: dict = extract_tests(safe_load_yaml(spec_filepath))
+        if twister_config.server is not None:
+            self.tests: dict = extract_tests(twister_config.server.load_yaml(spec_filepath))
+        else:
+            self.tests = extract_tests(safe_load_yaml(spec_filepath))
         self.test_directory_path: Path = spec_filepath.parent
 
     def process(  # type: ignore[return]
@@ -0,0 +1,163 @@
+"""
+Run the longest tests first.
+
+Tests are collected in order of test files, so a few long tests starting at
+the end of session often keep one worker busy while all other workers are
+idle. Duration of each test (build and execution) is estimated from results
+report of a previous run, and tests are sorted from the longest one. Tests
+not found in the previous report are expected to take average time of tests
+on platforms of the same type.
+"""
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import pytest
+
+from twister2.filter.shard_plugin import read_test_costs, split_into_shards
+from twister2.helper import find_archived_output_dirs, get_build_dir
+from twister2.report.helper import get_item_metadata
+from twister2.twister_config import TwisterConfig
+
+logger = logging.getLogger(__name__)
+
+RESULTS_FILE_NAME: str = 'twister.json'
+
+#: expected duration in seconds of test on platform type when there is no previous result for it
+DEFAULT_COSTS: dict[str, float] = {
+    'qemu': 60.0,
+    'sim': 60.0,
+    'mcu': 60.0,
+    'native': 30.0,
+    'unit': 10.0,
+}
+DEFAULT_COST: float = 30.0
+
+WORKERINPUT_KEY: str = 'twister_test_costs'
+
+
+def find_previous_results(output_dir: str | Path) -> Path | None:
+    """
+    Return results report of previous run.
+
+    Report is searched in output directory and then in the latest archived
+    output directory (`<output_dir>_<date>`).
+
+    :param output_dir: output directory
+    :return: path to report or None if not found
+    """
+    for directory in [Path(output_dir), *find_archived_output_dirs(output_dir)]:
+        if (results_path := directory / RESULTS_FILE_NAME).is_file():
+            return results_path
+    return None
+
+
+def _get_platform_type(twister_config: TwisterConfig, platform_name: str) -> str:
+    try:
+        return twister_config.get_platform(platform_name).type
+    except KeyError:
+        return ''
+
+
+class DurationOrderPlugin:
+    """Sort tests from the longest one using durations from previous run."""
+
+    def __init__(self, config: pytest.Config, test_costs: dict[tuple[str, str], float], workers: int = 1):
+        """
+        :param config: pytest configuration
+        :param test_costs: durations of tests from previous run
+        :param workers: number of tests run in parallel
+        """
+        self.config = config
+        self.test_costs = test_costs
+        self.workers = max(workers, 1)
+        self.group_costs: dict[str, float] = {}
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}()'
+
+    @classmethod
+    def create(cls, config: pytest.Config) -> DurationOrderPlugin:
+        workers = config.getoption('numprocesses', None) or 1
+        if hasattr(config, 'workerinput'):
+            # xdist worker uses durations read by controller, previous results can be already removed
+            test_costs = {
+                (name, platform): cost for name, platform, cost in config.workerinput.get(WORKERINPUT_KEY, [])
+            }
+            return cls(config, test_costs, workers)
+
+        results_path: str | Path | None = config.option.order_by_duration
+        if results_path == 'auto':
+            results_path = find_previous_results(config.option.output_dir)
+        test_costs = {}
+        if results_path:
+            try:
+                test_costs = read_test_costs(results_path)
+            except (OSError, ValueError) as e:
+                logger.warning('Cannot read durations of tests from %s: %s', results_path, e)
+            else:
+                logger.info('Using durations of %d tests from %s', len(test_costs), results_path)
+        else:
+            logger.warning('Not found results of previous run, durations of tests are estimated by platform type')
+        return cls(config, test_costs, workers)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node) -> None:
+        """Send durations of tests to xdist worker, so all workers sort tests the same way."""
+        node.workerinput[WORKERINPUT_KEY] = [
+            [name, platform, cost] for (name, platform), cost in self.test_costs.items()
+        ]
+
+    def get_platform_type_costs(self, twister_config: TwisterConfig) -> dict[str, float]:
+        """Return average duration of tests for each platform type."""
+        durations: dict[str, list[float]] = {}
+        for (_, platform_name), cost in self.test_costs.items():
+            if platform_type := _get_platform_type(twister_config, platform_name):
+                durations.setdefault(platform_type, []).append(cost)
+        return {platform_type: sum(costs) / len(costs) for platform_type, costs in durations.items()}
+
+    def get_item_cost(
+        self, item: pytest.Item, twister_config: TwisterConfig, platform_type_costs: dict[str, float]
+    ) -> float:
+        metadata = get_item_metadata(item)
+        if (cost := self.test_costs.get((metadata.name, metadata.platform))) is not None:
+            return cost
+        platform_type = _get_platform_type(twister_config, metadata.platform)
+        return platform_type_costs.get(platform_type, DEFAULT_COSTS.get(platform_type, DEFAULT_COST))
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(
+        self, session: pytest.Session, config: pytest.Config, items: list[pytest.Item]
+    ) -> None:
+        twister_config: TwisterConfig = config.twister_config  # type: ignore[attr-defined]
+        platform_type_costs = self.get_platform_type_costs(twister_config)
+        group_costs: dict[str, float] = {}
+        for item in items:
+            build_dir = get_build_dir(item)
+            group_costs[build_dir] = group_costs.get(build_dir, 0.0) + self.get_item_cost(
+                item, twister_config, platform_type_costs
+            )
+        self.group_costs = group_costs
+
+        # tests sharing a build are kept together, order of tests with the same cost is kept
+        group_order: dict[str, int] = {}
+        for item in items:
+            group_order.setdefault(get_build_dir(item), len(group_order))
+        items.sort(key=lambda item: (-group_costs[get_build_dir(item)], group_order[get_build_dir(item)]))
+
+    def get_makespan(self) -> float:
+        """Return expected time of running all tests by all workers."""
+        if not self.group_costs:
+            return 0.0
+        shards = split_into_shards(self.group_costs, self.workers)
+        return max(sum(self.group_costs[key] for key in shard) for shard in shards)
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if not self.group_costs:
+            return
+        terminalreporter.write_sep('-', 'Expected duration')
+        terminalreporter.write_line(
+            f'{len(self.group_costs)} builds, total {sum(self.group_costs.values()):.0f} s, '
+            f'expected makespan {self.get_makespan():.0f} s on {self.workers} workers'
+        )
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import os
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -15,6 +16,9 @@ from twister2.platform_specification import (
 )
 from twister2.quarantine import QuarantineData
 
+if TYPE_CHECKING:
+    from twister2.server import TwisterServerClient
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,8 +50,31 @@ class TwisterConfig:
     only_failed: bool = False
     west_flash: list[str] = field(default_factory=list, repr=False)
     west_runner: str = ''
+    direct_run: bool = False
+    force_flash: bool = False
+    dut_scope: str = 'function'
+    replay_logs: bool = False
+    inactivity_timeout: float = 0
+    testcase_timeout: float = 0
+    subtest_reporting: str = 'case'
+    resource_admission: bool = False
+    host_ram_budget: float = 0
+    host_cpu_budget: float = 0
+    sim_ram_factor: float = 2.0
+    sim_cpus: float = 1.0
+    #: directory of result cache, empty when cache is disabled
+    result_cache_dir: str = ''
+    result_cache_expiry: float = 7
+    #: connection to twister server, None when server is not used
+    server: TwisterServerClient | None = field(default=None, repr=False, compare=False)
+    #: platforms by identifier, built from `platforms` which are not modified after configuration is created
+    _platforms_by_name: dict[str, PlatformSpecification] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
+        for platform in self.platforms:
+            self._platforms_by_name.setdefault(platform.identifier, platform)
         self.verify_platforms_existence(self.preselected_platforms)
 
     @classmethod
@@ -77,6 +104,21 @@ class TwisterConfig:
         if config.option.west_flash:
             west_flash = [w.strip() for w in config.option.west_flash.split(',')]
         west_runner: str = config.option.west_runner or ''
+        direct_run: bool = config.option.direct_run
+        force_flash: bool = config.option.force_flash
+        dut_scope: str = config.option.dut_scope
+        replay_logs: bool = config.option.replay_logs
+        inactivity_timeout: float = config.option.inactivity_timeout
+        testcase_timeout: float = config.option.testcase_timeout
+        subtest_reporting: str = config.option.subtest_reporting
+        resource_admission: bool = config.option.resource_admission
+        host_ram_budget: float = config.option.host_ram_budget
+        host_cpu_budget: float = config.option.host_cpu_budget
+        sim_ram_factor: float = config.option.sim_ram_factor
+        sim_cpus: float = config.option.sim_cpus
+        result_cache_dir: str = config.option.result_cache_dir if config.option.result_cache else ''
+        result_cache_expiry: float = config.option.result_cache_expiry
+        server: TwisterServerClient | None = getattr(config, '_twister_server', None)
 
         hardware_map_list: list[HardwareMap] = _get_hardware_map_list(config)
         if not config.option.platform and hardware_map_list:
@@ -92,7 +134,7 @@ class TwisterConfig:
 
         preselected_platforms = _get_preselected_platforms(config)
 
-        used_toolchain_version = get_toolchain_version(output_dir, zephyr_base)
+        used_toolchain_version = get_toolchain_version(output_dir, zephyr_base, server)
 
         quarantine = QuarantineData()
         if config.option.quarantine_list_path:
@@ -122,7 +164,22 @@ class TwisterConfig:
             load_tests_path=load_tests_path,
             only_failed=only_failed,
             west_flash=west_flash,
-            west_runner=west_runner
+            west_runner=west_runner,
+            direct_run=direct_run,
+            force_flash=force_flash,
+            dut_scope=dut_scope,
+            replay_logs=replay_logs,
+            inactivity_timeout=inactivity_timeout,
+            testcase_timeout=testcase_timeout,
+            subtest_reporting=subtest_reporting,
+            resource_admission=resource_admission,
+            host_ram_budget=host_ram_budget,
+            host_cpu_budget=host_cpu_budget,
+            sim_ram_factor=sim_ram_factor,
+            sim_cpus=sim_cpus,
+            result_cache_dir=result_cache_dir,
+            result_cache_expiry=result_cache_expiry,
+            server=server,
         )
 
     def asdict(self) -> dict:
@@ -135,31 +192,32 @@ class TwisterConfig:
             output_dir=self.output_dir,
         )
 
-    def get_hardware_map(self, platform: str) -> HardwareMap | None:
+    def get_hardware_map(self, platform: str, fixture: str = '') -> HardwareMap | None:
         """
-        Return hardware map matching platform and being connected.
+        Return hardware map matching platform and fixture and being connected.
 
         :param platform: platform name
+        :param fixture: fixture required by test
         :return: hardware map or None
         """
         hardware_map_iter = (
             hardware for hardware in self.hardware_map_list
             if hardware.platform == platform
             if hardware.connected is True
+            if not fixture or fixture in hardware.fixtures
         )
         return next(hardware_map_iter, None)
 
     def get_platform(self, name: str) -> PlatformSpecification:
-        for platform in self.platforms:
-            if platform.identifier == name:
-                return platform
-        raise KeyError(f'There is not platform with identifier: {name}')
+        try:
+            return self._platforms_by_name[name]
+        except KeyError:
+            raise KeyError(f'There is not platform with identifier: {name}') from None
 
     def verify_platforms_existence(self, platform_names_to_verify: list[str]):
         """Verify if platform names are correct, if not - raise exception"""
-        platform_names = [p.identifier for p in self.platforms]
         for platform in platform_names_to_verify:
-            if platform not in platform_names:
+            if platform not in self._platforms_by_name:
                 msg = f'Unrecognized platform - {platform}.'
                 logger.error(msg)
                 raise TwisterConfigurationException(msg)
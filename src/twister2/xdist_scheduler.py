@@ -0,0 +1,66 @@
+"""
+Scheduling of tests on xdist workers keeping tests sharing a build together.
+
+With default xdist load scheduling, tests using the same build directory (e.g.
+parametrized regular pytest tests) are sent to different workers. One of them
+builds the application, and others are blocked waiting for the build to
+finish. `BuildGroupScheduling` sends all tests sharing a build to the same
+worker as one unit of work, other tests are distributed one by one as with
+load scheduling.
+
+Module can be imported only when pytest-xdist is installed.
+"""
+from __future__ import annotations
+
+import logging
+from collections import Counter
+
+import pytest
+from xdist.scheduler import LoadScopeScheduling
+
+from twister2.helper import get_build_dir
+
+logger = logging.getLogger(__name__)
+
+
+class BuildGroupScheduling(LoadScopeScheduling):
+    """Load scheduling with tests sharing a build directory run on one worker."""
+
+    def __init__(self, config: pytest.Config, log=None, build_groups: dict[str, str] | None = None) -> None:
+        """
+        :param config: pytest configuration
+        :param log: xdist logger
+        :param build_groups: build directory of tests which share it with other tests
+        """
+        super().__init__(config, log)
+        self.build_groups: dict[str, str] = build_groups or {}
+
+    def _split_scope(self, nodeid: str) -> str:
+        return self.build_groups.get(nodeid, nodeid)
+
+
+class BuildGroupSchedulingPlugin:
+    """Use `BuildGroupScheduling` instead of xdist load scheduling."""
+
+    def __init__(self) -> None:
+        self.build_groups: dict[str, str] = {}
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}()'
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(
+        self, session: pytest.Session, config: pytest.Config, items: list[pytest.Item]
+    ) -> None:
+        build_dirs: dict[str, str] = {item.nodeid: get_build_dir(item) for item in items}
+        counter: Counter = Counter(build_dirs.values())
+        self.build_groups = {
+            nodeid: build_dir for nodeid, build_dir in build_dirs.items() if counter[build_dir] > 1
+        }
+        logger.debug('Found %d tests sharing build directory with other tests', len(self.build_groups))
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_xdist_make_scheduler(self, config: pytest.Config, log) -> BuildGroupScheduling | None:
+        if config.getvalue('dist') != 'load':
+            return None
+        return BuildGroupScheduling(config, log, self.build_groups)
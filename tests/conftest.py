@@ -1,5 +1,6 @@
 from collections import namedtuple
 from pathlib import Path
+from typing import Generator
 from unittest import mock
 
 import pytest
@@ -40,6 +41,14 @@ def copy_example(pytester) -> Path:
     return pytester.path
 
 
+@pytest.fixture(scope='session', autouse=True)
+def environment_cache_file(tmp_path_factory) -> Generator[Path, None, None]:
+    """Do not use cache of environment information of user in tests."""
+    cache_file = tmp_path_factory.mktemp('cache') / 'environment.json'
+    with mock.patch('twister2.environment.environment.ENVIRONMENT_CACHE_FILE', str(cache_file)):
+        yield cache_file
+
+
 @pytest.fixture(scope='function', autouse=True)
 def mock_get_toolchain_version():
     """
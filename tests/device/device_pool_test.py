@@ -0,0 +1,73 @@
+from unittest import mock
+
+import pytest
+
+from twister2.device.device_pool import DevicePool
+from twister2.device.simulator_adapter import NativeSimulatorAdapter
+from twister2.twister_config import TwisterConfig
+
+
+@pytest.fixture(name='pool')
+def fixture_pool() -> DevicePool:
+    return DevicePool()
+
+
+def test_if_device_is_reused_for_the_same_build_dir(pool):
+    device = mock.Mock()
+    finalizer = mock.Mock()
+    pool.put('build_1', device, finalizer=finalizer)
+
+    pooled_device = pool.acquire('build_1')
+    assert pooled_device is not None
+    assert pooled_device.device is device
+    assert pooled_device.tests == 2
+    finalizer.assert_not_called()
+
+
+def test_if_device_is_released_when_other_build_dir_is_acquired(pool):
+    finalizer = mock.Mock()
+    pool.put('build_1', mock.Mock(), finalizer=finalizer)
+
+    assert pool.acquire('build_2') is None
+    finalizer.assert_called_once()
+    assert pool.find('build_1') is None
+
+
+def test_if_finalizers_are_called_in_order_of_registration_despite_errors(pool):
+    calls = []
+
+    def failing_finalizer():
+        calls.append('device')
+        raise RuntimeError('cannot stop')
+
+    pooled_device = pool.put('build_1', mock.Mock(), finalizer=failing_finalizer)
+    pooled_device.finalizers['artifacts'] = lambda: calls.append('artifacts')
+    pool.release()
+    pool.release()
+    assert calls == ['device', 'artifacts']
+
+
+def test_if_simulator_is_started_again_on_reset_when_finished():
+    device = NativeSimulatorAdapter(TwisterConfig('zephyr'))
+    device.command = ['python3', '-c', 'print("booting")']
+    device.flash_and_run(timeout=4)
+    assert list(device.iter_stdout) == ['booting']
+    device._thread.join(timeout=4)
+
+    device.reset(timeout=4)
+    assert list(device.iter_stdout) == ['booting']
+    device.stop()
+
+
+def test_if_running_simulator_is_restarted_on_reset():
+    device = NativeSimulatorAdapter(TwisterConfig('zephyr'))
+    device.command = ['python3', '-u', '-c', 'import time; print("booting"); time.sleep(30)']
+    device.flash_and_run(timeout=30)
+    assert next(line for line in device.iter_stdout if line) == 'booting'
+    first_process = device._process
+
+    device.reset(timeout=30)
+    assert next(line for line in device.iter_stdout if line) == 'booting'
+    assert first_process.returncode is not None
+    assert device._process is not first_process
+    device.stop()
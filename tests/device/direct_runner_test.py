@@ -0,0 +1,122 @@
+import sys
+import textwrap
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from twister2.device.direct_runner import get_flash_command, get_run_command
+from twister2.device.hardware_adapter import HardwareAdapter
+from twister2.device.hardware_map import HardwareMap
+from twister2.device.qemu_adapter import QemuAdapter
+from twister2.twister_config import TwisterConfig
+
+BUILD_NINJA_CONTENT = textwrap.dedent("""\
+    ninja_required_version = 1.5
+
+    build zephyr/zephyr.elf: C_EXECUTABLE_LINKER__zephyr_final zephyr/CMakeFiles/zephyr_final.dir/misc/empty_file.c.obj
+      LINK_FLAGS = -gdwarf-4
+
+    build CMakeFiles/run_qemu | ${cmake_ninja_workdir}CMakeFiles/run_qemu: CUSTOM_COMMAND zephyr/zephyr.elf
+      COMMAND = cd /build && /usr/bin/qemu-system-arm -cpu cortex-m3 -nographic -kernel /build/zephyr/zephyr.elf
+      pool = console
+
+    build run_qemu: phony CMakeFiles/run_qemu
+
+    build CMakeFiles/run | ${cmake_ninja_workdir}CMakeFiles/run: phony || run_qemu
+
+    build run: phony CMakeFiles/run
+""")
+
+
+@pytest.fixture
+def build_dir(tmp_path) -> Path:
+    (tmp_path / 'CMakeCache.txt').write_text('CMAKE_GENERATOR:INTERNAL=Ninja\n')
+    (tmp_path / 'build.ninja').write_text(BUILD_NINJA_CONTENT)
+    return tmp_path
+
+
+def test_if_run_command_is_taken_from_build_ninja(build_dir):
+    direct_command = get_run_command(build_dir)
+    assert direct_command is not None
+    assert direct_command.cwd == '/build'
+    assert direct_command.command == [
+        '/usr/bin/qemu-system-arm', '-cpu', 'cortex-m3', '-nographic', '-kernel', '/build/zephyr/zephyr.elf'
+    ]
+
+
+def test_if_run_command_is_none_for_not_ninja_generator(build_dir):
+    (build_dir / 'CMakeCache.txt').write_text('CMAKE_GENERATOR:INTERNAL=Unix Makefiles\n')
+    assert get_run_command(build_dir) is None
+
+
+def test_if_run_command_is_none_when_build_ninja_does_not_exist(tmp_path):
+    assert get_run_command(tmp_path) is None
+
+
+def test_if_run_command_is_none_for_complex_shell_command(build_dir):
+    content = BUILD_NINJA_CONTENT.replace(
+        '-kernel /build/zephyr/zephyr.elf', '-kernel /build/zephyr/zephyr.elf && echo done'
+    )
+    (build_dir / 'build.ninja').write_text(content)
+    assert get_run_command(build_dir) is None
+
+
+def test_if_flash_command_is_none_without_runners_yaml(tmp_path):
+    assert get_flash_command(tmp_path, 'zephyr') is None
+
+
+def test_if_flash_command_calls_runner_directly(tmp_path):
+    zephyr_base = tmp_path / 'zephyr_base'
+    (zephyr_base / 'scripts' / 'west_commands' / 'runners').mkdir(parents=True)
+    (tmp_path / 'zephyr').mkdir()
+    (tmp_path / 'zephyr' / 'runners.yaml').write_text(textwrap.dedent("""\
+        flash-runner: jlink
+        runners:
+          - jlink
+          - pyocd
+        args:
+          jlink:
+            - --dt-flash=y
+    """))
+    command = get_flash_command(tmp_path, zephyr_base, runner_args=['--erase'])
+    assert command == [
+        sys.executable, '-m', 'twister2.device.direct_runner',
+        '--zephyr-base', str(zephyr_base),
+        '--build-dir', str(tmp_path),
+        '--runner', 'jlink',
+        '--', '--erase'
+    ]
+    assert get_flash_command(tmp_path, zephyr_base, runner='nrfjprog') is None
+
+
+def test_if_qemu_adapter_uses_direct_run_command(build_dir):
+    adapter = QemuAdapter(TwisterConfig(zephyr_base='zephyr', direct_run=True), build_dir)
+    adapter.generate_command(build_dir)
+    assert adapter.command[0] == '/usr/bin/qemu-system-arm'
+    assert adapter.cwd == '/build'
+    assert adapter.launcher == 'direct'
+
+
+@mock.patch('shutil.which', return_value='/usr/bin/west')
+def test_if_qemu_adapter_falls_back_to_west(patched_which, tmp_path):
+    adapter = QemuAdapter(TwisterConfig(zephyr_base='zephyr', direct_run=True), tmp_path)
+    adapter.generate_command(tmp_path)
+    assert adapter.command == ['/usr/bin/west', 'build', '-d', str(tmp_path), '-t', 'run']
+    assert adapter.launcher == 'west'
+
+
+@mock.patch('twister2.device.hardware_adapter.get_flash_command', return_value=['python', '-m', 'runner'])
+@mock.patch('twister2.device.hardware_adapter.shutil.which', return_value='west')
+def test_if_hardware_adapter_keeps_west_as_fallback(patched_which, patched_flash_command, resources):
+    device = HardwareAdapter(
+        TwisterConfig(zephyr_base=str(resources), direct_run=True),
+        hardware_map=HardwareMap(id='test', runner='pyocd', connected=True)
+    )
+    device.generate_command('src')
+    patched_flash_command.assert_called_once_with('src', str(resources), 'pyocd', ['--board-id', 'test'])
+    assert device.command == ['python', '-m', 'runner']
+    assert device.launcher == 'direct'
+    assert device.fallback_command == [
+        'west', 'flash', '--skip-rebuild', '--build-dir', 'src', '--runner', 'pyocd', '--', '--board-id', 'test'
+    ]
@@ -1,10 +1,12 @@
 import os
+import time
 from unittest import mock
 
 import pytest
 
 from twister2.device.hardware_adapter import HardwareAdapter
 from twister2.device.hardware_map import HardwareMap
+from twister2.device.serial_reader import SerialReader
 from twister2.exceptions import TwisterFlashException
 from twister2.log_files.log_file import DeviceLogFile, HandlerLogFile
 from twister2.twister_config import TwisterConfig
@@ -219,3 +221,105 @@ def test_if_get_command_returns_proper_string_with_west_flash(patched_which, dev
         'west', 'flash', '--skip-rebuild', '--build-dir', 'src', '--runner', 'pyocd',
         '--', '--board-id=foobar', '--erase'
     ]
+
+
+@pytest.fixture
+def device_with_image(device, tmp_path, monkeypatch) -> HardwareAdapter:
+    (tmp_path / 'zephyr').mkdir()
+    (tmp_path / 'zephyr' / 'zephyr.hex').write_text(':00000001FF')
+    device.twister_config.output_dir = str(tmp_path / 'out')
+    device.hardware_map.runner = 'nrfjprog'
+    monkeypatch.setattr('twister2.device.hardware_adapter.shutil.which', lambda name: name)
+    device.generate_command(tmp_path)
+    return device
+
+
+@mock.patch('twister2.device.hardware_adapter.subprocess.run')
+@mock.patch('twister2.device.hardware_adapter.subprocess.Popen')
+def test_if_flashing_is_skipped_when_device_holds_the_same_image(patched_popen, patched_run, device_with_image):
+    popen_mock = mock.Mock(returncode=0)
+    popen_mock.communicate.return_value = (b'', None)
+    patched_popen.return_value = popen_mock
+    patched_run.return_value = mock.Mock(returncode=0)
+
+    device_with_image.flash_and_run()
+    assert patched_popen.call_count == 1
+    assert device_with_image.flashing_skipped is False
+
+    device_with_image.flash_and_run()
+    assert patched_popen.call_count == 1
+    assert device_with_image.flashing_skipped is True
+    assert patched_run.call_args[0][0] == ['nrfjprog', '--reset', '--snr', 'test']
+
+    device_with_image.twister_config.force_flash = True
+    device_with_image.flash_and_run()
+    assert patched_popen.call_count == 2
+    assert device_with_image.flashing_skipped is False
+
+
+@mock.patch('twister2.device.hardware_adapter.subprocess.run')
+@mock.patch('twister2.device.hardware_adapter.subprocess.Popen')
+def test_if_device_is_flashed_when_reset_failed(patched_popen, patched_run, device_with_image):
+    popen_mock = mock.Mock(returncode=0)
+    popen_mock.communicate.return_value = (b'', None)
+    patched_popen.return_value = popen_mock
+    patched_run.return_value = mock.Mock(returncode=1)
+
+    device_with_image.flash_and_run()
+    device_with_image.flash_and_run()
+    assert patched_popen.call_count == 2
+    assert device_with_image.flashing_skipped is False
+
+
+@mock.patch('twister2.device.hardware_adapter.subprocess.run')
+@mock.patch('twister2.device.hardware_adapter.subprocess.Popen')
+def test_if_reused_device_is_only_reset(patched_popen, patched_run, device_with_image):
+    patched_run.return_value = mock.Mock(returncode=0)
+    device_with_image.reset()
+    patched_popen.assert_not_called()
+    assert patched_run.call_args[0][0] == ['nrfjprog', '--reset', '--snr', 'test']
+
+
+def test_if_silence_of_device_is_not_saved_in_serial_output(device, tmp_path) -> None:
+    chunks = [b'line 1\n', b'', b'\nline 2\n']
+
+    def read(size):
+        if not chunks:
+            raise OSError('port closed')
+        if not (chunk := chunks.pop(0)):
+            time.sleep(0.3)  # device is silent longer than read timeout
+        return chunk
+
+    connection = mock.Mock(in_waiting=0)
+    connection.read.side_effect = read
+    device.connection = connection
+    device.read_timeout = 0.1
+    device.serial_reader = SerialReader(connection)
+    device.serial_reader.start()
+    output_file = tmp_path / 'serial.log'
+    device.save_serial_output_to_file(output_file)
+    # empty line sent by device is kept
+    assert output_file.read_text() == 'line 1\n\nline 2\n'
+
+
+def test_if_saving_serial_output_of_running_device_stops_after_timeout(device, tmp_path) -> None:
+    chunks = [b'line 1\n']
+
+    def read(size):
+        if chunks:
+            return chunks.pop(0)
+        time.sleep(0.05)  # device keeps running, but it is silent
+        return b''
+
+    connection = mock.Mock(in_waiting=0)
+    connection.read.side_effect = read
+    device.connection = connection
+    device.read_timeout = 0.1
+    device.serial_reader = SerialReader(connection)
+    device.serial_reader.start()
+    output_file = tmp_path / 'serial.log'
+    start = time.time()
+    device.save_serial_output_to_file(output_file, timeout=0.5)
+    device.serial_reader.stop()
+    assert time.time() - start < 5
+    assert output_file.read_text() == 'line 1\n'
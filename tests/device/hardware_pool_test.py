@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from twister2.device.hardware_map import HardwareMap
+from twister2.device.hardware_pool import HardwareLeaseManager
+from twister2.exceptions import TwisterConfigurationException, TwisterRunException
+
+
+@pytest.fixture
+def hardware_map_list() -> list[HardwareMap]:
+    return [
+        HardwareMap(id='board_1', platform='nrf52840dk_nrf52840', connected=True),
+        HardwareMap(id='board_2', platform='nrf52840dk_nrf52840', connected=True, fixtures=['gpio_loopback']),
+        HardwareMap(id='board_3', platform='nrf52840dk_nrf52840', connected=False),
+        HardwareMap(id='board_4', platform='frdm_k64f', connected=True),
+    ]
+
+
+@pytest.fixture
+def lease_manager(hardware_map_list, tmp_path) -> HardwareLeaseManager:
+    return HardwareLeaseManager(hardware_map_list, tmp_path, poll_interval=0.01)
+
+
+def test_if_candidates_match_platform_and_fixture(lease_manager):
+    assert [h.id for h in lease_manager.get_candidates('nrf52840dk_nrf52840')] == ['board_1', 'board_2']
+    assert [h.id for h in lease_manager.get_candidates('nrf52840dk_nrf52840', 'gpio_loopback')] == ['board_2']
+    assert lease_manager.get_candidates('frdm_k64f', 'gpio_loopback') == []
+
+
+def test_if_each_lease_gets_different_board(lease_manager, hardware_map_list, tmp_path):
+    # second manager simulates another xdist worker
+    other_manager = HardwareLeaseManager(hardware_map_list, tmp_path, poll_interval=0.01)
+    lease_1 = lease_manager.acquire('nrf52840dk_nrf52840')
+    lease_2 = other_manager.acquire('nrf52840dk_nrf52840')
+    assert {lease_1.hardware_map.id, lease_2.hardware_map.id} == {'board_1', 'board_2'}
+    with pytest.raises(TwisterRunException, match='Timed out waiting for available hardware'):
+        lease_manager.acquire('nrf52840dk_nrf52840', timeout=0.05)
+    lease_manager.release(lease_1, nodeid='test_a')
+    lease_3 = other_manager.acquire('nrf52840dk_nrf52840')
+    assert lease_3.hardware_map.id == lease_1.hardware_map.id
+    other_manager.release(lease_2, nodeid='test_b')
+    other_manager.release(lease_3, nodeid='test_c')
+
+    usages = HardwareLeaseManager.read_usage(tmp_path)
+    assert sorted((u.board, u.tests) for u in usages) == sorted([
+        (lease_1.hardware_map.id, 2), (lease_2.hardware_map.id, 1)
+    ])
+
+
+def test_if_exception_is_raised_when_no_board_matches(lease_manager):
+    with pytest.raises(TwisterConfigurationException, match='with fixture spi'):
+        lease_manager.acquire('frdm_k64f', fixture='spi')
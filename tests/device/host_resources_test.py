@@ -0,0 +1,47 @@
+import pytest
+
+from twister2.device.host_resources import (
+    INSTANCE_RAM_OVERHEAD,
+    HostResourceManager,
+    ResourceCost,
+    get_platform_cost,
+)
+from twister2.exceptions import TwisterRunException
+from twister2.platform_specification import PlatformSpecification
+
+
+@pytest.fixture
+def resource_manager(tmp_path) -> HostResourceManager:
+    return HostResourceManager(tmp_path, ram_budget=200, cpu_budget=2, poll_interval=0.01)
+
+
+def test_if_platform_cost_depends_on_board_ram():
+    cost = get_platform_cost(PlatformSpecification(identifier='native_posix', ram=65536), ram_factor=2, cpus=0.5)
+    assert cost == ResourceCost(ram=INSTANCE_RAM_OVERHEAD + 128, cpus=0.5)
+
+
+def test_if_simulators_wait_for_budget(resource_manager, tmp_path):
+    # second manager simulates another xdist worker
+    other_manager = HostResourceManager(tmp_path, ram_budget=200, cpu_budget=2, poll_interval=0.01)
+    admission_1 = resource_manager.acquire('qemu_x86', ResourceCost(ram=100, cpus=1))
+    admission_2 = other_manager.acquire('qemu_x86', ResourceCost(ram=100, cpus=1))
+    assert admission_1.blocked_time == admission_2.blocked_time == 0
+    with pytest.raises(TwisterRunException, match='Timed out waiting for host resources'):
+        resource_manager.acquire('qemu_x86', ResourceCost(ram=10, cpus=1), timeout=0.05)
+    resource_manager.release(admission_1, nodeid='test_a')
+    other_manager.release(admission_2, nodeid='test_b')
+
+    usages = HostResourceManager.read_usage(tmp_path)
+    assert [(u.platform, u.instances, u.blocked_instances) for u in usages] == [('qemu_x86', 2, 0)]
+
+
+def test_if_expensive_simulator_is_admitted_when_nothing_else_runs(resource_manager):
+    admission = resource_manager.acquire('native_posix', ResourceCost(ram=1000, cpus=4), timeout=0.05)
+    resource_manager.release(admission)
+
+
+def test_if_reservations_of_dead_process_are_dropped(resource_manager, monkeypatch):
+    resource_manager.acquire('qemu_x86', ResourceCost(ram=200, cpus=2))
+    monkeypatch.setattr('twister2.device.host_resources.psutil.pid_exists', lambda pid: False)
+    admission = resource_manager.acquire('qemu_x86', ResourceCost(ram=100, cpus=1), timeout=0.05)
+    resource_manager.release(admission)
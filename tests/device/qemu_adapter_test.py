@@ -89,3 +89,17 @@ def test_handler_and_device_log_correct_initialized_on_qemu(device, tmp_path) ->
     assert isinstance(device.handler_log_file, HandlerLogFile)
     assert isinstance(device.device_log_file, NullLogFile)
     assert device.handler_log_file.filename.endswith('handler.log')  # type: ignore[union-attr]
+
+
+def test_if_running_qemu_is_restarted_on_reset(device) -> None:
+    calls: list[str] = []
+    for method in ['stop', 'disconnect', 'connect', 'flash_and_run']:
+        setattr(device, method, mock.Mock(side_effect=lambda *args, name=method: calls.append(name)))
+    device._emulation_was_finished = False
+    device.reset(timeout=5)
+    assert calls == ['stop', 'disconnect', 'connect', 'flash_and_run']
+
+    calls.clear()
+    device._emulation_was_finished = True
+    device.reset(timeout=5)
+    assert calls == ['disconnect', 'connect', 'flash_and_run']
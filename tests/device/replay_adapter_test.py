@@ -0,0 +1,32 @@
+import pytest
+
+from twister2.device.factory import DeviceFactory
+from twister2.device.replay_adapter import LogReplayAdapter
+from twister2.exceptions import TwisterRunException
+from twister2.log_parser.ztest_log_parser import ZtestLogParser
+from twister2.twister_config import TwisterConfig
+
+
+def test_if_replay_adapter_feeds_parser_with_saved_output(tmp_path):
+    handler_log = tmp_path / 'handler.log'
+    handler_log.write_text(
+        'Running TESTSUITE common\n'
+        ' PASS - test_bootdelay in 0.0 seconds\n'
+        'PROJECT EXECUTION SUCCESSFUL\n'
+    )
+    device = DeviceFactory.get_device('replay')(TwisterConfig('zephyr'), build_dir=tmp_path)
+    device.generate_command(tmp_path)
+    device.initialize_log_files(tmp_path)
+    device.flash_and_run()
+    parser = ZtestLogParser(stream=device.iter_stdout)
+    parser.parse()
+    assert parser.state == parser.STATE.PASSED
+    assert [subtest.testname for subtest in parser.subtest_results] == ['bootdelay']
+    # replayed log must not be modified
+    assert handler_log.read_text().count('\n') == 3
+
+
+def test_if_replay_adapter_raises_exception_when_log_does_not_exist(tmp_path):
+    device = LogReplayAdapter(TwisterConfig('zephyr'), build_dir=tmp_path)
+    with pytest.raises(TwisterRunException, match='does not exist'):
+        device.flash_and_run()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import logging
+import time
+
+import pytest
+
+from twister2.device.serial_reader import SerialReader
+
+
+class FakeSerial:
+    """Serial connection which returns predefined chunks of data."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+        self.read_sizes: list[int] = []
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.chunks[0]) if self.chunks else 0
+
+    def read(self, size: int = 1) -> bytes:
+        self.read_sizes.append(size)
+        if not self.chunks:
+            raise OSError('port closed')
+        return self.chunks.pop(0)
+
+
+@pytest.fixture
+def caplog(caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> pytest.LogCaptureFixture:
+    """Capture logs also when logging was configured by twister session run in the same process."""
+    twister_logger = logging.getLogger('twister2')
+    monkeypatch.setattr(twister_logger, 'propagate', True)
+    monkeypatch.setattr(twister_logger, 'handlers', [])
+    return caplog
+
+
+def test_if_serial_reader_splits_chunks_into_lines():
+    saved: list[bytes] = []
+    connection = FakeSerial([
+        b'Running TESTSUITE common\r\nSTART - ', b'test_a\n PASS - test_a in 0.1 seconds\n', b'tail'
+    ])
+    reader = SerialReader(connection, on_data=saved.append)
+    reader.start()
+    lines = []
+    while (line := reader.get_line(timeout=1)) is not None:
+        lines.append(line)
+    reader.stop()
+    assert [line.data for line in lines] == [
+        b'Running TESTSUITE common\r', b'START - test_a', b' PASS - test_a in 0.1 seconds', b'tail'
+    ]
+    assert all(line.timestamp <= time.time() for line in lines)
+    assert b''.join(saved) == b'Running TESTSUITE common\r\nSTART - test_a\n PASS - test_a in 0.1 seconds\ntail\n'
+    # whole waiting data is read at once
+    assert connection.read_sizes[:3] == [34, 37, 4]
+    assert reader.finished
+
+
+def test_if_serial_reader_waits_for_consumer_when_buffer_is_full():
+    connection = FakeSerial([b'1\n2\n3\n', b'4\n'])
+    reader = SerialReader(connection, max_lines=2)
+    reader.start()
+    time.sleep(0.1)
+    # reading is paused, the next chunk is not read yet
+    assert connection.chunks == [b'4\n']
+    lines = [reader.get_line(timeout=1) for _ in range(4)]
+    assert [line.data for line in lines if line] == [b'1', b'2', b'3', b'4']
+    reader.stop()
+    assert reader.dropped_lines == 0
+
+
+def test_if_not_consumed_lines_are_dropped_when_reading_stops(caplog):
+    reader = SerialReader(FakeSerial([b'1\n2\n3\n4\n']), max_lines=2)
+    reader.start()
+    # wait until reading is paused by full buffer
+    deadline = time.time() + 5
+    while 'Buffer of serial reader is full' not in caplog.text and time.time() < deadline:
+        time.sleep(0.01)
+    reader.stop()
+    assert [reader.get_line(0.1).data, reader.get_line(0.1).data] == [b'1', b'2']  # type: ignore[union-attr]
+    assert reader.get_line(timeout=0.1) is None
+    assert reader.dropped_lines == 2
+    assert 'Dropped 2 lines read from serial' in caplog.text
+
+
+def test_if_clear_drops_buffered_lines():
+    reader = SerialReader(FakeSerial([]))
+    reader._process_data(b'old line\nother line\n', 0.0)
+    reader.clear()
+    reader._process_data(b'new line\n', 1.0)
+    line = reader.get_line(timeout=0)
+    assert line is not None
+    assert line.data == b'new line'
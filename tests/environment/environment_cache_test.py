@@ -0,0 +1,49 @@
+import os
+
+from twister2.environment.environment import get_toolchain_version
+from twister2.environment.environment_cache import (
+    MAX_ENTRIES,
+    EnvironmentCache,
+    get_toolchain_cache_key,
+)
+
+
+def test_if_values_are_saved_in_cache_file(tmp_path):
+    cache = EnvironmentCache(tmp_path / 'cache' / 'environment.json')
+    assert cache.get('toolchain', 'key') is None
+    cache.put('toolchain', 'key', 'zephyr')
+    assert EnvironmentCache(cache.filename).get('toolchain', 'key') == 'zephyr'
+    assert cache.get('commit_date', 'key') is None
+
+
+def test_if_oldest_entries_are_removed(tmp_path):
+    cache = EnvironmentCache(tmp_path / 'environment.json')
+    for index in range(MAX_ENTRIES + 1):
+        cache.put('commit_date', f'sha{index}', 'date')
+    assert cache.get('commit_date', 'sha0') is None
+    assert cache.get('commit_date', f'sha{MAX_ENTRIES}') == 'date'
+
+
+def test_if_toolchain_cache_key_depends_on_environment_and_sdk(tmp_path):
+    sdk_dir = tmp_path / 'zephyr-sdk'
+    sdk_dir.mkdir()
+    env = {'ZEPHYR_SDK_INSTALL_DIR': str(sdk_dir), 'HOME': '/home/user'}
+    key = get_toolchain_cache_key(str(tmp_path), env)
+    assert key == get_toolchain_cache_key(str(tmp_path), {**env, 'HOME': '/home/other'})
+    assert key != get_toolchain_cache_key(str(tmp_path), {**env, 'ZEPHYR_TOOLCHAIN_VARIANT': 'llvm'})
+    stat = sdk_dir.stat()
+    os.utime(sdk_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert key != get_toolchain_cache_key(str(tmp_path), env)
+
+
+def test_if_toolchain_is_detected_once_for_many_output_dirs(tmp_path, mock_get_toolchain_version, monkeypatch):
+    monkeypatch.setenv('ZEPHYR_TOOLCHAIN_VARIANT', 'zephyr')
+    for output_dir in ['twister-out', 'twister-out_1']:
+        (tmp_path / output_dir).mkdir()
+        assert get_toolchain_version(str(tmp_path / output_dir), str(tmp_path)) == 'zephyr'
+    assert mock_get_toolchain_version.call_count == 1
+
+    monkeypatch.setenv('ZEPHYR_TOOLCHAIN_VARIANT', 'llvm')
+    (tmp_path / 'twister-out_2').mkdir()
+    get_toolchain_version(str(tmp_path / 'twister-out_2'), str(tmp_path))
+    assert mock_get_toolchain_version.call_count == 2
@@ -0,0 +1,62 @@
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+from git.repo import Repo
+
+from twister2.environment.environment import get_zephyr_repo_info
+from twister2.environment.git_reader import read_commit_date, read_head_commit
+
+
+def _git(repo: Repo, *args: str, **env: str) -> None:
+    subprocess.run(
+        ['git', '-c', 'user.name=user', '-c', 'user.email=user@example.com', *args],
+        cwd=repo.working_tree_dir, check=True, capture_output=True, env={**os.environ, **env}
+    )
+
+
+@pytest.fixture
+def repo(tmp_path) -> Repo:
+    repo = Repo.init(tmp_path / 'zephyr')
+    (Path(repo.working_tree_dir) / 'README').write_text('zephyr')
+    _git(repo, 'add', 'README')
+    _git(repo, 'commit', '--quiet', '-m', 'initial commit', GIT_AUTHOR_DATE='2022-01-02T10:20:30+01:00')
+    return repo
+
+
+def test_if_head_commit_is_read_from_files(repo):
+    sha = repo.head.commit.hexsha
+    assert read_head_commit(repo.working_tree_dir) == sha
+    assert read_commit_date(repo.working_tree_dir, sha) == '2022-01-02T10:20:30+01:00'
+    assert read_commit_date(repo.working_tree_dir, sha) == repo.head.commit.authored_datetime.isoformat(
+        timespec='seconds'
+    )
+
+
+def test_if_head_is_read_from_packed_refs_and_detached_head(repo):
+    sha = repo.head.commit.hexsha
+    _git(repo, 'gc', '--quiet')
+    assert read_head_commit(repo.working_tree_dir) == sha
+    # commit is stored in pack file, so it has to be read by GitPython
+    assert read_commit_date(repo.working_tree_dir, sha) is None
+    _git(repo, 'checkout', '--quiet', '--detach')
+    assert read_head_commit(repo.working_tree_dir) == sha
+
+
+def test_if_head_is_read_from_additional_working_tree(repo, tmp_path):
+    _git(repo, 'worktree', 'add', '--quiet', '-b', 'other', str(tmp_path / 'worktree'))
+    assert read_head_commit(tmp_path / 'worktree') == repo.head.commit.hexsha
+
+
+def test_if_none_is_returned_for_directory_without_repository(tmp_path):
+    assert read_head_commit(tmp_path) is None
+    assert read_commit_date(tmp_path, '0' * 40) is None
+
+
+def test_if_commit_date_read_by_gitpython_is_cached(repo, monkeypatch):
+    _git(repo, 'gc', '--quiet')
+    repo_info = get_zephyr_repo_info(repo.working_tree_dir)
+    assert tuple(repo_info) == (repo.head.commit.hexsha[:12], '2022-01-02T10:20:30+01:00')
+    monkeypatch.setattr('git.repo.Repo', None)
+    assert get_zephyr_repo_info(repo.working_tree_dir) == repo_info
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import struct
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from twister2.filter.changed_files_filter import (
+    IMPACT_FILE_NAME,
+    NO_DEPENDENCY_DATA,
+    ChangedFilesFilter,
+    read_build_dependencies,
+    read_cmake_inputs,
+    read_ninja_deps,
+)
+
+
+def write_ninja_deps(filename: Path, paths: list[str]) -> None:
+    data = b'# ninjadeps\n' + struct.pack('<i', 4)
+    for index, path in enumerate(paths):
+        encoded = path.encode()
+        encoded += b'\0' * (-len(encoded) % 4)
+        data += struct.pack('<I', len(encoded) + 4) + encoded + struct.pack('<I', ~index & 0xFFFFFFFF)
+    # deps record of the first path
+    data += struct.pack('<I', 0x80000000 | 12) + struct.pack('<iII', 0, 0, 1)
+    filename.write_bytes(data)
+
+
+def write_build_dir(build_dir: Path, deps: list[str], cmake_inputs: list[str]) -> None:
+    build_dir.mkdir(parents=True)
+    write_ninja_deps(build_dir / '.ninja_deps', deps)
+    (build_dir / 'build.ninja').write_text(
+        'rule RERUN_CMAKE\n'
+        '  command = cmake\n'
+        'build build.ninja: RERUN_CMAKE | ' + ' $\n    '.join(cmake_inputs) + ' || cmake.check_cache\n'
+        '  pool = console\n'
+    )
+
+
+def test_if_paths_are_read_from_ninja_deps(tmp_path):
+    deps_file = tmp_path / '.ninja_deps'
+    write_ninja_deps(deps_file, ['zephyr/main.c.obj', '/zephyr/main.c', '/zephyr/include/kernel.h'])
+    assert read_ninja_deps(deps_file) == {'zephyr/main.c.obj', '/zephyr/main.c', '/zephyr/include/kernel.h'}
+
+
+def test_if_not_supported_ninja_deps_is_rejected(tmp_path):
+    deps_file = tmp_path / '.ninja_deps'
+    deps_file.write_bytes(b'# ninjadeps\n' + struct.pack('<i', 3))
+    with pytest.raises(ValueError, match='Not supported version'):
+        read_ninja_deps(deps_file)
+
+
+def test_if_cmake_inputs_are_read_from_build_ninja(tmp_path):
+    build_file = tmp_path / 'build.ninja'
+    build_file.write_text(
+        'build build.ninja: RERUN_CMAKE | /app/CMakeLists.txt $\n'
+        '    /app/prj$ name.conf /zephyr/boards/board.dts || cmake.check_cache\n'
+    )
+    assert read_cmake_inputs(build_file) == {'/app/CMakeLists.txt', '/app/prj name.conf', '/zephyr/boards/board.dts'}
+
+
+def test_if_build_dependencies_are_absolute(tmp_path):
+    build_dir = tmp_path / 'build'
+    assert read_build_dependencies(build_dir) is None
+    write_build_dir(build_dir, ['zephyr/main.c.obj', '/zephyr/main.c'], ['/app/CMakeLists.txt'])
+    assert read_build_dependencies(build_dir) == {
+        str(build_dir / 'zephyr' / 'main.c.obj'), '/zephyr/main.c', '/app/CMakeLists.txt'
+    }
+
+
+@pytest.fixture
+def make_item(tmp_path):
+    specifications: dict = {}
+    session = SimpleNamespace(specifications=specifications)
+
+    def _make_item(name: str, source_dir: Path | None = None) -> SimpleNamespace:
+        item = SimpleNamespace(nodeid=f'{name}.yaml::{name}', session=session)
+        if source_dir is not None:
+            specifications[item.nodeid] = SimpleNamespace(
+                source_dir=source_dir, platform='native_posix', rel_to_base_path=Path(name), scenario=name
+            )
+        return item
+
+    return _make_item
+
+
+def test_if_only_tests_affected_by_changed_files_are_selected(tmp_path, make_item):
+    output_dir = tmp_path / 'twister-out'
+    config = SimpleNamespace(option=SimpleNamespace(output_dir=str(output_dir)))
+    zephyr = tmp_path / 'zephyr'
+    for name, header in [('uses_kernel', 'kernel.h'), ('uses_gpio', 'gpio.h'), ('source_changed', 'gpio.h')]:
+        write_build_dir(output_dir / 'native_posix' / name / name,
+                        [f'{zephyr}/{name}/src/main.c', f'{zephyr}/include/{header}'], [f'{zephyr}/{name}/prj.conf'])
+    changed_files = {f'{zephyr}/include/kernel.h', f'{zephyr}/source_changed/src/main.c'}
+
+    filter_ = ChangedFilesFilter(config, changed_files=changed_files)  # type: ignore[arg-type]
+    items = {
+        name: make_item(name, None if name == 'pytest' else zephyr / name)
+        for name in ['uses_kernel', 'uses_gpio', 'source_changed', 'never_built', 'pytest']
+    }
+    deselected = [name for name, item in items.items() if filter_.filter(item)]  # type: ignore[arg-type]
+    filter_.finish([item for name, item in items.items() if name not in deselected])  # type: ignore[misc]
+
+    assert deselected == ['uses_gpio']
+    with open(output_dir / IMPACT_FILE_NAME) as file:
+        impact = json.load(file)
+    assert impact['changed_files'] == sorted(changed_files)
+    assert impact['impact'] == {
+        f'{zephyr}/include/kernel.h': ['uses_kernel.yaml::uses_kernel'],
+        f'{zephyr}/source_changed/src/main.c': ['source_changed.yaml::source_changed'],
+        NO_DEPENDENCY_DATA: ['never_built.yaml::never_built'],
+    }
+
+
+def test_if_dependencies_are_taken_from_archived_output_dir(tmp_path, make_item):
+    output_dir = tmp_path / 'twister-out'
+    output_dir.mkdir()
+    write_build_dir(tmp_path / 'twister-out_230101120000' / 'native_posix' / 'app' / 'app', ['/zephyr/app.c'], [])
+    config = SimpleNamespace(option=SimpleNamespace(output_dir=str(output_dir)))
+
+    filter_ = ChangedFilesFilter(config, changed_files={'/zephyr/other.c'})  # type: ignore[arg-type]
+
+    assert filter_.filter(make_item('app', tmp_path / 'app')) is True  # type: ignore[arg-type]
+
+
+def _git(repo_dir: Path, *args: str) -> None:
+    subprocess.run(
+        ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+        cwd=repo_dir, check=True, capture_output=True
+    )
+
+
+def test_if_plugin_deselects_tests_not_affected_by_changes(pytester, copy_example):
+    zephyr = pytester.path.resolve()
+    for path in ['tests/hello_world/src/main.c', 'tests/common/src/main.c', 'include/kernel.h']:
+        (zephyr / path).parent.mkdir(parents=True, exist_ok=True)
+        (zephyr / path).write_text('/* source */\n')
+    build_root = zephyr / 'twister-out' / 'native_posix' / 'tests' / 'common'
+    write_build_dir(build_root / 'xyz.common_merge_1', [f'{zephyr}/tests/common/src/main.c'], [])
+    write_build_dir(build_root / 'xyz.common_merge_2', [f'{zephyr}/include/kernel.h'], [])
+    _git(zephyr, 'init', '-q')
+    _git(zephyr, 'add', 'tests', 'include')
+    _git(zephyr, 'commit', '-q', '-m', 'initial')
+    for path in ['tests/hello_world/src/main.c', 'include/kernel.h']:
+        (zephyr / path).write_text('/* changed */\n')
+
+    result = pytester.runpytest(
+        f'--zephyr-base={zephyr}', '--platform=native_posix', '--changed-since=HEAD', '--co', '-q'
+    )
+
+    result.stdout.fnmatch_lines_random([
+        '*sample.basic.helloworld[[]native_posix[]]*',
+        '*xyz.common_merge_2[[]native_posix[]]*',
+        '*1 deselected*',
+    ])
+    result.stdout.no_fnmatch_line('*xyz.common_merge_1*')
+    with open(zephyr / 'twister-out' / IMPACT_FILE_NAME) as file:
+        impact = json.load(file)['impact']
+    assert [nodeid.split('::')[-1] for nodeid in impact[f'{zephyr}/include/kernel.h']] == [
+        'xyz.common_merge_2[native_posix]'
+    ]
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+import re
+import textwrap
+from pathlib import Path
+
+from twister2.filter.shard_plugin import read_test_costs, split_into_shards
+
+
+def test_if_groups_are_split_into_balanced_shards():
+    group_costs = {'a': 10.0, 'b': 7.0, 'c': 5.0, 'd': 4.0, 'e': 3.0, 'f': 1.0}
+    shards = split_into_shards(group_costs, 2)
+    assert sorted(key for shard in shards for key in shard) == sorted(group_costs)
+    assert [sum(group_costs[key] for key in shard) for shard in shards] == [15.0, 15.0]
+
+
+def test_if_shards_do_not_depend_on_order_of_groups():
+    group_costs = {f'group_{i}': float(i % 3) for i in range(20)}
+    reversed_costs = dict(reversed(group_costs.items()))
+    assert split_into_shards(group_costs, 3) == split_into_shards(reversed_costs, 3)
+
+
+def test_if_test_costs_are_read_from_results_report(tmp_path):
+    report = tmp_path / 'twister.json'
+    report.write_text(json.dumps(dict(testsuites=[
+        dict(name='sample.test', platform='native_posix', duration='12.50', execution_time='2.00'),
+        dict(name='sample.test', platform='qemu_x86', execution_time='3.00'),
+        dict(name='other.test', platform='qemu_x86', duration='N/A'),
+    ])))
+    assert read_test_costs(report) == {('sample.test', 'native_posix'): 12.5, ('sample.test', 'qemu_x86'): 3.0}
+
+
+def _collect_shard(pytester, shard_index: int) -> list[str]:
+    result = pytester.runpytest(
+        f'--zephyr-base={str(pytester.path)}',
+        '--platform=native_posix',
+        '--platform=qemu_cortex_m3',
+        '--shard-count=2',
+        f'--shard-index={shard_index}',
+        '--co', '-q',
+    )
+    result.stdout.fnmatch_lines([f'shard {shard_index} of 2: * tests, expected cost *'])
+    return [line for line in result.stdout.lines if re.match(r'.*\.yaml::', line)]
+
+
+def test_if_shards_contain_all_tests(pytester, copy_example):
+    all_tests = pytester.runpytest(
+        f'--zephyr-base={str(pytester.path)}', '--platform=native_posix', '--platform=qemu_cortex_m3', '--co', '-q'
+    ).stdout.lines
+    all_tests = [line for line in all_tests if re.match(r'.*\.yaml::', line)]
+
+    first_shard = _collect_shard(pytester, 0)
+    second_shard = _collect_shard(pytester, 1)
+
+    assert first_shard and second_shard
+    assert sorted(first_shard + second_shard) == sorted(all_tests)
+    shard_plan: Path = pytester.path / 'twister-out' / 'testplan_shard_1_of_2.json'
+    assert shard_plan.is_file()
+    with shard_plan.open() as file:
+        assert len(json.load(file)['testsuites']) == len(second_shard)
+    with open(pytester.path / 'twister-out' / 'testplan.json') as file:
+        assert len(json.load(file)['testsuites']) == len(second_shard)
+
+
+def test_if_tests_sharing_build_are_in_the_same_shard(pytester, copy_example):
+    (pytester.path / 'tests' / 'testspec.yaml').write_text(textwrap.dedent("""\
+        tests:
+            scenario1:
+                tags: tag1
+            scenario2:
+                tags: tag1
+    """))
+    test_file = pytester.path / 'tests' / 'foobar_test.py'
+    test_file.write_text(textwrap.dedent("""\
+        import pytest
+
+        @pytest.mark.build_specification
+        def test_a(builder):
+            pass
+
+        @pytest.mark.build_specification
+        def test_b(builder):
+            pass
+
+        @pytest.mark.build_specification
+        def test_c(builder):
+            pass
+    """))
+
+    for shard_index in range(2):
+        result = pytester.runpytest(
+            str(test_file), f'--zephyr-base={str(pytester.path)}', '--platform=native_posix',
+            '--shard-count=2', f'--shard-index={shard_index}', '--co', '-q',
+        )
+        tests = [line for line in result.stdout.lines if '::test_' in line]
+        # each shard gets all tests of one scenario, built once
+        assert len(tests) == 3
+        assert len({re.search(r'scenario\d', test).group() for test in tests}) == 1
+        shard_plan = pytester.path / 'twister-out' / f'testplan_shard_{shard_index}_of_2.json'
+        with shard_plan.open() as file:
+            testsuites = json.load(file)['testsuites']
+        assert all(testsuite['run_id'] and testsuite['platform'] == 'native_posix' for testsuite in testsuites)
+
+
+def test_if_xdist_workers_use_costs_read_by_controller(pytester, copy_example):
+    test_dir: Path = pytester.path / 'tests' / 'shard'
+    test_dir.mkdir()
+    (test_dir / 'testcase.yaml').write_text(textwrap.dedent("""\
+        tests:
+            xyz.shard_1: {}
+            xyz.shard_2: {}
+            xyz.shard_3: {}
+            xyz.shard_4: {}
+    """))
+    # applications are not built, xdist workers run in other processes, so fixture is overridden by conftest
+    (pytester.path / 'conftest.py').write_text(textwrap.dedent("""\
+        import pytest
+
+        @pytest.fixture
+        def builder():
+            return None
+    """))
+    args = [str(test_dir), f'--zephyr-base={str(pytester.path)}', '--platform=native_posix', '--build-only']
+    pytester.runpytest(*args).assert_outcomes(passed=4)
+    # costs are taken from previous results in output directory, which is archived by controller
+    costs_path: Path = pytester.path / 'twister-out' / 'twister.json'
+    with costs_path.open() as file:
+        data = json.load(file)
+    for testsuite in data['testsuites']:
+        testsuite['duration'] = 100 if testsuite['name'].endswith('xyz.shard_1') else 1
+    costs_path.write_text(json.dumps(data))
+
+    result = pytester.runpytest(*args, '--shard-count=2', '--shard-index=1', f'--shard-costs={costs_path}', '-n 2')
+
+    # shard balanced by costs gets all tests except the most expensive one (by number of tests it would get 2)
+    result.assert_outcomes(passed=3)
+    with open(pytester.path / 'twister-out' / 'testplan_shard_1_of_2.json') as file:
+        assert len(json.load(file)['testsuites']) == 3
+    with open(pytester.path / 'twister-out' / 'twister.json') as file:
+        names = sorted(testsuite['name'] for testsuite in json.load(file)['testsuites'])
+    assert names == ['tests/shard/xyz.shard_2', 'tests/shard/xyz.shard_3', 'tests/shard/xyz.shard_4']
@@ -8,6 +8,7 @@ from twister2.fixtures.common import SetupTestManager
 @pytest.fixture
 def request_mock():
     instance = MagicMock(pytest.FixtureRequest)
+    instance.config.twister_config.replay_logs = False
     return instance
 
 
@@ -46,3 +47,16 @@ def test_if_get_device_type_returns_proper_device(
     manager.platform.simulation = platform_simulation
 
     assert manager.get_device_type() == expected_device
+
+
+def test_if_replay_device_is_used_for_replayed_logs(request_mock, tmp_path):
+    request_mock.config.twister_config.replay_logs = True
+    manager = SetupTestManager(request_mock)
+    assert manager.get_device_type() == 'replay'
+
+
+def test_if_test_is_replayed_only_when_handler_log_exists(tmp_path):
+    assert SetupTestManager.should_be_replayed(False, tmp_path).should_run is False
+    (tmp_path / 'handler.log').write_text('PROJECT EXECUTION SUCCESSFUL\n')
+    assert SetupTestManager.should_be_replayed(False, tmp_path).should_run is True
+    assert SetupTestManager.should_be_replayed(True, tmp_path).should_run is False
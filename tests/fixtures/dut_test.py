@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import textwrap
+from pathlib import Path
+from typing import Generator
+
+from twister2.device.device_abstract import DeviceAbstract
+from twister2.device.factory import DeviceFactory
+from twister2.device.hardware_pool import HardwareLeaseManager
+
+#: calls of fake devices, module is imported by test file, so it is shared with sessions run by pytester
+events: list[str] = []
+
+
+class FakeHardwareAdapter(DeviceAbstract):
+    """Board which prints output of passing ztest application."""
+
+    instances: int = 0
+
+    def __init__(self, twister_config, **kwargs) -> None:
+        super().__init__(twister_config, **kwargs)
+        FakeHardwareAdapter.instances += 1
+        self.name = f'device_{FakeHardwareAdapter.instances}'
+
+    def connect(self, timeout: float = 1) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        pass
+
+    def generate_command(self, build_dir: Path | str) -> None:
+        pass
+
+    def flash_and_run(self, timeout: float = 60.0) -> None:
+        events.append(f'{self.name} flashed')
+
+    def stop(self) -> None:
+        events.append(f'{self.name} stopped')
+
+    def initialize_log_files(self, build_dir: str | Path):
+        pass
+
+    @property
+    def iter_stdout(self) -> Generator[str, None, None]:
+        yield from [
+            'Running TESTSUITE board',
+            'START - test_a',
+            ' PASS - test_a in 0.0 seconds',
+            'PROJECT EXECUTION SUCCESSFUL',
+        ]
+
+
+def test_if_pooled_device_is_released_before_yaml_test_of_the_same_build(pytester, copy_example, monkeypatch):
+    events.clear()
+    monkeypatch.setattr(FakeHardwareAdapter, 'instances', 0)
+    monkeypatch.setitem(DeviceFactory._devices, 'hardware', FakeHardwareAdapter)
+    # fail quickly instead of waiting for board leased by device kept in pool
+    monkeypatch.setattr(
+        HardwareLeaseManager, 'acquire', functools.partialmethod(HardwareLeaseManager.acquire, timeout=1)
+    )
+    test_dir: Path = pytester.path / 'tests' / 'board'
+    test_dir.mkdir()
+    # pytest harness test and yaml test share the same build
+    for spec_file_name in ['testcase.yaml', 'testspec.yaml']:
+        (test_dir / spec_file_name).write_text(textwrap.dedent("""\
+            tests:
+              xyz.board:
+                platform_allow: stm32f411e_disco
+        """))
+    (test_dir / 'foobar_test.py').write_text(textwrap.dedent("""\
+        import pytest
+
+        @pytest.mark.build_specification
+        def test_pytest_harness(dut):
+            pass
+    """))
+    hardware_map = pytester.path / 'hardware_map.yml'
+    hardware_map.write_text(textwrap.dedent("""\
+        - available: true
+          connected: true
+          id: board_1
+          platform: stm32f411e_disco
+          runner: jlink
+          serial: /dev/ttyACM0
+    """))
+    output_dir: Path = pytester.path / 'twister-out'
+    build_dir: Path = output_dir / 'stm32f411e_disco' / 'tests' / 'board' / 'xyz.board'
+    build_dir.mkdir(parents=True)
+    # application is already built
+    with open(output_dir / 'twister_builder.json', 'w') as file:
+        json.dump({os.path.realpath(build_dir): 'DONE'}, file)
+
+    result = pytester.runpytest(
+        str(test_dir),
+        f'--zephyr-base={str(pytester.path)}',
+        '--platform=stm32f411e_disco',
+        '--device-testing',
+        f'--hardware-map={hardware_map}',
+        '--dut-scope=build',
+        '--clear=no',
+        '-v',
+    )
+
+    result.assert_outcomes(passed=2)
+    result.stdout.re_match_lines([r'.*foobar_test.py::test_pytest_harness.*PASSED', r'.*testcase.yaml::.*PASSED'])
+    # board used by pytest harness test is stopped and released before yaml test flashes it again
+    assert events == ['device_1 flashed', 'device_1 stopped', 'device_2 flashed', 'device_2 stopped']
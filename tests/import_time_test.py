@@ -0,0 +1,60 @@
+"""
+Plugin is loaded by every pytest session in the environment (also without
+``--twister``), so importing it should be fast and should not load libraries
+needed only by twister.
+"""
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+
+#: modules imported with plugin by pytest
+PLUGIN_MODULES: tuple[str, ...] = (
+    'twister2.plugin',
+    'twister2.report.test_plan_plugin',
+    'twister2.report.test_results_plugin',
+    'twister2.report.yaml_test_reporting_plugin',
+)
+#: libraries which are slow to import or have side effects at import
+HEAVY_MODULES: tuple[str, ...] = (
+    'asyncio', 'filelock', 'git', 'marshmallow', 'ply', 'psutil', 'serial', 'yaml'
+)
+#: import time of plugin in microseconds (measured about 15 ms, it was about 230 ms with all modules imported)
+IMPORT_TIME_BUDGET: int = 100_000
+
+_IMPORT_TIME_PATTERN = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)')
+
+
+def measure_import_time(*modules: str) -> tuple[int, set[str]]:
+    """
+    Return import time (in microseconds) of modules and names of all modules imported with them.
+
+    Modules already imported by pytest are imported first, so they are not measured.
+    """
+    code = f'import pytest, pytest_subtests; import {", ".join(modules)}'
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True
+    )
+    entries = [match.groups() for match in _IMPORT_TIME_PATTERN.finditer(result.stderr)]
+    # the last module imported before measured ones
+    start = next(index for index, entry in enumerate(entries) if entry[2:] == ('', 'pytest_subtests'))
+    measured = entries[start + 1:]
+    import_time = sum(int(cumulative) for _, cumulative, indent, _ in measured if not indent)
+    return import_time, {name.split('.')[0] for _, _, _, name in measured}
+
+
+def test_if_plugin_does_not_import_heavy_modules():
+    _, imported = measure_import_time(*PLUGIN_MODULES)
+    assert not imported & set(HEAVY_MODULES)
+
+
+def test_if_device_libraries_are_imported_only_when_device_is_used():
+    _, imported = measure_import_time('twister2.device.factory')
+    assert not imported & {'asyncio', 'psutil', 'serial'}
+
+
+def test_if_plugin_is_imported_within_time_budget():
+    # the best of several measurements, so the test is not affected by load of machine
+    import_time = min(measure_import_time(*PLUGIN_MODULES)[0] for _ in range(3))
+    assert import_time < IMPORT_TIME_BUDGET, f'Import of plugin took {import_time / 1000:.1f} ms'
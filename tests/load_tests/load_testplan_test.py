@@ -8,6 +8,8 @@ from unittest import mock
 
 import pytest
 
+from twister2.load_tests import LoadedTestData, iter_json_array
+
 
 # use `autouse` to run tests in sequence (without it, only first test i passed)
 @pytest.fixture(autouse=True)
@@ -111,3 +113,47 @@ def test_if_tesplan_is_saved_and_loaded(pytester, copy_example):
         f'--load-tests={saveplan}'
     )
     result.assert_outcomes(passed=num_of_collected_tests)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1024 * 1024])
+def test_if_testsuites_are_streamed_from_testplan(resources, chunk_size):
+    savedplan: Path = resources / 'testplan_v1.json'
+    with savedplan.open() as file:
+        expected = json.load(file)['testsuites']
+    assert list(iter_json_array(savedplan, 'testsuites', chunk_size=chunk_size)) == expected
+
+
+@pytest.mark.parametrize('content, expected', [
+    ('{}', []),
+    ('{"testsuites": []}', []),
+    ('{"count": 12345, "testsuites": [1, 2.5, "a"], "summary": {"testsuites": [3]}}', [1, 2.5, 'a']),
+    ('{"summary": {"total": 2}, "testsuites": [{"name": "b"}, {"name": "c"}]}', [{'name': 'b'}, {'name': 'c'}]),
+])
+def test_if_only_items_of_given_array_are_streamed(tmp_path, content, expected):
+    filename = tmp_path / 'plan.json'
+    filename.write_text(content)
+    assert list(iter_json_array(filename, 'testsuites', chunk_size=3)) == expected
+
+
+def test_if_yaml_test_file_is_looked_up_once_per_test_directory(tmp_path, monkeypatch):
+    testdir = tmp_path / 'tests' / 'sample'
+    testdir.mkdir(parents=True)
+    (testdir / 'sample.yaml').touch()
+    plan = tmp_path / 'plan.json'
+    plan.write_text(json.dumps(dict(testsuites=[
+        dict(name=f'{testdir}/sample.test', platform=platform) for platform in ['native_posix', 'qemu_x86']
+    ])))
+    exists_calls: list[Path] = []
+    original_exists = Path.exists
+
+    def exists(self):
+        exists_calls.append(self)
+        return original_exists(self)
+
+    monkeypatch.setattr(Path, 'exists', exists)
+    loaded = list(LoadedTestData.load_from_testplan(plan))
+    monkeypatch.undo()
+
+    assert [test.platform for test in loaded] == ['native_posix', 'qemu_x86']
+    assert all(test.testfile == testdir / 'sample.yaml' for test in loaded)
+    assert exists_calls == [testdir / 'testcase.yaml', testdir / 'sample.yaml']
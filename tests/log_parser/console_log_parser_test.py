@@ -1,7 +1,10 @@
 import textwrap
+import time
 from pathlib import Path
 
-from twister2.log_parser.console_log_parser import ConsoleLogParser
+import pytest
+
+from twister2.log_parser.console_log_parser import ConsoleLogParser, strip_wildcards
 
 
 def test_if_console_log_parser_passes_for_one_line_type():
@@ -122,3 +125,59 @@ def test_if_console_log_parser_fails_for_ordered_multi_line():
     parser = ConsoleLogParser(stream=iter(log), harness_config=harness_config)
     parser.parse()
     assert parser.state == parser.STATE.FAILED
+
+
+@pytest.mark.parametrize('regex, expected', [
+    ('.*STARVING.*', 'STARVING'),
+    ('.*?EATING', '.*?EATING'),
+    ('THINKING\\.*', 'THINKING\\.*'),
+    ('.*', ''),
+])
+def test_if_wildcards_are_stripped_from_regex(regex, expected):
+    assert strip_wildcards(regex) == expected
+
+
+def test_if_console_log_parser_finds_hundreds_of_not_ordered_lines():
+    count = 300
+    harness_config = {
+        'type': 'multi_line',
+        'ordered': False,
+        'regex': [f'.*Philosopher {i} \\[C:-?\\d+\\]\\s+EATING.*' for i in range(count)]
+    }
+    log = []
+    for i in reversed(range(count)):
+        # repeated lines matching already found pattern must not break parsing
+        log.extend([f'Philosopher {i} [C:-1]  EATING  [  25 ms ]'] * 3)
+        log.append(f'Philosopher {i} [C:-1]  THINKING [  25 ms ]')
+    parser = ConsoleLogParser(stream=iter(log), harness_config=harness_config)
+    parser.parse()
+    assert parser.state == parser.STATE.PASSED
+    assert len(parser.matched_lines) == count
+    assert parser.matched_lines[0] == f'Philosopher {count - 1} [C:-1]  EATING  [  25 ms ]'
+
+
+def test_if_console_log_parser_checks_patterns_one_by_one_when_they_cannot_be_combined():
+    harness_config = {
+        'type': 'multi_line',
+        'ordered': False,
+        'regex': ['(a)\\1', '(b)\\1']
+    }
+    parser = ConsoleLogParser(stream=iter(['xbb', 'ab', 'xaa']), harness_config=harness_config)
+    parser.parse()
+    assert parser.state == parser.STATE.PASSED
+    assert parser.matched_lines == ['xbb', 'xaa']
+
+
+def test_if_console_log_parser_stops_when_device_is_inactive():
+    def stream():
+        yield 'Hello'
+        while True:
+            time.sleep(0.01)
+            yield ''
+
+    harness_config = {'type': 'one_line', 'regex': ['Hello World!']}
+    parser = ConsoleLogParser(stream=stream(), harness_config=harness_config, inactivity_timeout=0.2)
+    parser.parse(timeout=10)
+    assert parser.state == parser.STATE.FAILED
+    assert parser.device_hung is True
+    assert 'No output from device for 0.2 seconds' in parser.messages
@@ -1,3 +1,10 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import time
+import timeit
 from pathlib import Path
 
 import pytest
@@ -89,4 +96,110 @@ def test_if_ztest_log_parser_not_fails_on_fault(resources: Path):
         assert len([st for st in parser.subtest_results if st.result == SubTestStatus.PASS]) == 4
 
 
+def _multi_megabyte_log(resources: Path) -> list[str]:
+    """Return recorded output of ztest application repeated with noise of other modules."""
+    recorded_lines = [
+        line for line in (resources / 'ztest_log.txt').read_text(encoding='UTF-8').splitlines(keepends=True)
+        if 'PROJECT EXECUTION' not in line
+    ]
+    noise = ['[00:00:01.123,456] <dbg> net_core: processing packet ' + 'a5' * 60 + '\n'] * 10
+    return (recorded_lines + noise) * 1000 + ['PROJECT EXECUTION SUCCESSFUL\n']
+
+
+def test_if_ztest_log_parser_parses_multi_megabyte_log(resources: Path, caplog: pytest.LogCaptureFixture):
+    # logging every line to handlers configured by other tests would dominate test time
+    caplog.set_level(logging.WARNING, logger='twister2.log_parser.ztest_log_parser')
+    lines = _multi_megabyte_log(resources)
+    size_mb = sum(len(line) for line in lines) / 1e6
+    assert size_mb > 2
+
+    parser = ZtestLogParser(stream=iter(lines), ignore_faults=False)
+    parser.parse()
+
+    assert parser.state == parser.STATE.PASSED
+    assert len(parser.subtest_results) == 45 * 1000
+    assert len(parser.detected_suite_names) == 1000
+
+
+def _legacy_classify(lines: list[str]) -> int:
+    """Classify lines as parser did before keyword pre-screening (reference for benchmark)."""
+    result_re = re.compile(
+        r'^.*(?P<result>PASS|FAIL|SKIP|BLOCK) - (test_)?(?P<testname>.*) in (?P<duration>[\d\.]+) seconds$'
+    )
+    testsuite_re = re.compile(r'^.*Running TESTSUITE\s(?P<testsuite>.*)$')
+    results = 0
+    for line in lines:
+        logging.getLogger(__name__).debug(line.rstrip())
+        if 'PROJECT EXECUTION FAILED' in line or 'PROJECT EXECUTION SUCCESSFUL' in line or 'ZEPHYR FATAL ERROR' in line:
+            break
+        testsuite_re.match(line)
+        if result_re.match(line):
+            results += 1
+    return results
+
+
+@pytest.mark.skipif(not os.environ.get('TWISTER_BENCHMARK'), reason='benchmark is run only with TWISTER_BENCHMARK=1')
+def test_ztest_log_parser_throughput_on_multi_megabyte_log(
+        resources: Path, caplog: pytest.LogCaptureFixture, record_property
+):
+    # measure parsing only, not handlers configured by other tests
+    caplog.set_level(logging.WARNING, logger='twister2.log_parser.ztest_log_parser')
+    caplog.set_level(logging.WARNING, logger=__name__)
+    lines = _multi_megabyte_log(resources)
+    size_mb = sum(len(line) for line in lines) / 1e6
+
+    legacy_time = min(timeit.repeat(lambda: _legacy_classify(lines), number=1, repeat=3))
+    parser_time = float('inf')
+    for _ in range(3):
+        parser = ZtestLogParser(stream=iter(lines), ignore_faults=False)
+        start = time.perf_counter()
+        parser.parse()
+        parser_time = min(parser_time, time.perf_counter() - start)
+
+    assert _legacy_classify(lines) == len(parser.subtest_results)
+    # wall-clock time depends on load of machine, so throughput is only reported
+    record_property('parser_mb_per_s', f'{size_mb / parser_time:.1f}')
+    record_property('legacy_mb_per_s', f'{size_mb / legacy_time:.1f}')
+    print(f'Parsed {size_mb:.1f} MB: {size_mb / parser_time:.1f} MB/s, legacy {size_mb / legacy_time:.1f} MB/s '
+          f'({legacy_time / parser_time:.1f}x)')
+
+
 # TODO: Write test for BLOCK status for subtest
+
+
+def _silent_after(lines: list[str]):
+    """Return given lines and then empty lines, as device does when it is silent."""
+    yield from lines
+    while True:
+        time.sleep(0.01)
+        yield ''
+
+
+def test_if_ztest_log_parser_reports_hung_testcase():
+    log = [
+        'Running TESTSUITE common',
+        'START - test_bootdelay',
+        ' PASS - test_bootdelay in 0.0 seconds',
+        'START - test_irq_offload',
+        'still working...',
+    ]
+    parser = ZtestLogParser(stream=_silent_after(log), testcase_timeout=0.2)
+    parser.parse(timeout=10)
+    assert parser.state == parser.STATE.FAILED
+    assert parser.device_hung is True
+    assert parser.messages == ['Testcase irq_offload did not finish in 0.2 seconds']
+    hung_subtest = parser.subtest_results[-1]
+    assert hung_subtest.testname == 'irq_offload'
+    assert hung_subtest.result == SubTestStatus.FAIL
+    assert 'hung' in hung_subtest.message
+
+
+def test_if_ztest_log_parser_stops_when_device_is_inactive():
+    log = ['Running TESTSUITE common', 'START - test_bootdelay']
+    parser = ZtestLogParser(stream=_silent_after(log), inactivity_timeout=0.2)
+    start_time = time.time()
+    parser.parse(timeout=10)
+    assert time.time() - start_time < 5
+    assert parser.state == parser.STATE.FAILED
+    assert parser.messages == ['No output from device for 0.2 seconds']
+    assert parser.subtest_results[-1].testname == 'bootdelay'
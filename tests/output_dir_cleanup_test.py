@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import os
+import tarfile
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from twister2 import output_dir_cleanup
+from twister2.helper import find_archived_output_dirs
+from twister2.output_dir_cleanup import (
+    clean_output_dir,
+    find_archives,
+    find_trash_dirs,
+    main,
+)
+
+
+@pytest.fixture(autouse=True)
+def wait_for_background_cleanup() -> Generator[None, None, None]:
+    yield
+    _wait()
+
+
+def _make_output_dir(path: Path, mtime: float = 0) -> Path:
+    (path / 'native_posix').mkdir(parents=True)
+    (path / 'native_posix' / 'build.log').write_text('log')
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def _wait() -> None:
+    while output_dir_cleanup._processes:
+        assert output_dir_cleanup._processes.pop().wait(timeout=60) == 0
+
+
+def test_if_output_dir_is_moved_to_trash_and_deleted_in_background(tmp_path):
+    output_dir = _make_output_dir(tmp_path / 'twister-out')
+    # left by session interrupted during deletion
+    stale_trash_dir = _make_output_dir(tmp_path / '.twister-out_230101101010.trash_1')
+    other_dir = _make_output_dir(tmp_path / 'other-out')
+    # trash of another output directory with name starting the same way
+    other_trash_dir = _make_output_dir(tmp_path / '.twister-out_backup.trash_1')
+    assert find_trash_dirs(output_dir) == [stale_trash_dir]
+
+    assert clean_output_dir(output_dir, 'delete') is None
+    assert not output_dir.exists()
+    _wait()
+    assert sorted(tmp_path.iterdir()) == [other_trash_dir, other_dir]
+
+
+def test_if_output_dir_is_archived(tmp_path):
+    output_dir = _make_output_dir(tmp_path / 'twister-out', mtime=1672567810)
+    archived_dir = clean_output_dir(output_dir, 'archive')
+    assert archived_dir is not None and archived_dir.name.startswith('twister-out_2301')
+    assert (archived_dir / 'native_posix' / 'build.log').is_file()
+
+    # directory modified at the same time is archived under another name
+    _make_output_dir(output_dir, mtime=1672567810)
+    assert clean_output_dir(output_dir, 'archive') == Path(f'{archived_dir}_1')
+    Path(f'{archived_dir}_10').mkdir()
+    assert find_archives(output_dir) == [Path(f'{archived_dir}_10'), Path(f'{archived_dir}_1'), archived_dir]
+
+
+def test_if_other_directories_are_not_taken_for_archives(tmp_path):
+    output_dir = tmp_path / 'twister-out'
+    for name in ['twister-out_230101101010', 'twister-out_backup', 'twister-out_2301011010', 'twister-out_x_1']:
+        (tmp_path / name).mkdir()
+    (tmp_path / 'twister-out_230201101010.tar.gz').write_bytes(b'')
+    (tmp_path / 'twister-out_230301101010.zip').write_bytes(b'')
+    assert find_archives(output_dir) == [
+        tmp_path / 'twister-out_230201101010.tar.gz', tmp_path / 'twister-out_230101101010'
+    ]
+    assert find_archived_output_dirs(output_dir) == [tmp_path / 'twister-out_230101101010']
+
+
+def test_if_old_archives_are_removed_and_compressed(tmp_path):
+    output_dir = tmp_path / 'twister-out'
+    for name in ['twister-out_221001101010', 'twister-out_221101101010']:
+        _make_output_dir(tmp_path / name)
+    (tmp_path / 'twister-out_220901101010.tar.gz').write_bytes(b'')
+    backup_dir = _make_output_dir(tmp_path / 'twister-out_backup')
+    _make_output_dir(output_dir, mtime=1672567810)
+
+    archived_dir = clean_output_dir(output_dir, 'archive', keep_archives=2, compress_archives=True)
+    _wait()
+    assert find_archives(output_dir) == [archived_dir, tmp_path / 'twister-out_221101101010.tar.gz']
+    assert backup_dir.is_dir()
+    assert archived_dir.is_dir()
+    with tarfile.open(tmp_path / 'twister-out_221101101010.tar.gz') as tar:
+        assert 'twister-out_221101101010/native_posix/build.log' in tar.getnames()
+    assert not find_trash_dirs(output_dir)
+
+
+def test_if_cleanup_continues_after_error(tmp_path):
+    directory = _make_output_dir(tmp_path / 'twister-out_221001101010')
+    assert main([f'--compress={tmp_path / "not_existing"}', f'--delete={directory}']) == 0
+    assert not directory.exists()
+
+
+def test_if_plugin_deletes_previous_artifacts(pytester, resources):
+    pytester.copy_example(str(resources))
+    output_dir = _make_output_dir(pytester.path / 'twister-out')
+    result = pytester.runpytest(
+        f'--zephyr-base={str(pytester.path)}',
+        '--clear=delete',
+        '-k', 'not_existing_test',
+    )
+    result.stdout.fnmatch_lines(['Deleting previous artifacts from *'])
+    assert not (output_dir / 'native_posix').exists()
+    _wait()
+    assert not find_trash_dirs(output_dir)
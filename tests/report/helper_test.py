@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from twister2.report import helper
+from twister2.report.helper import get_item_metadata
+
+
+def test_if_item_metadata_is_computed_once(pytester, monkeypatch):
+    item = pytester.getitem('def test_func(): pass')
+    calls: list[str] = []
+
+    def get_suite_name(item):
+        calls.append(item.nodeid)
+        return 'suite'
+
+    monkeypatch.setattr(helper, 'get_suite_name', get_suite_name)
+
+    # specifications are not added to session yet
+    get_item_metadata(item)
+    assert calls == [item.nodeid]
+    item.session.specifications = {}
+
+    metadata = get_item_metadata(item)
+    assert get_item_metadata(item) is metadata
+    assert calls == [item.nodeid] * 2
+    assert metadata.asdict() == dict(
+        name='suite',
+        arch='',
+        platform='',
+        run_id='',
+        runnable=True,
+        retries=0,
+        test_name='test_func',
+        nodeid=item.nodeid,
+        type='',
+        build_only=False,
+    )
+
+
+def test_if_item_metadata_is_taken_from_specification_of_item(pytester):
+    item = pytester.getitem('def test_func(): pass')
+    item.function.spec = SimpleNamespace(run_id='abc', runnable=False, retries=2)
+    assert not hasattr(item.session, 'specifications')
+    metadata = get_item_metadata(item)
+    assert (metadata.run_id, metadata.runnable, metadata.retries) == ('abc', False, 2)
@@ -124,3 +124,51 @@ def test_if_pytest_generates_json_results_with_expected_data(pytester, extra_arg
         'pc_name',
         'duration'
     }
+
+
+@pytest.mark.parametrize('extra_args', ['-n 0', '-n 2'], ids=['no_xdist', 'xdist'])
+def test_if_pytest_saves_subtests_reported_in_batch(pytester, extra_args) -> None:
+    test_file_content = textwrap.dedent("""\
+        import types
+
+        import pytest
+
+        from twister2.log_parser.ztest_log_parser import SubTestResult
+
+        @pytest.fixture
+        def log_parser():
+            return types.SimpleNamespace(subtest_results=[
+                SubTestResult('first', 'PASS', 0.01),
+                SubTestResult('second', 'FAIL', 0.02, message='Subtest second hung: no output'),
+                SubTestResult('third', 'BLOCK', 0.0),
+            ])
+
+        def test_ztest(log_parser):
+            pass
+    """)
+    (pytester.path / 'foobar_test.py').write_text(test_file_content)
+    output_result: Path = pytester.path / 'twister.json'
+
+    result = pytester.runpytest(
+        '--twister',
+        f'--zephyr-base={str(pytester.path)}',
+        f'--results-json={output_result}',
+        '--subtest-reporting=batch',
+        extra_args
+    )
+
+    # failed testcase fails the test, so console, exit code and report agree
+    result.assert_outcomes(failed=1)
+    assert result.ret == pytest.ExitCode.TESTS_FAILED
+    result.stdout.fnmatch_lines(['*Failed ztest testcases: second*', '*Subtest second hung: no output*'])
+    with output_result.open() as file:
+        report_data = json.load(file)
+    assert report_data['testsuites'][0]['status'] == 'failed'
+    assert report_data['testsuites'][0]['testcases'] == [
+        {'identifier': 'first', 'execution_time': '0.01', 'status': 'passed'},
+        {'identifier': 'second', 'execution_time': '0.02', 'status': 'failed',
+         'message': 'Subtest second hung: no output'},
+        {'identifier': 'third', 'execution_time': '0.00', 'status': 'skipped'},
+    ]
+    assert report_data['summary']['subtests_total'] == 3
+    assert report_data['summary']['subtests_failed'] == 1
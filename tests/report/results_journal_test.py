@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+import sys
+
+from twister2.report.results_journal import (
+    ResultsJournal,
+    build_report,
+    get_journal_path,
+)
+from twister2.scripts.__main__ import main
+
+
+def _testsuite(nodeid: str, status: str, testcases: list | None = None) -> dict:
+    return dict(nodeid=nodeid, name=nodeid, status=status, duration='1.00', testcases=testcases or [])
+
+
+def test_if_report_is_built_from_journal(tmp_path):
+    journal = ResultsJournal(get_journal_path(tmp_path / 'twister.json'))
+    assert journal.filename.name == 'twister.jsonl'
+    journal.open(configuration=dict(build_only=False), environment=dict(os='posix'))
+    journal.add_test(_testsuite('a.yaml::a', 'passed', [dict(identifier='first', status='passed')]))
+    journal.add_test(_testsuite('b.yaml::b', 'failed', [dict(identifier='second', status='failed')]))
+    journal.close()
+
+    data = build_report(journal.filename)
+    assert data['configuration'] == dict(build_only=False)
+    assert data['environment']['os'] == 'posix'
+    assert 'duration' in data['environment']
+    assert [testsuite['nodeid'] for testsuite in data['testsuites']] == ['a.yaml::a', 'b.yaml::b']
+    assert data['summary']['passed'] == 1
+    assert data['summary']['failed'] == 1
+    assert data['summary']['total'] == 2
+    assert data['summary']['subtests_total'] == 2
+    assert data['summary']['subtests_failed'] == 1
+
+
+def test_if_report_is_built_from_journal_of_killed_session(tmp_path):
+    journal = ResultsJournal(tmp_path / 'twister.jsonl')
+    journal.open(configuration={}, environment={})
+    journal.add_test(_testsuite('a.yaml::a', 'passed'))
+    # session killed while writing record and journal not closed
+    with journal.filename.open('a') as file:
+        file.write('{"record": "test", "testsu')
+
+    data = build_report(journal.filename)
+    assert [testsuite['nodeid'] for testsuite in data['testsuites']] == ['a.yaml::a']
+
+
+def test_if_rerun_test_is_reported_once_with_the_most_important_status(tmp_path):
+    journal = ResultsJournal(tmp_path / 'twister.jsonl')
+    journal.open(configuration={}, environment={})
+    journal.add_test(_testsuite('a.yaml::a', 'failed'))
+    journal.add_test(_testsuite('a.yaml::a', 'passed'))
+    journal.close()
+
+    data = build_report(journal.filename)
+    assert len(data['testsuites']) == 1
+    assert data['testsuites'][0]['status'] == 'failed'
+
+
+def test_if_twister_tools_converts_journal_to_results_report(tmp_path, monkeypatch):
+    journal = ResultsJournal(tmp_path / 'twister.jsonl')
+    journal.open(configuration={}, environment={})
+    journal.add_test(_testsuite('a.yaml::a', 'passed'))
+    monkeypatch.setattr(sys, 'argv', ['twister_tools', '--journal-to-json', str(journal.filename)])
+
+    assert main() == 0
+    with open(tmp_path / 'twister.json') as file:
+        assert json.load(file)['summary']['passed'] == 1
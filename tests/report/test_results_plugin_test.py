@@ -0,0 +1,28 @@
+import json
+
+from twister2.report import test_results_plugin
+
+
+def test_if_results_of_tests_run_again_replace_loaded_results_on_the_same_platform(tmp_path):
+    loaded_report = tmp_path / 'twister.json'
+    loaded_report.write_text(json.dumps(dict(
+        environment=dict(os='posix'),
+        testsuites=[
+            dict(name='sample.test', platform='native_posix', status='passed'),
+            dict(name='sample.test', platform='qemu_x86', status='failed'),
+            dict(name='other.test', platform='qemu_x86', status='failed'),
+        ],
+        summary=dict(total=3),
+    )))
+    data = dict(testsuites=[
+        dict(name='sample.test', platform='qemu_x86', status='passed'),
+        dict(name='other.test', platform='qemu_x86', status='failed'),
+    ])
+
+    data = test_results_plugin.TestResultsPlugin._merge_with_load_tests_data(data, str(loaded_report))
+
+    assert data['testsuites'] == [
+        dict(name='sample.test', platform='native_posix', status='passed'),
+        dict(name='sample.test', platform='qemu_x86', status='passed'),
+        dict(name='other.test', platform='qemu_x86', status='failed'),
+    ]
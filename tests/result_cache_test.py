@@ -0,0 +1,103 @@
+import json
+import os
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from twister2.fixtures import dut
+from twister2.result_cache import ENTRY_FILE_NAME, ResultCache, compute_cache_key
+from twister2.twister_config import TwisterConfig
+from twister2.yaml_test_specification import YamlTestSpecification
+
+PASSED_OUTPUT = textwrap.dedent("""\
+    Running TESTSUITE common
+    START - test_bootdelay
+     PASS - test_bootdelay in 0.0 seconds
+    PROJECT EXECUTION SUCCESSFUL
+""")
+
+
+@pytest.fixture
+def result_cache(tmp_path) -> ResultCache:
+    return ResultCache(tmp_path / 'cache', expiry=1)
+
+
+def test_if_output_of_test_is_saved_in_cache(result_cache, tmp_path):
+    log_file = tmp_path / 'handler.log'
+    log_file.write_text('output of previous test\n' + PASSED_OUTPUT)
+    assert result_cache.get('key') is None
+
+    result_cache.put('key', 'test.yaml::test', log_file, offset=len('output of previous test\n'))
+
+    entry = result_cache.get('key')
+    assert entry is not None
+    assert entry.nodeid == 'test.yaml::test'
+    assert entry.log_file.read_text() == PASSED_OUTPUT
+
+
+def test_if_expired_results_are_not_used_and_removed(result_cache, tmp_path):
+    log_file = tmp_path / 'handler.log'
+    log_file.write_text(PASSED_OUTPUT)
+    result_cache.put('old', 'test.yaml::old', log_file)
+    result_cache.put('new', 'test.yaml::new', log_file)
+    entry_file = result_cache.cache_dir / 'old' / ENTRY_FILE_NAME
+    entry_file.write_text(json.dumps(dict(nodeid='test.yaml::old', created=time.time() - 2 * 24 * 3600)))
+
+    assert result_cache.get('old') is None
+    assert result_cache.remove_expired() == 1
+    assert not (result_cache.cache_dir / 'old').exists()
+    assert result_cache.get('new') is not None
+
+
+def test_if_cache_key_depends_on_image_and_harness(tmp_path):
+    twister_config = TwisterConfig(zephyr_base=str(tmp_path))
+    spec = YamlTestSpecification(name='test', original_name='test', rel_to_base_path=Path('tests'),
+                                 platform='qemu_x86', output_dir=tmp_path, source_dir=tmp_path)
+    assert compute_cache_key(twister_config, spec, 'qemu') == ''
+
+    image_file = spec.build_dir / 'zephyr' / 'zephyr.elf'
+    image_file.parent.mkdir(parents=True)
+    image_file.write_bytes(b'image')
+    key = compute_cache_key(twister_config, spec, 'qemu')
+    assert key and key == compute_cache_key(twister_config, spec, 'qemu')
+    assert key != compute_cache_key(twister_config, spec, 'hardware')
+    spec.harness_config = dict(type='one_line')
+    assert key != compute_cache_key(twister_config, spec, 'qemu')
+    spec.harness_config = {}
+    image_file.write_bytes(b'changed image')
+    assert key != compute_cache_key(twister_config, spec, 'qemu')
+
+
+def test_if_passed_test_is_reported_from_cache_without_running(pytester, copy_example, monkeypatch):
+    output_dir: Path = pytester.path / 'twister-out'
+    build_dir: Path = output_dir / 'native_posix' / 'tests' / 'common' / 'xyz.common_merge_1'
+    (build_dir / 'zephyr').mkdir(parents=True)
+    (build_dir / 'zephyr' / 'zephyr.elf').write_bytes(b'image')
+    # application is already built, and it cannot be run (zephyr.exe does not exist)
+    with open(output_dir / 'twister_builder.json', 'w') as file:
+        json.dump({os.path.realpath(build_dir): 'DONE'}, file)
+    log_file = pytester.path / 'handler.log'
+    log_file.write_text(PASSED_OUTPUT)
+    cache_dir = pytester.path / 'cache'
+    ResultCache(cache_dir).put('key', 'previous::test', log_file)
+    # module is imported when test file is collected, so it is not dropped after sessions run by pytester
+    monkeypatch.setattr(dut, 'compute_cache_key', lambda *args: 'key')
+
+    result = pytester.runpytest(
+        f'--zephyr-base={str(pytester.path)}',
+        f'--load-tests={Path(__file__).parent / "load_tests" / "data" / "testplan_v1.json"}',
+        '--clear=no',
+        '-k', 'common_merge_1',
+        '--result-cache',
+        f'--result-cache-dir={cache_dir}',
+    )
+
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(['1 tests passed from cache * without running', '*1 subtests passed*'])
+    with open(output_dir / 'twister.json') as file:
+        testsuite = json.load(file)['testsuites'][0]
+    assert testsuite['cached'] is True
+    assert [testcase['identifier'] for testcase in testsuite['testcases']] == ['bootdelay']
+    assert (build_dir / 'handler.log').read_text() == PASSED_OUTPUT
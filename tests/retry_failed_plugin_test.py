@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+import textwrap
+
+import pytest
+
+
+@pytest.mark.parametrize('extra_args', [[], ['-n', '2']], ids=['no_xdist', 'xdist'])
+def test_if_failed_tests_are_run_again_and_classified(pytester, extra_args):
+    pytester.makepyfile(test_retry=textwrap.dedent("""\
+        from pathlib import Path
+
+        def _attempt(name):
+            counter = Path(f'{name}.count')
+            attempt = int(counter.read_text()) + 1 if counter.exists() else 1
+            counter.write_text(str(attempt))
+            return attempt
+
+        def test_passing():
+            pass
+
+        def test_flaky():
+            assert _attempt('flaky') > 1
+
+        def test_broken():
+            assert _attempt('broken') < 0
+    """))
+
+    result = pytester.runpytest('--twister', f'--zephyr-base={pytester.path}', '--retry-failed=2', *extra_args)
+
+    outcomes = result.parseoutcomes()
+    assert (outcomes['passed'], outcomes['failed'], outcomes['rerun']) == (2, 1, 3)
+    assert (pytester.path / 'broken.count').read_text() == '3'
+    with open(pytester.path / 'twister-out' / 'twister.json') as file:
+        data = json.load(file)
+    testsuites = {testsuite['nodeid'].split('::')[-1]: testsuite for testsuite in data['testsuites']}
+    assert testsuites['test_passing']['status'] == 'passed'
+    assert 'failure_type' not in testsuites['test_passing']
+    assert testsuites['test_flaky']['status'] == 'passed'
+    assert testsuites['test_flaky']['failure_type'] == 'flaky'
+    assert testsuites['test_flaky']['attempts'] == 2
+    assert testsuites['test_broken']['status'] == 'failed'
+    assert testsuites['test_broken']['failure_type'] == 'hard'
+    assert testsuites['test_broken']['attempts'] == 3
@@ -0,0 +1,116 @@
+import os
+import shutil
+import socket
+import threading
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from twister2.exceptions import TwisterException
+from twister2.server import TwisterServer, TwisterServerClient
+
+DATA_DIR: Path = Path(__file__).parent / 'data'
+
+
+@pytest.fixture
+def server(tmp_path) -> Generator[TwisterServer, None, None]:
+    server = TwisterServer(tmp_path / 'server.sock')
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server) -> Generator[TwisterServerClient, None, None]:
+    client = TwisterServerClient.connect(server.socket_path)
+    assert client is not None
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def zephyr_base(tmp_path) -> str:
+    shutil.copytree(DATA_DIR / 'boards', tmp_path / 'zephyr' / 'boards')
+    return str(tmp_path / 'zephyr')
+
+
+def _touch(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_if_client_is_not_created_when_server_is_not_running(tmp_path):
+    assert TwisterServerClient.connect(tmp_path / 'server.sock') is None
+
+
+def test_if_server_cannot_be_started_twice(server):
+    with pytest.raises(TwisterException, match='already running'):
+        TwisterServer(server.socket_path)
+
+
+def test_if_platforms_are_reloaded_only_when_modified(server, client, zephyr_base):
+    platforms = client.search_platforms(zephyr_base)
+    assert 'native_posix' in [p.identifier for p in platforms]
+    assert client.search_platforms(zephyr_base) == platforms
+    assert client.call('status')['hits'] == 1
+
+    board_file = Path(zephyr_base) / 'boards' / 'posix' / 'native_posix' / 'native_posix.yaml'
+    board_file.write_text(board_file.read_text().replace('Native 32-bit POSIX port', 'Changed name'))
+    _touch(board_file)
+    new_board_dir = Path(zephyr_base) / 'boards' / 'posix' / 'new_board'
+    new_board_dir.mkdir()
+    (new_board_dir / 'new_board.yaml').write_text('identifier: new_board\n')
+    _touch(new_board_dir.parent)
+
+    platforms = {p.identifier: p for p in client.search_platforms(zephyr_base)}
+    assert platforms['native_posix'].name == 'Changed name'
+    assert 'new_board' in platforms
+
+
+def test_if_yaml_errors_are_raised_in_client(client, tmp_path):
+    yaml_file = tmp_path / 'testcase.yaml'
+    yaml_file.write_text('tests:\n  sample.test:\n    tags: test\n')
+    assert client.load_yaml(yaml_file) == {'tests': {'sample.test': {'tags': 'test'}}}
+
+    yaml_file.write_text('tests: [\n')
+    _touch(yaml_file)
+    with pytest.raises(TwisterException, match='Cannot load data from yaml file'):
+        client.load_yaml(yaml_file)
+
+
+def test_if_toolchain_is_detected_again_only_for_other_environment(
+    client, zephyr_base, mock_get_toolchain_version, monkeypatch
+):
+    monkeypatch.setenv('ZEPHYR_TOOLCHAIN_VARIANT', 'zephyr')
+    assert client.get_toolchain_version(zephyr_base) == 'zephyr'
+    monkeypatch.setenv('UNRELATED_VARIABLE', '1')
+    assert client.get_toolchain_version(zephyr_base) == 'zephyr'
+    assert mock_get_toolchain_version.call_count == 1
+    monkeypatch.setenv('ZEPHYR_TOOLCHAIN_VARIANT', 'llvm')
+    client.get_toolchain_version(zephyr_base)
+    assert mock_get_toolchain_version.call_count == 2
+
+
+def test_if_data_is_read_without_server_when_server_stops(zephyr_base):
+    client_socket, server_socket = socket.socketpair()
+    server_socket.close()
+    client = TwisterServerClient(client_socket)
+    assert 'native_posix' in [p.identifier for p in client.search_platforms(zephyr_base)]
+    assert not client.connected
+
+
+def test_if_plugin_uses_server(pytester, resources, server):
+    pytester.copy_example(str(resources))
+    for _ in range(2):
+        result = pytester.runpytest(
+            f'--zephyr-base={str(pytester.path)}',
+            f'--server-socket={server.socket_path}',
+            '--co',
+        )
+        result.stdout.re_match_lines_random([r'.*sample.basic.helloworld\[native_posix\].*'])
+    status = server.status()
+    assert status['hits'] > 0
+    assert status['misses'] == status['entries']
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+import re
+
+from twister2.test_order_plugin import find_previous_results
+
+
+def test_if_previous_results_are_found_in_output_directory(tmp_path):
+    output_dir = tmp_path / 'twister-out'
+    output_dir.mkdir()
+    (output_dir / 'twister.json').write_text('{}')
+    assert find_previous_results(output_dir) == output_dir / 'twister.json'
+
+
+def test_if_previous_results_are_found_in_the_latest_archived_directory(tmp_path):
+    for name in ['twister-out_221001101010', 'twister-out_230101101010', 'twister-out_230201101010']:
+        (tmp_path / name).mkdir()
+    (tmp_path / 'twister-out_221001101010' / 'twister.json').write_text('{}')
+    (tmp_path / 'twister-out_230101101010' / 'twister.json').write_text('{}')
+    # not archived output directory, although its name is ordered after dates
+    (tmp_path / 'twister-out_backup').mkdir()
+    (tmp_path / 'twister-out_backup' / 'twister.json').write_text('{}')
+    assert find_previous_results(tmp_path / 'twister-out') == tmp_path / 'twister-out_230101101010' / 'twister.json'
+    assert find_previous_results(tmp_path / 'other-out') is None
+
+
+def _collect(pytester, *args) -> list[str]:
+    result = pytester.runpytest(
+        f'--zephyr-base={str(pytester.path)}', '--platform=native_posix', '--platform=qemu_cortex_m3', '--co', '-q',
+        *args
+    )
+    return [line for line in result.stdout.lines if re.match(r'.*\.yaml::', line)]
+
+
+def test_if_the_longest_tests_are_collected_first(pytester, copy_example):
+    collected = _collect(pytester)
+    assert len(collected) > 2
+    with open(pytester.path / 'twister-out' / 'testplan.json') as file:
+        testsuites = json.load(file)['testsuites']
+    # the last collected test was the longest one in archived results of previous run
+    durations = {testsuite['nodeid']: 1.0 for testsuite in testsuites}
+    durations[collected[-1]] = 100.0
+    durations[collected[-2]] = 50.0
+    archived_dir = pytester.path / 'twister-out_230101101010'
+    archived_dir.mkdir()
+    (archived_dir / 'twister.json').write_text(json.dumps(dict(testsuites=[
+        dict(testsuite, duration=f'{durations[testsuite["nodeid"]]:.2f}') for testsuite in testsuites
+    ])))
+
+    ordered = _collect(pytester, '--order-by-duration')
+
+    assert sorted(ordered) == sorted(collected)
+    assert ordered[:2] == [collected[-1], collected[-2]]
@@ -0,0 +1,36 @@
+import json
+import textwrap
+from pathlib import Path
+
+import pytest
+
+
+@pytest.mark.parametrize('extra_args', ['-n 0', '-n 2'], ids=['no_xdist', 'xdist'])
+def test_if_saved_device_output_is_replayed(pytester, copy_example, extra_args):
+    output_dir: Path = pytester.path / 'twister-out'
+    build_dir: Path = output_dir / 'native_posix' / 'tests' / 'common' / 'xyz.common_merge_1'
+    build_dir.mkdir(parents=True)
+    (build_dir / 'handler.log').write_text(textwrap.dedent("""\
+        Running TESTSUITE common
+        START - test_bootdelay
+         PASS - test_bootdelay in 0.0 seconds
+        START - test_irq_offload
+         FAIL - test_irq_offload in 0.1 seconds
+        PROJECT EXECUTION FAILED
+    """))
+
+    result = pytester.runpytest(
+        f'--zephyr-base={str(pytester.path)}',
+        f'--load-tests={Path(__file__).parent / "load_tests" / "data" / "testplan_v1.json"}',
+        '--replay-logs',
+        extra_args
+    )
+
+    # hello world has no saved output, so it is skipped
+    # failed test and its failed subtest
+    result.assert_outcomes(failed=2, skipped=1)
+    with open(output_dir / 'twister.json') as file:
+        json_report = json.load(file)
+    testsuites = {testsuite['name']: testsuite for testsuite in json_report['testsuites']}
+    assert testsuites['tests/common/xyz.common_merge_1']['status'] == 'failed'
+    assert (build_dir / 'handler.log').read_text().count('\n') == 6
@@ -249,6 +249,18 @@ def test_if_pytest_skip_twister_regular_tests_if_not_enabled(pytester, resources
         (
             '--west-runner=jlink',
             ['*must be used with `--device-testing`*']
+        ),
+        (
+            '--shard-count=2 --shard-index=2',
+            ['Exit: Option `--shard-index` must be from 0 to `--shard-count` - 1.*']
+        ),
+        (
+            '--retry-failed=1 -M all',
+            ['Exit: Option `--retry-failed` cannot be used with `--runtime-artifact-cleanup=all`*']
+        ),
+        (
+            '--keep-archives=-1',
+            ['Exit: Option `--keep-archives` must not be negative*']
         )
     ],
     ids=[
@@ -259,7 +271,10 @@ def test_if_pytest_skip_twister_regular_tests_if_not_enabled(pytester, resources
         'device_serial_without_platform',
         'combined_with_device_serial',
         'west_flash',
-        'west_runner'
+        'west_runner',
+        'shard_index_out_of_range',
+        'retry_failed_with_cleanup_all',
+        'negative_keep_archives',
     ]
 )
 def test_if_invalid_parameters_raises_error(pytester, resources, extend_command, expected):
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+import textwrap
+
+
+def test_if_tests_sharing_build_directory_are_run_on_one_worker(pytester):
+    pytester.makeconftest(textwrap.dedent("""\
+        import types
+
+        import pytest
+
+        @pytest.hookimpl(tryfirst=True)
+        def pytest_collection_modifyitems(session, config, items):
+            session.specifications = {
+                item.nodeid: types.SimpleNamespace(
+                    build_dir=item.callspec.params['build'], run_id='', retries=0, runnable=True
+                )
+                for item in items if item.callspec.params['build']
+            }
+    """))
+    pytester.makepyfile(test_builds=textwrap.dedent("""\
+        import json
+        import os
+
+        import pytest
+
+        @pytest.mark.parametrize('number', range(4))
+        @pytest.mark.parametrize('build', ['build_a', 'build_b', ''])
+        def test_build(build, number, request):
+            with open(f'{request.node.name}.json', 'w') as file:
+                json.dump(dict(build=build, worker=os.environ['PYTEST_XDIST_WORKER']), file)
+    """))
+
+    result = pytester.runpytest('--twister', f'--zephyr-base={pytester.path}', '-n', '3')
+
+    result.assert_outcomes(passed=12)
+    workers: dict[str, set[str]] = {}
+    for filename in pytester.path.glob('test_build*.json'):
+        with filename.open() as file:
+            data = json.load(file)
+        workers.setdefault(data['build'], set()).add(data['worker'])
+    assert len(workers['build_a']) == 1
+    assert len(workers['build_b']) == 1